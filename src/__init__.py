@@ -1,4 +1,3 @@
-```python
 # src/__init__.py
 """
 NeuroCortex - Self-Evolving AI Framework
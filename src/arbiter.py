@@ -3,74 +3,549 @@
 Arbiter module for validating and selecting the most effective solutions.
 """
 
+import math
+import threading
 import numpy as np
-from typing import List, Dict
+from statistics import NormalDist
+from typing import List, Dict, Optional
+from .bulk import (
+    COMPLEXITY_FACTORS, candidates_to_array, score_candidates, top_k_indices, within_budgets
+)
+from .cache import fingerprint_dataset, solution_key
+from .candidates import holdout_split, stratified_folds
+from .data import open_array
+from .executor import CandidateExecutor, cross_validate_fold, shared_arrays, train_and_score_shared
+from .history import DEFAULT_HISTORY_SIZE, HistoryStore
+from .pareto import ParetoFront
+from .progressive import DEFAULT_GROWTH, DEFAULT_MIN_ROWS, decides, sample_schedule, stratified_order
+from .shared import SharedDataset
+from .surrogate import SurrogateModel, measured_score
+
+def _summarize_validation(result):
+    """Numeric fields kept for validation rounds evicted from the history."""
+    validated = result["validated_solutions"]
+    return {
+        "candidates": result.get("candidates_scored", len(validated)),
+        "valid_candidates": sum(1 for s in validated if s["is_valid"]),
+        "selected_score": (result["selected_solution"] or {}).get("validation_score")
+    }
+
+def _summarize_selection(solution):
+    """Numeric fields kept for selections evicted from the history."""
+    return {"validation_score": solution["validation_score"]}
+
+def _rung_score(outcome):
+    """Racing rank of a rung outcome; failed candidates sort last."""
+    return outcome["result"]["accuracy"] if outcome["status"] == "ok" else -1.0
+
+CV_METRICS = ("accuracy", "precision", "recall", "f1_score", "latency_p99", "model_size_bytes")
+# Reported by train_and_score for compiled candidates only
+COMPILE_METRICS = ("compile_speedup", "compile_throughput_speedup", "compile_accuracy_delta")
+
+def _t_critical(confidence: float, df: int) -> float:
+    """
+    Two-sided Student-t critical value, exact to float precision.
+    
+    A Cornish-Fisher expansion gives the starting point (it alone is off
+    by up to 55% for ``df = 1``), refined by Newton steps on the exact
+    integer-``df`` CDF series (Abramowitz & Stegun 26.7.3-4); avoids a SciPy
+    dependency.
+    """
+    if df < 1:
+        raise ValueError("df must be at least 1")
+    if df == 1:
+        return math.tan(math.pi * confidence / 2)  # Cauchy
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    t = (z
+         + (z ** 3 + z) / (4 * df)
+         + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+         + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+    log_norm = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+    for _ in range(50):
+        density = math.exp(log_norm - (df + 1) / 2 * math.log1p(t * t / df))
+        step = (confidence - _t_central_mass(t, df)) / (2 * density)
+        t += step
+        if abs(step) <= 1e-12 * t:
+            break
+    return t
+
+def _t_central_mass(t: float, df: int) -> float:
+    """P(-t < T < t) for Student's t with integer ``df >= 2``."""
+    theta = math.atan(t / math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    term, total = 1.0, 1.0
+    if df % 2 == 0:
+        for j in range(1, df // 2):
+            term *= cos2 * (2 * j - 1) / (2 * j)
+            total += term
+        return math.sin(theta) * total
+    for j in range(1, (df - 1) // 2):
+        term *= cos2 * (2 * j) / (2 * j + 1)
+        total += term
+    return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
 
 class Arbiter:
     """Validation unit for selecting optimal solutions."""
     
-    def __init__(self, validation_threshold: float = 0.8):
+    def __init__(self, validation_threshold: float = 0.8,
+                 history_size: Optional[int] = DEFAULT_HISTORY_SIZE,
+                 executor: Optional[CandidateExecutor] = None,
+                 cv_folds: int = 5, confidence_level: float = 0.95,
+                 random_state: int = 0,
+                 latency_budget: Optional[float] = None,
+                 size_budget: Optional[float] = None,
+                 progressive_fraction: Optional[float] = None,
+                 progressive_growth: float = DEFAULT_GROWTH,
+                 progressive_min_rows: int = DEFAULT_MIN_ROWS):
         self.validation_threshold = validation_threshold
-        self.validation_history = []
-        self.selected_solutions = []
+        self.executor = executor
+        self.cv_folds = cv_folds
+        self.confidence_level = confidence_level
+        self.random_state = random_state
+        # Selection constraints (seconds of p99 latency, bytes of model size)
+        self.latency_budget = latency_budget
+        self.size_budget = size_budget
+        # Cross-validate on growing stratified subsamples until each
+        # candidate's accuracy interval clears or misses the threshold
+        self.progressive_fraction = progressive_fraction
+        self.progressive_growth = progressive_growth
+        self.progressive_min_rows = progressive_min_rows
+        # Every measured candidate validated on the current data, kept as a
+        # non-dominated set; a new dataset fingerprint starts a fresh front
+        self.pareto_front = ParetoFront()
+        self.front_fingerprint = None
+        # Predicts scores before anything is trained; learns incrementally
+        # from each validation round, including rounds later evicted
+        self.surrogate = SurrogateModel()
+        self._surrogate_seen = 0
+        self.validation_history = HistoryStore(history_size, summarize=_summarize_validation)
+        # Holds references to the selected dicts inside validation_history
+        self.selected_solutions = HistoryStore(history_size, summarize=_summarize_selection)
+        # Pipelined cycles prescreen one cycle while validating another, on
+        # different threads; guards the histories, front and surrogate
+        self._lock = threading.RLock()
     
     def validate_solutions(self, solutions: List[Dict], 
-                          current_performance: Dict) -> Dict:
+                          current_performance: Dict,
+                          data=None, labels=None,
+                          fingerprint: Optional[str] = None) -> Dict:
         """
         Validate proposed solutions and select the best one.
         
         Args:
             solutions: List of proposed solutions from Generator
             current_performance: Current model performance metrics
+            data: Optional feature matrix; when given, executable candidates
+                are cross-validated and accepted on their confidence interval
+            labels: Target labels for ``data``
+            fingerprint: ``fingerprint_dataset(data, labels)``, if the caller
+                already has it; otherwise the data is hashed here, once
             
         Returns:
             Selected solution with validation results
         """
-        validated_solutions = []
+        if data is not None and labels is not None:
+            if fingerprint is None:
+                fingerprint = fingerprint_dataset(open_array(data), open_array(labels))
+            self.cross_validate(solutions, data, labels, fingerprint=fingerprint)
+        else:
+            fingerprint = None
         
-        for solution in solutions:
-            validation_result = self._validate_solution(solution, current_performance)
-            validated_solutions.append(validation_result)
+        validated_solutions = [
+            self._validate_solution(solution, current_performance) for solution in solutions
+        ]
+        round_front = ParetoFront()
         
-        # Select best solution
-        best_solution = self._select_best_solution(validated_solutions)
+        with self._lock:
+            if fingerprint is not None:
+                self._scope_front(fingerprint)
+            for validation_result in validated_solutions:
+                objectives = self._objectives(validation_result)
+                if objectives is not None:
+                    self.pareto_front.insert(*objectives, validation_result)
+                    if validation_result["is_valid"]:
+                        round_front.insert(*objectives, validation_result)
+            
+            # Select best solution
+            best_solution = self._select_best_solution(validated_solutions, round_front)
+            
+            result = {
+                "timestamp": self._get_current_timestamp(),
+                "validated_solutions": validated_solutions,
+                "selected_solution": best_solution,
+                "selection_fallback": best_solution is not None and not best_solution["is_valid"],
+                "validation_threshold": self.validation_threshold,
+                "current_performance": current_performance
+            }
+            
+            self.validation_history.append(result)
+            if best_solution is not None:
+                self.selected_solutions.append(best_solution)
+        
+        return result
+    
+    def validate_bulk(self, solutions: List[Dict], current_performance: Dict,
+                      top_k: int = 1) -> Dict:
+        """
+        Score a large candidate set in one vectorized pass and keep the top k.
+        
+        Candidate attributes are packed into a NumPy structured array, scored
+        with the same rules as ``validate_solutions`` and ranked with
+        ``argpartition``; only the winners are turned back into dicts.
+        Candidates measured over the latency/size budgets are never kept.
+        
+        Args:
+            solutions: Proposals (optionally with evaluations attached)
+            current_performance: Current model performance metrics
+            top_k: Number of best candidates to return
+            
+        Returns:
+            dict: The top candidates, the selected one and candidate counts
+        """
+        candidates = candidates_to_array(solutions)
+        scores, is_valid = score_candidates(candidates, current_performance,
+                                            self.validation_threshold)
+        eligible = within_budgets(candidates, self.latency_budget, self.size_budget)
+        winners = [
+            {
+                **solutions[i],
+                "validation_score": float(scores[i]),
+                "is_valid": bool(is_valid[i]),
+                "expected_impact": self._estimate_impact(solutions[i], current_performance)
+            }
+            for i in top_k_indices(scores, is_valid, top_k, eligible)
+        ]
+        best_solution = winners[0] if winners else None
         
         result = {
             "timestamp": self._get_current_timestamp(),
-            "validated_solutions": validated_solutions,
+            "validated_solutions": winners,
             "selected_solution": best_solution,
-            "validation_threshold": self.validation_threshold
+            "selection_fallback": best_solution is not None and not best_solution["is_valid"],
+            "validation_threshold": self.validation_threshold,
+            "current_performance": current_performance,
+            "candidates_scored": len(solutions),
+            "valid_candidates": int(is_valid.sum()),
+            "over_budget": int((~eligible).sum())
         }
         
-        self.validation_history.append(result)
-        self.selected_solutions.append(best_solution)
+        with self._lock:
+            self.validation_history.append(result)
+            if best_solution is not None:
+                self.selected_solutions.append(best_solution)
         
         return result
     
+    def race_solutions(self, solutions: List[Dict], data, labels, eta: int = 3,
+                       min_rows: int = 100, validation_fraction: float = 0.25,
+                       random_state: int = 0, fingerprint: Optional[str] = None) -> Dict:
+        """
+        Evaluate candidates by successive halving instead of full training.
+        
+        Every candidate is first trained on a small random subset of the
+        training split; only the best ``1/eta`` advance to the next rung,
+        which trains on ``eta`` times more rows, until the survivors are
+        trained on the full split. Losers get an ``"eliminated"`` evaluation
+        (scored 0 by ``validate_solutions``); survivors get a normal one.
+        With an ``executor.cache`` every rung outcome is cached, so a
+        candidate raced before on the same data skips the rungs it ran.
+        
+        Args:
+            solutions: Proposals carrying ``"candidate"`` specs
+            data: Feature matrix (array, memmap or ``.npy`` path)
+            labels: Target labels
+            eta: Elimination rate per rung (keep the top ``1/eta``)
+            min_rows: Smallest training subset used on the first rung
+            validation_fraction: Share of rows held out for scoring
+            random_state: Seed for the split and subset order
+            fingerprint: Precomputed ``fingerprint_dataset(data, labels)``
+            
+        Returns:
+            dict: Per-rung summary and the compute saved versus training
+            every candidate on the full split (cached rungs cost nothing)
+        """
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        executor = self.executor or CandidateExecutor()
+        survivors = [s for s in solutions if s.get("candidate")]
+        report = {"rungs": [], "compute_rows": 0, "full_compute_rows": 0, "compute_saved": 0.0}
+        if not survivors:
+            return report
+        
+        X, y = open_array(data), open_array(labels)
+        train_idx, val_idx = holdout_split(len(y), validation_fraction, random_state)
+        # Shuffled training rows make every prefix a random subset
+        train_idx = np.random.default_rng(random_state).permutation(train_idx)
+        n_train = len(train_idx)
+        
+        n_rungs = math.ceil(math.log(len(survivors), eta)) if len(survivors) > 1 else 0
+        report["full_compute_rows"] = len(survivors) * n_train
+        
+        # A rung's outcome depends only on the spec, the data and the rows
+        # trained on, so repeated candidates skip rungs they already ran
+        settings = None
+        if executor.cache is not None:
+            if fingerprint is None:
+                fingerprint = fingerprint_dataset(X, y)
+            settings = {"fingerprint": fingerprint,
+                        "validation_fraction": validation_fraction, "random_state": random_state}
+        
+        order = np.concatenate([train_idx, val_idx])
+        with SharedDataset(shared_arrays(survivors, X, y, order, fingerprint), order=order) as shared:
+            for rung in range(n_rungs + 1):
+                n_fit = min(n_train, max(min_rows, int(n_train * eta ** (rung - n_rungs))))
+                outcomes, trained = self._run_rung(executor, survivors, shared, n_train, n_fit, settings)
+                report["compute_rows"] += n_fit * trained
+                
+                ranked = sorted(zip(survivors, outcomes), key=lambda pair: _rung_score(pair[1]), reverse=True)
+                final = rung == n_rungs or n_fit == n_train
+                keep = len(ranked) if final else max(1, math.ceil(len(ranked) / eta))
+                
+                for solution, outcome in ranked[keep:]:
+                    solution["evaluation"] = {
+                        **outcome,
+                        "status": "eliminated" if outcome["status"] == "ok" else outcome["status"],
+                        "rung": rung,
+                        "rows_trained": n_fit
+                    }
+                survivors = [solution for solution, _ in ranked[:keep]]
+                report["rungs"].append({
+                    "rung": rung,
+                    "rows_trained": n_fit,
+                    "candidates": len(ranked),
+                    "survivors": keep
+                })
+                
+                if final:
+                    for solution, outcome in ranked[:keep]:
+                        solution["evaluation"] = {**outcome, "rung": rung, "rows_trained": n_fit}
+                    break
+        
+        report["compute_saved"] = 1.0 - report["compute_rows"] / report["full_compute_rows"]
+        return report
+    
+    def _run_rung(self, executor: CandidateExecutor, survivors: List[Dict], shared: SharedDataset,
+                  n_train: int, n_fit: int, settings: Optional[Dict]):
+        """Outcomes of one racing rung, from ``executor.cache`` where possible, and how many were trained."""
+        outcomes = [None] * len(survivors)
+        keys = {}
+        if settings is not None:
+            for i, solution in enumerate(survivors):
+                key = solution_key(solution["candidate"], settings["fingerprint"], race_rows=n_fit,
+                                   validation_fraction=settings["validation_fraction"],
+                                   random_state=settings["random_state"])
+                cached = executor.cache.get(key)
+                if cached is None:
+                    keys[i] = key
+                else:
+                    outcomes[i] = {"status": "ok", "result": cached, "error": None,
+                                   "duration_seconds": 0.0, "cached": True}
+        
+        to_train = [i for i, outcome in enumerate(outcomes) if outcome is None]
+        tasks = [
+            (train_and_score_shared, (survivors[i]["candidate"], shared.handles, n_train, n_fit))
+            for i in to_train
+        ]
+        for i, outcome in zip(to_train, executor.run(tasks)):
+            outcomes[i] = outcome
+            if outcome["status"] == "ok" and i in keys:
+                executor.cache.put(keys[i], outcome["result"])
+        return outcomes, len(to_train)
+    
+    def cross_validate(self, solutions: List[Dict], data, labels,
+                       fingerprint: Optional[str] = None) -> List[Dict]:
+        """
+        Run stratified k-fold cross-validation with folds spread across workers.
+        
+        Every (candidate, fold) pair is a separate executor task. The data is
+        written once, fold by fold, into a shared dataset so each worker reads
+        its validation fold as a view. Per-metric mean, variance and
+        confidence interval are stored under ``solution["cross_validation"]``.
+        Candidates eliminated by racing are skipped.
+        
+        With ``progressive_fraction`` set, candidates are first validated on
+        that share of the rows (a stratified random subsample), and only
+        those whose accuracy interval still straddles
+        ``validation_threshold`` move on to a ``progressive_growth`` times
+        larger sample, up to the full dataset. ``sample_rows`` in the
+        summary records where each candidate was decided.
+        
+        Args:
+            solutions: Proposals carrying ``"candidate"`` specs
+            data: Feature matrix (array, memmap or ``.npy`` path)
+            labels: Target labels
+            fingerprint: Precomputed ``fingerprint_dataset(data, labels)``
+            
+        Returns:
+            list: The same solution dicts, with cross-validation attached
+        """
+        pending = [
+            s for s in solutions
+            if s.get("candidate") and s.get("evaluation", {}).get("status", "ok") == "ok"
+        ]
+        if not pending:
+            return solutions
+        
+        executor = self.executor or CandidateExecutor()
+        X, y = open_array(data), open_array(labels)
+        k = self.cv_folds
+        
+        keys = {}
+        if executor.cache is not None:
+            if fingerprint is None:
+                fingerprint = fingerprint_dataset(X, y)
+            for solution in list(pending):
+                key = solution_key(solution["candidate"], fingerprint, cv_folds=k,
+                                   random_state=self.random_state,
+                                   confidence_level=self.confidence_level,
+                                   **self._progressive_settings())
+                cached = executor.cache.get(key)
+                if cached is None:
+                    keys[id(solution)] = key
+                else:
+                    solution["cross_validation"] = {**cached, "cached": True}
+                    pending.remove(solution)
+        if not pending:
+            return solutions
+        
+        if self.progressive_fraction is None:
+            self._run_folds(executor, pending, X, y, fingerprint=fingerprint)
+        else:
+            remaining = pending
+            sample_order = stratified_order(y, self.random_state)
+            for size in sample_schedule(len(y), self.progressive_fraction,
+                                        self.progressive_growth, self.progressive_min_rows):
+                rows = np.sort(sample_order[:size]) if size < len(y) else None
+                self._run_folds(executor, remaining, X, y, rows, fingerprint)
+                # Errors may come from the sample being too small; retry those
+                remaining = [
+                    s for s in remaining
+                    if s["cross_validation"]["status"] == "error" or (
+                        s["cross_validation"]["status"] == "ok" and not decides(
+                            (s["cross_validation"]["accuracy"]["ci_low"],
+                             s["cross_validation"]["accuracy"]["ci_high"]),
+                            self.validation_threshold
+                        )
+                    )
+                ]
+                if not remaining:
+                    break
+        
+        for solution in pending:
+            summary = solution["cross_validation"]
+            if summary["status"] == "ok" and id(solution) in keys:
+                executor.cache.put(keys[id(solution)], summary)
+        
+        return solutions
+    
+    def _progressive_settings(self) -> Dict:
+        if self.progressive_fraction is None:
+            return {}
+        return {"progressive": [self.progressive_fraction, self.progressive_growth,
+                                self.progressive_min_rows]}
+    
+    def _run_folds(self, executor: CandidateExecutor, solutions: List[Dict], X, y,
+                   rows: Optional[np.ndarray] = None, fingerprint: Optional[str] = None):
+        """Cross-validate ``solutions`` on ``rows`` (all rows if None)."""
+        k = self.cv_folds
+        order, bounds = stratified_folds(y if rows is None else y[rows], k, self.random_state)
+        if rows is not None:
+            order = rows[order]
+        # Two back-to-back copies, so each fold's training rows (the folds
+        # after it, cyclically) form one view instead of a per-worker copy
+        with SharedDataset(shared_arrays(solutions, X, y, order, fingerprint),
+                           order=np.concatenate([order, order])) as shared:
+            tasks = [
+                (cross_validate_fold, (s["candidate"], shared.handles, bounds, fold))
+                for s in solutions for fold in range(k)
+            ]
+            outcomes = executor.run(tasks)
+        
+        for i, solution in enumerate(solutions):
+            summary = self._summarize_folds(outcomes[i * k:(i + 1) * k])
+            summary["sample_rows"] = len(y) if rows is None else len(rows)
+            solution["cross_validation"] = summary
+    
+    def _summarize_folds(self, outcomes: List[Dict]) -> Dict:
+        """Mean, variance and confidence interval of each metric across folds."""
+        failed = [o for o in outcomes if o["status"] != "ok"]
+        if failed:
+            return {"status": failed[0]["status"], "error": failed[0]["error"], "folds": len(outcomes)}
+        
+        k = len(outcomes)
+        t = _t_critical(self.confidence_level, k - 1)
+        summary = {"status": "ok", "folds": k, "confidence_level": self.confidence_level}
+        optional = [
+            m for m in COMPILE_METRICS
+            if all(o["result"].get(m) is not None for o in outcomes)
+        ]
+        for metric in (*CV_METRICS, *optional):
+            values = np.array([o["result"][metric] for o in outcomes], dtype=np.float64)
+            mean = values.mean()
+            variance = values.var(ddof=1)
+            half_width = t * np.sqrt(variance / k)
+            summary[metric] = {
+                "mean": float(mean),
+                "variance": float(variance),
+                "ci_low": float(mean - half_width),
+                "ci_high": float(mean + half_width)
+            }
+        return summary
+    
     def _validate_solution(self, solution: Dict, current_performance: Dict) -> Dict:
         """Validate a single solution proposal."""
-        # Simulate validation process
         validation_score = self._calculate_validation_score(solution, current_performance)
         is_valid = validation_score >= self.validation_threshold
         
+        # A cross-validated candidate must clear the threshold with its whole
+        # confidence interval, not just a lucky mean
+        cross_validation = solution.get("cross_validation")
+        if cross_validation is not None:
+            is_valid = (cross_validation["status"] == "ok"
+                        and cross_validation["accuracy"]["ci_low"] >= self.validation_threshold)
+        
         return {
             **solution,
             "validation_score": validation_score,
             "is_valid": is_valid,
-            "expected_impact": self._estimate_impact(solution, current_performance)
+            "expected_impact": self._estimate_impact(solution, current_performance),
+            "compile_report": self._compile_report(solution)
         }
     
+    def _compile_report(self, solution: Dict) -> Optional[Dict]:
+        """Measured speedup and accuracy change from compiling the candidate, if any."""
+        cross_validation = solution.get("cross_validation")
+        evaluation = solution.get("evaluation")
+        if cross_validation is not None and cross_validation["status"] == "ok":
+            values = [cross_validation.get(m, {}).get("mean") for m in COMPILE_METRICS]
+        elif evaluation is not None and evaluation["status"] == "ok":
+            values = [evaluation["result"].get(m) for m in COMPILE_METRICS]
+        else:
+            return None
+        if None in values:
+            return None
+        return dict(zip(("speedup", "throughput_speedup", "accuracy_delta"), values))
+    
     def _calculate_validation_score(self, solution: Dict, current_performance: Dict) -> float:
         """Calculate validation score for a solution."""
+        # Prefer measured accuracy: cross-validated mean, then hold-out score
+        cross_validation = solution.get("cross_validation")
+        if cross_validation is not None:
+            if cross_validation["status"] != "ok":
+                return 0.0
+            return cross_validation["accuracy"]["mean"]
+        
+        evaluation = solution.get("evaluation")
+        if evaluation is not None:
+            if evaluation["status"] != "ok":
+                return 0.0
+            return float(evaluation["result"]["accuracy"])
+        
         base_score = solution.get("confidence_score", 0.5)
         
         # Adjust based on complexity (lower complexity = higher score)
         complexity = solution.get("complexity", "medium")
-        complexity_factor = {
-            "low": 1.2,
-            "medium": 1.0,
-            "high": 0.8
-        }.get(complexity, 1.0)
+        complexity_factor = COMPLEXITY_FACTORS.get(complexity, 1.0)
         
         # Adjust based on current performance
         performance_factor = 1.0
@@ -80,37 +555,183 @@ class Arbiter:
         return min(1.0, base_score * complexity_factor * performance_factor)
     
     def _estimate_impact(self, solution: Dict, current_performance: Dict) -> Dict:
-        """Estimate the potential impact of the solution."""
+        """Estimate the potential impact of the solution from measurements or the surrogate."""
+        current_accuracy = current_performance.get("accuracy")
+        score = measured_score(solution)
+        source = "measured"
+        uncertainty = None
+        if score is None:
+            means, stds = self._surrogate_predict([solution], current_performance)
+            if means is not None:
+                score, uncertainty, source = float(means[0]), float(stds[0]), "surrogate"
+        
+        accuracy_improvement = None
+        if score is not None and current_accuracy is not None:
+            accuracy_improvement = score - current_accuracy
+        
+        speed_improvement = None
+        objectives = self._objectives(solution)
+        current_latency = current_performance.get("inference_time")
+        if objectives is not None and current_latency:
+            speed_improvement = 1.0 - objectives[1] / current_latency
+        
+        stability_impact = "unknown"
+        cross_validation = solution.get("cross_validation")
+        if cross_validation is not None and cross_validation["status"] == "ok":
+            spread = np.sqrt(cross_validation["accuracy"]["variance"])
+            stability_impact = "reduced" if spread > 0.05 else "neutral"
+        
         return {
-            "accuracy_improvement": random.uniform(0.02, 0.15),
-            "speed_improvement": random.uniform(0.01, 0.10),
-            "stability_impact": random.choice(["improved", "neutral", "reduced"])
+            "accuracy_improvement": accuracy_improvement,
+            "speed_improvement": speed_improvement,
+            "stability_impact": stability_impact,
+            "uncertainty": uncertainty,
+            "source": source if score is not None else None
         }
     
-    def _select_best_solution(self, validated_solutions: List[Dict]) -> Dict:
-        """Select the best solution from validated options."""
-        valid_solutions = [s for s in validated_solutions if s["is_valid"]]
+    def _surrogate_predict(self, solutions: List[Dict], current_performance: Dict):
+        """Fold validation rounds recorded since the last call into the surrogate, then predict."""
+        with self._lock:
+            history = self.validation_history
+            seen = history.total_appended
+            if seen < self._surrogate_seen:
+                # The history was cleared (e.g. by resume): start over
+                self.surrogate.fit(())
+                self._surrogate_seen = 0
+            new_rounds = min(seen - self._surrogate_seen, len(history))
+            if new_rounds:
+                self.surrogate.update(
+                    (solution, record.get("current_performance", {}), measured_score(solution))
+                    for record in history[len(history) - new_rounds:]
+                    for solution in record["validated_solutions"]
+                    if measured_score(solution) is not None
+                )
+            self._surrogate_seen = seen
+            return self.surrogate.predict(solutions, current_performance)
+    
+    def prescreen(self, solutions: List[Dict], current_performance: Dict,
+                  kappa: float = 1.0) -> List[Dict]:
+        """
+        Skip candidates the surrogate considers unlikely to pass validation.
+        
+        A candidate is kept when its optimistic estimate (predicted mean plus
+        ``kappa`` standard deviations) reaches ``validation_threshold``.
+        Skipped candidates get a ``"skipped"`` evaluation, so they are never
+        trained and score 0. Until the history holds enough measured
+        candidates every solution is kept.
+        
+        Args:
+            solutions: Proposals from the Generator
+            current_performance: Current model performance metrics
+            kappa: Exploration weight on the predictive standard deviation
+            
+        Returns:
+            list: The solutions worth training
+        """
+        if not solutions:
+            return []
+        means, stds = self._surrogate_predict(solutions, current_performance)
+        if means is None:
+            return list(solutions)
+        
+        kept = []
+        for solution, mean, std in zip(solutions, means, stds):
+            solution["surrogate"] = {"predicted_score": float(mean), "uncertainty": float(std)}
+            if mean + kappa * std >= self.validation_threshold:
+                kept.append(solution)
+            else:
+                solution["evaluation"] = {
+                    "status": "skipped", "result": None,
+                    "error": "low surrogate-predicted score", "duration_seconds": 0.0
+                }
+        return kept
+    
+    def _objectives(self, solution: Dict):
+        """Measured (accuracy, p99 latency, model size) of a solution, if any."""
+        metrics = ("accuracy", "latency_p99", "model_size_bytes")
+        cross_validation = solution.get("cross_validation")
+        evaluation = solution.get("evaluation")
+        if cross_validation is not None and cross_validation["status"] == "ok":
+            values = [cross_validation.get(m, {}).get("mean") for m in metrics]
+        elif evaluation is not None and evaluation["status"] == "ok":
+            values = [evaluation["result"].get(m) for m in metrics]
+        else:
+            return None
+        return None if None in values else tuple(values)
+    
+    def select_from_front(self, max_latency: Optional[float] = None,
+                          max_size: Optional[float] = None,
+                          min_accuracy: Optional[float] = None) -> Optional[Dict]:
+        """
+        Query the Pareto front, e.g. "most accurate candidate under 5 ms p99".
+        
+        Args:
+            max_latency: Upper bound on p99 latency in seconds
+            max_size: Upper bound on serialized model size in bytes
+            min_accuracy: Lower bound on accuracy
+            
+        Returns:
+            The matching validated solution, or None
+        """
+        with self._lock:
+            return self.pareto_front.query(max_latency, max_size, min_accuracy)
+    
+    def _select_best_solution(self, validated_solutions: List[Dict],
+                              round_front: Optional[ParetoFront] = None) -> Optional[Dict]:
+        """
+        Select the best solution from validated options.
+        
+        Measured candidates over the latency/size budgets are never selected.
+        When no candidate is valid, the best-scoring invalid one is returned
+        with ``is_valid`` False (``validate_solutions`` reports it as
+        ``selection_fallback``); None if nothing fits the budgets.
+        """
+        # With latency/size budgets, pick the most accurate valid candidate
+        # of this round that fits them
+        budgeted = self.latency_budget is not None or self.size_budget is not None
+        if budgeted and round_front is not None:
+            choice = round_front.query(self.latency_budget, self.size_budget)
+            if choice is not None:
+                return choice
+        
+        eligible = [s for s in validated_solutions if self._within_budgets(s)]
+        valid_solutions = [s for s in eligible if s["is_valid"]]
         
         if not valid_solutions:
             # Fallback to least bad invalid solution if no valid ones
-            valid_solutions = sorted(validated_solutions, 
-                                   key=lambda x: x["validation_score"], 
-                                   reverse=True)[:1]
+            valid_solutions = eligible
+        if not valid_solutions:
+            return None
         
         # Select solution with highest validation score
         best_solution = max(valid_solutions, key=lambda x: x["validation_score"])
         
         return best_solution
     
+    def _within_budgets(self, solution: Dict) -> bool:
+        """False for a measured solution over the latency or size budget."""
+        objectives = self._objectives(solution)
+        if objectives is None:
+            return True
+        _, latency, size = objectives
+        return ((self.latency_budget is None or latency <= self.latency_budget)
+                and (self.size_budget is None or size <= self.size_budget))
+    
+    def _scope_front(self, fingerprint: str):
+        """Start a fresh Pareto front when the data changes; old measurements do not compare."""
+        if fingerprint != self.front_fingerprint:
+            self.pareto_front = ParetoFront()
+            self.front_fingerprint = fingerprint
+    
     def _get_current_timestamp(self):
         """Get current timestamp in ISO format."""
         from datetime import datetime
         return datetime.now().isoformat()
     
     def get_validation_history(self):
-        """Return complete validation history."""
-        return self.validation_history
+        """Return a read-only view of the retained validation history."""
+        return self.validation_history.view()
     
     def get_selected_solutions(self):
-        """Return history of all selected solutions."""
-        return self.selected_solutions
+        """Return a read-only view of the retained selected solutions."""
+        return self.selected_solutions.view()
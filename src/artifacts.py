@@ -0,0 +1,161 @@
+# src/artifacts.py
+"""
+Artifacts module for a content-addressed store of trained models.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+MODEL_FILE = "model.pkl"
+
+
+class ArtifactStore:
+    """
+    Local content-addressed store for fitted models.
+
+    Models are pickled with protocol 5 so their large NumPy arrays are
+    written out-of-band, each to its own ``.npy`` file next to a small
+    pickle stream (buffers without a contiguous view stay in the stream). The artifact id is the SHA-256 of the stream and the
+    buffers, so storing an identical model twice costs nothing. Loading
+    memory-maps the buffers: arrays are rebuilt as read-only views of the
+    page cache, which makes a load take milliseconds and lets several
+    processes share the same pages.
+
+    Named references (``pin``) mark artifacts that must be kept. Once the
+    store exceeds ``max_bytes``, ``collect`` deletes unreferenced artifacts,
+    least recently used first; callers pass any other digests still in use.
+    """
+
+    def __init__(self, root: str = "neurocortex_artifacts", max_bytes: Optional[int] = None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.objects = os.path.join(root, "objects")
+        self._refs_path = os.path.join(root, "refs.json")
+        os.makedirs(self.objects, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.objects, digest)
+
+    def __contains__(self, digest: str) -> bool:
+        return os.path.isdir(self._path(digest))
+
+    def put(self, model) -> str:
+        """Store ``model`` and return its content digest."""
+        raw = []
+
+        def out_of_band(buffer):
+            try:
+                raw.append(buffer.raw())
+            except BufferError:
+                return True  # no flat view of this buffer: keep it in the stream
+            return False
+
+        stream = pickle.dumps(model, protocol=5, buffer_callback=out_of_band)
+
+        digest = hashlib.sha256(stream)
+        for view in raw:
+            digest.update(len(view).to_bytes(8, "little"))
+            digest.update(view)
+        digest = digest.hexdigest()
+
+        if digest in self:
+            os.utime(self._path(digest))
+            return digest
+
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.objects)
+        try:
+            with open(os.path.join(staging, MODEL_FILE), "wb") as f:
+                f.write(stream)
+            for i, view in enumerate(raw):
+                np.save(os.path.join(staging, f"buffer-{i}.npy"), np.frombuffer(view, dtype=np.uint8))
+            try:
+                os.rename(staging, self._path(digest))
+            except OSError:
+                # Another writer stored the same content first
+                if digest not in self:
+                    raise
+        finally:
+            if os.path.isdir(staging):
+                shutil.rmtree(staging, ignore_errors=True)
+        return digest
+
+    def get(self, digest: str):
+        """Load a model, memory-mapping its arrays read-only."""
+        path = self._path(digest)
+        if digest not in self:
+            raise KeyError(f"no artifact {digest}")
+        n_buffers = sum(1 for name in os.listdir(path) if name.startswith("buffer-"))
+        buffers = [
+            np.load(os.path.join(path, f"buffer-{i}.npy"), mmap_mode="r") for i in range(n_buffers)
+        ]
+        with open(os.path.join(path, MODEL_FILE), "rb") as f:
+            model = pickle.load(f, buffers=buffers)
+        os.utime(path)  # recency for garbage collection
+        return model
+
+    def size(self, digest: str) -> int:
+        path = self._path(digest)
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+    def digests(self) -> List[str]:
+        return [name for name in os.listdir(self.objects) if not name.startswith(".")]
+
+    def total_bytes(self) -> int:
+        return sum(self.size(digest) for digest in self.digests())
+
+    def refs(self) -> Dict[str, str]:
+        """Named references, e.g. ``{"live": digest}``."""
+        if not os.path.exists(self._refs_path):
+            return {}
+        with open(self._refs_path) as f:
+            return json.load(f)
+
+    def pin(self, name: str, digest: Optional[str]):
+        """Point reference ``name`` at ``digest`` (None removes it)."""
+        refs = self.refs()
+        if digest is None:
+            refs.pop(name, None)
+        else:
+            refs[name] = digest
+        tmp_path = f"{self._refs_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(refs, f, indent=2)
+        os.replace(tmp_path, self._refs_path)
+
+    def collect(self, referenced: Iterable[str] = ()) -> List[str]:
+        """
+        Delete unreferenced artifacts, oldest access first, until the store
+        fits in ``max_bytes`` (or delete all of them when ``max_bytes`` is None).
+
+        Args:
+            referenced: Digests in use besides the pinned ones
+
+        Returns:
+            list: Digests removed
+        """
+        keep = set(referenced) | set(self.refs().values())
+        entries = []
+        total = 0
+        for digest in self.digests():
+            size = self.size(digest)
+            total += size
+            if digest not in keep:
+                entries.append((os.path.getmtime(self._path(digest)), size, digest))
+
+        removed = []
+        for _, size, digest in sorted(entries):
+            if self.max_bytes is not None and total <= self.max_bytes:
+                break
+            shutil.rmtree(self._path(digest), ignore_errors=True)
+            total -= size
+            removed.append(digest)
+        return removed
+
+    def stats(self) -> Dict:
+        return {"artifacts": len(self.digests()), "bytes": self.total_bytes(), "refs": self.refs()}
@@ -0,0 +1,430 @@
+# src/benchmark.py
+"""
+Benchmark module for timing the SRDF hot paths and gating regressions.
+
+Run ``python -m src.benchmark run --output results.json`` to time the
+Trawler, Generator, Arbiter and full cycles on synthetic data, and
+``python -m src.benchmark compare benchmarks/baseline.json results.json``
+to fail (exit code 1) when a case got slower than the baseline allows.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+SCHEMA_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_SECONDS = 0.005  # absolute slack so sub-millisecond cases do not flap
+CHUNK_ROWS = 250_000
+IN_MEMORY_ROWS = 1_000_000  # larger datasets are written to .npy files and memory-mapped
+
+# Sizes per case: rows for the data-bound cases, candidates for the others
+PROFILES = {
+    "quick": {
+        "trawler": [1_000, 10_000, 100_000],
+        "generator": [1, 100, 1_000],
+        "arbiter": [1, 100, 1_000],
+        "cycle": [1_000],
+    },
+    "full": {
+        "trawler": [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        "generator": [1, 100, 1_000, 10_000],
+        "arbiter": [1, 100, 1_000, 10_000],
+        "cycle": [1_000, 10_000, 100_000, 1_000_000],
+    },
+}
+CASE_PARAMS = {"trawler": "rows", "generator": "candidates", "arbiter": "candidates", "cycle": "rows"}
+
+ISSUES = [
+    ("Low accuracy - needs improvement", "Try ensemble methods or architecture search"),
+    ("Poor recall on minority classes", "Apply class balancing techniques"),
+    ("Slow inference speed (250.0 ms > 100.0 ms)", "Optimize model architecture or use quantization"),
+    ("Feature drift detected in features [3] (max PSI 0.31)", "Retrain or recalibrate on recent data"),
+]
+
+
+def _classification_chunk(rng, n_rows, centroids, mixing, redundant, weights, n_noise, flip_y):
+    n_classes, n_informative = centroids.shape
+    y = rng.choice(n_classes, size=n_rows, p=weights)
+    informative = rng.standard_normal((n_rows, n_informative)) @ mixing + centroids[y]
+    noise = rng.standard_normal((n_rows, n_noise))
+    X = np.hstack([informative, informative @ redundant, noise]).astype(np.float32)
+    flip = rng.random(n_rows) < flip_y
+    y[flip] = rng.integers(0, n_classes, size=int(flip.sum()))
+    return X, y
+
+
+def make_classification(n_rows: int, n_features: int = 20, n_informative: int = 5,
+                        n_redundant: int = 2, n_classes: int = 2,
+                        weights: Optional[Sequence[float]] = None, class_sep: float = 1.0,
+                        flip_y: float = 0.01, random_state: int = 0,
+                        path: Optional[str] = None):
+    """
+    Synthetic classification data in the style of sklearn's ``make_classification``.
+
+    Each class is a Gaussian cluster around a vertex of a hypercube with
+    side ``2 * class_sep`` in the informative features, sheared by a random
+    covariance; redundant features are random linear combinations of the
+    informative ones and the rest are noise. A ``flip_y`` fraction of the
+    labels is reassigned at random. Rows are generated in fixed chunks, so
+    the output depends only on the arguments; with ``path`` the chunks are
+    written to ``<path>_X.npy``/``<path>_y.npy`` and the two file paths are
+    returned instead of arrays (1e7 rows never have to fit in memory).
+
+    Returns:
+        ``(X, y)`` with float32 features and int64 labels
+    """
+    n_noise = n_features - n_informative - n_redundant
+    if n_noise < 0:
+        raise ValueError("n_informative + n_redundant must not exceed n_features")
+    rng = np.random.default_rng(random_state)
+    vertices = rng.permutation(2 ** min(n_informative, 30))[:n_classes]
+    bits = (vertices[:, None] >> np.arange(n_informative)) & 1
+    centroids = (2 * bits - 1) * class_sep
+    mixing = rng.uniform(-1, 1, size=(n_informative, n_informative))
+    redundant = rng.uniform(-1, 1, size=(n_informative, n_redundant))
+    weights = None if weights is None else np.asarray(weights, dtype=np.float64) / np.sum(weights)
+
+    if path is None:
+        X = np.empty((n_rows, n_features), dtype=np.float32)
+        y = np.empty(n_rows, dtype=np.int64)
+    else:
+        X_path, y_path = f"{path}_X.npy", f"{path}_y.npy"
+        X = np.lib.format.open_memmap(X_path, mode="w+", dtype=np.float32, shape=(n_rows, n_features))
+        y = np.lib.format.open_memmap(y_path, mode="w+", dtype=np.int64, shape=(n_rows,))
+    for index, start in enumerate(range(0, n_rows, CHUNK_ROWS)):
+        stop = min(start + CHUNK_ROWS, n_rows)
+        chunk_rng = np.random.default_rng([random_state, index])
+        X[start:stop], y[start:stop] = _classification_chunk(
+            chunk_rng, stop - start, centroids, mixing, redundant, weights, n_noise, flip_y
+        )
+    if path is None:
+        return X, y
+    X.flush()
+    y.flush()
+    del X, y
+    return X_path, y_path
+
+
+def make_candidates(n: int, random_state: int = 0) -> List[Dict]:
+    """
+    Proposals with hold-out evaluations attached, as the Arbiter sees them
+    after the evaluate phase (about one in ten failed or was skipped).
+    """
+    rng = random.Random(random_state)
+    solutions = []
+    for i in range(n):
+        issue, recommendation = ISSUES[i % len(ISSUES)]
+        solution = {
+            "issue": issue,
+            "recommendation": recommendation,
+            "proposed_solution": f"variant {i}",
+            "confidence_score": rng.uniform(0.7, 0.95),
+            "complexity": rng.choice(["low", "medium", "high"]),
+            "solution_type": ["accuracy", "recall", "speed", "drift"][i % len(ISSUES)],
+        }
+        if i % 10 == 9:
+            solution["evaluation"] = {"status": rng.choice(["timeout", "skipped"]), "result": None}
+        else:
+            solution["evaluation"] = {"status": "ok", "result": {
+                "accuracy": rng.uniform(0.6, 0.95),
+                "latency_p99": rng.uniform(1e-4, 1e-2),
+                "model_size_bytes": rng.randint(10_000, 10_000_000),
+            }}
+        solutions.append(solution)
+    return solutions
+
+
+def make_analysis(n_issues: int, random_state: int = 0) -> Dict:
+    """Trawler output with ``n_issues`` identified issues (so as many proposals)."""
+    rng = random.Random(random_state)
+    pairs = [ISSUES[rng.randrange(len(ISSUES))] for _ in range(n_issues)]
+    return {
+        "identified_issues": [issue for issue, _ in pairs],
+        "recommendations": [recommendation for _, recommendation in pairs],
+        "performance_metrics": {"accuracy": 0.82, "recall": 0.7, "inference_time": 0.25,
+                                "latency_threshold": 0.1},
+    }
+
+
+class _Datasets:
+    """Synthetic datasets per row count, created once per run."""
+
+    def __init__(self, directory: str, random_state: int = 0):
+        self.directory = directory
+        self.random_state = random_state
+        self._data = {}
+
+    def get(self, rows: int):
+        if rows not in self._data:
+            path = os.path.join(self.directory, f"classification_{rows}") if rows > IN_MEMORY_ROWS else None
+            self._data[rows] = make_classification(rows, random_state=self.random_state, path=path)
+        return self._data[rows]
+
+    def model(self, rows: int, max_depth: int = 6):
+        """A decision tree fitted on (at most) the first 20k rows."""
+        from sklearn.tree import DecisionTreeClassifier
+
+        X, y = self.get(rows)
+        if isinstance(X, str):
+            X, y = np.load(X, mmap_mode="r"), np.load(y, mmap_mode="r")
+        n_fit = min(rows, 20_000)
+        return DecisionTreeClassifier(max_depth=max_depth, random_state=0).fit(X[:n_fit], y[:n_fit])
+
+
+def _trawler_case(datasets: _Datasets, rows: int) -> Callable:
+    from .trawler import Trawler
+
+    X, y = datasets.get(rows)
+    model = datasets.model(rows)
+    return lambda: Trawler(history_size=10).analyze_performance(model, X, y)
+
+
+def _generator_case(datasets: _Datasets, candidates: int) -> Callable:
+    from .generator import Generator
+
+    analysis = make_analysis(candidates)
+
+    def run():
+        random.seed(0)
+        Generator(history_size=10).propose_solutions(analysis)
+    return run
+
+
+def _arbiter_case(datasets: _Datasets, candidates: int) -> Callable:
+    from .arbiter import Arbiter
+
+    solutions = make_candidates(candidates)
+    performance = make_analysis(1)["performance_metrics"]
+    return lambda: Arbiter(history_size=10).validate_solutions(solutions, performance)
+
+
+def _cycle_case(datasets: _Datasets, rows: int) -> Callable:
+    from .core import SRDFFramework
+
+    X, y = datasets.get(rows)
+    model = datasets.model(rows, max_depth=3)
+
+    def run():
+        random.seed(0)
+        np.random.seed(0)
+        framework = SRDFFramework({**SRDFFramework._default_config(), "cv_folds": 3, "history_size": 10})
+        framework._run_cycle(0, model, X, y)
+    return run
+
+
+CASES = {
+    "trawler": ("trawler.analyze_performance", _trawler_case),
+    "generator": ("generator.propose_solutions", _generator_case),
+    "arbiter": ("arbiter.validate_solutions", _arbiter_case),
+    "cycle": ("framework._run_cycle", _cycle_case),
+}
+
+
+def case_id(name: str, params: Dict) -> str:
+    return name + "[" + ",".join(f"{key}={value}" for key, value in sorted(params.items())) + "]"
+
+
+def time_call(fn: Callable, repeats: int = 5, warmup: int = 1) -> List[float]:
+    """Wall-clock seconds of ``repeats`` calls of ``fn`` after ``warmup`` untimed ones."""
+    for _ in range(warmup):
+        fn()
+    seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def environment() -> Dict:
+    """Where the numbers were measured; comparisons across machines are only indicative."""
+    import sklearn
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmarks(profile: str = "quick", cases: Optional[Sequence[str]] = None,
+                   sizes: Optional[Dict[str, Sequence[int]]] = None, repeats: int = 5,
+                   warmup: int = 1, random_state: int = 0, log=None) -> Dict:
+    """
+    Time every selected case at every size of ``profile``.
+
+    Args:
+        profile: ``"quick"`` (seconds to a few minutes) or ``"full"``
+            (1e3 to 1e7 rows and 1 to 10,000 candidates)
+        cases: Subset of ``"trawler"``, ``"generator"``, ``"arbiter"``, ``"cycle"``
+        sizes: Per-case size overrides, e.g. ``{"trawler": [10_000_000]}``
+        repeats: Timed calls per case after ``warmup`` untimed ones
+        log: Optional callable receiving one progress line per case
+
+    Returns:
+        dict: Results keyed by case id with per-repeat seconds, min and median
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"profile must be one of {sorted(PROFILES)}")
+    cases = list(cases or CASES)
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        raise ValueError(f"unknown cases {sorted(unknown)}; expected some of {sorted(CASES)}")
+    sizes = {**PROFILES[profile], **(sizes or {})}
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="srdf-bench-") as directory:
+        datasets = _Datasets(directory, random_state)
+        for key in cases:
+            name, setup = CASES[key]
+            for size in sizes[key]:
+                params = {CASE_PARAMS[key]: size}
+                seconds = time_call(setup(datasets, size), repeats, warmup)
+                entry = {
+                    "case": name,
+                    "params": params,
+                    "seconds": seconds,
+                    "min": min(seconds),
+                    "median": statistics.median(seconds),
+                }
+                results[case_id(name, params)] = entry
+                if log is not None:
+                    log(f"{case_id(name, params):<55} min {entry['min']:.4f}s  median {entry['median']:.4f}s")
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(),
+        "profile": profile,
+        "repeats": repeats,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, tolerance: float = DEFAULT_TOLERANCE,
+                    min_seconds: float = DEFAULT_MIN_SECONDS, statistic: str = "min") -> Dict:
+    """
+    Compare two result sets case by case on ``statistic`` (``"min"`` or ``"median"``).
+
+    A case regresses when it is more than ``tolerance`` (relative) and
+    ``min_seconds`` (absolute) slower than the baseline. Cases present in
+    only one of the two sets are listed but never fail the comparison.
+    """
+    rows = []
+    for key, base in sorted(baseline["results"].items()):
+        entry = current["results"].get(key)
+        if entry is None:
+            continue
+        before, after = base[statistic], entry[statistic]
+        slower = after - before
+        regressed = slower > tolerance * before and slower > min_seconds
+        rows.append({
+            "case": key,
+            "baseline": before,
+            "current": after,
+            "ratio": after / before if before > 0 else float("inf"),
+            "regressed": regressed,
+        })
+    return {
+        "tolerance": tolerance,
+        "statistic": statistic,
+        "cases": rows,
+        "regressions": [row["case"] for row in rows if row["regressed"]],
+        "missing": sorted(set(baseline["results"]) - set(current["results"])),
+        "new": sorted(set(current["results"]) - set(baseline["results"])),
+        "same_environment": baseline.get("environment") == current.get("environment"),
+    }
+
+
+def format_comparison(report: Dict) -> str:
+    lines = [f"{'case':<55} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for row in report["cases"]:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(f"{row['case']:<55} {row['baseline']:>9.4f}s {row['current']:>9.4f}s "
+                     f"{row['ratio']:>6.2f}x{flag}")
+    for key in report["missing"]:
+        lines.append(f"{key:<55} missing from the current results")
+    if not report["same_environment"]:
+        lines.append("note: results come from different environments; ratios are only indicative")
+    verdict = (f"{len(report['regressions'])} case(s) regressed beyond {report['tolerance']:.0%}"
+               if report["regressions"] else f"no regressions beyond {report['tolerance']:.0%}")
+    lines.append(verdict)
+    return "\n".join(lines)
+
+
+def _load(path: str) -> Dict:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark schema {results.get('schema')!r}")
+    return results
+
+
+def _sizes(text: str) -> List[int]:
+    return [int(float(size)) for size in text.split(",")]  # accepts "1e6"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the benchmark cases and write a results file")
+    run.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    run.add_argument("--cases", default=",".join(CASES), help="comma-separated subset of " + ", ".join(CASES))
+    for key, param in CASE_PARAMS.items():
+        run.add_argument(f"--{key}-sizes", type=_sizes, metavar=param.upper(),
+                         help=f"comma-separated {param} for the {key} case (overrides the profile)")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--output", "-o", help="write the results as JSON (default: stdout)")
+    run.add_argument("--baseline", help="compare against this results file after running")
+
+    compare = commands.add_parser("compare", help="fail when CURRENT regressed against BASELINE")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    for sub in (run, compare):
+        sub.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                         help="allowed relative slowdown (default: %(default)s)")
+        sub.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                         help="ignore slowdowns smaller than this (default: %(default)s)")
+        sub.add_argument("--statistic", choices=("min", "median"), default="min")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        sizes = {key: getattr(args, f"{key}_sizes") for key in CASE_PARAMS
+                 if getattr(args, f"{key}_sizes") is not None}
+        current = run_benchmarks(args.profile, args.cases.split(","), sizes, args.repeats, args.warmup,
+                                 log=lambda line: print(line, file=sys.stderr))
+        text = json.dumps(current, indent=2) + "\n"
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    report = compare_results(baseline, current, args.tolerance, args.min_seconds, args.statistic)
+    print(format_comparison(report), file=sys.stderr if args.command == "run" and not args.output else sys.stdout)
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
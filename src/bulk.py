@@ -0,0 +1,126 @@
+# src/bulk.py
+"""
+Bulk module for scoring and ranking large candidate sets with NumPy.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+COMPLEXITY_FACTORS = {"low": 1.2, "medium": 1.0, "high": 0.8}
+
+# Measurement source, in order of precedence when scoring
+SOURCE_CONFIDENCE, SOURCE_HOLDOUT, SOURCE_CV = 0, 1, 2
+
+CANDIDATE_DTYPE = np.dtype([
+    ("confidence", np.float64),
+    ("complexity_factor", np.float64),
+    ("source", np.int8),
+    ("measured_ok", np.bool_),
+    ("accuracy", np.float64),
+    ("accuracy_ci_low", np.float64),
+    ("latency_p99", np.float64),  # NaN when not measured
+    ("model_size_bytes", np.float64),
+])
+
+
+def _measured(values: Dict, metric: str, key=None) -> float:
+    value = values.get(metric)
+    if key is not None and value is not None:
+        value = value.get(key)
+    return np.nan if value is None else value
+
+
+def _candidate_row(solution: Dict):
+    cross_validation = solution.get("cross_validation")
+    evaluation = solution.get("evaluation")
+    if cross_validation is not None:
+        ok = cross_validation["status"] == "ok"
+        accuracy = cross_validation["accuracy"] if ok else None
+        return (0.0, 1.0, SOURCE_CV, ok,
+                accuracy["mean"] if ok else np.nan,
+                accuracy["ci_low"] if ok else np.nan,
+                _measured(cross_validation, "latency_p99", "mean") if ok else np.nan,
+                _measured(cross_validation, "model_size_bytes", "mean") if ok else np.nan)
+    if evaluation is not None:
+        ok = evaluation["status"] == "ok"
+        result = evaluation["result"] if ok else {}
+        value = result["accuracy"] if ok else np.nan
+        return (0.0, 1.0, SOURCE_HOLDOUT, ok, value, value,
+                _measured(result, "latency_p99"), _measured(result, "model_size_bytes"))
+    return (
+        solution.get("confidence_score", 0.5),
+        COMPLEXITY_FACTORS.get(solution.get("complexity", "medium"), 1.0),
+        SOURCE_CONFIDENCE, True, np.nan, np.nan, np.nan, np.nan
+    )
+
+
+def candidates_to_array(solutions: List[Dict]) -> np.ndarray:
+    """Pack the attributes needed for scoring into a ``CANDIDATE_DTYPE`` array."""
+    return np.fromiter((_candidate_row(s) for s in solutions),
+                       dtype=CANDIDATE_DTYPE, count=len(solutions))
+
+
+def score_candidates(candidates: np.ndarray, current_performance: Dict,
+                     validation_threshold: float):
+    """
+    Vectorized equivalent of ``Arbiter._calculate_validation_score``.
+
+    Returns:
+        tuple: ``(scores, is_valid)`` arrays aligned with ``candidates``
+    """
+    performance_factor = 1.1 if current_performance.get("accuracy", 0) < 0.7 else 1.0
+    estimated = np.minimum(
+        1.0, candidates["confidence"] * candidates["complexity_factor"] * performance_factor
+    )
+
+    source = candidates["source"]
+    ok = candidates["measured_ok"]
+    measured = np.where(ok, candidates["accuracy"], 0.0)
+    scores = np.where(source == SOURCE_CONFIDENCE, estimated, measured)
+
+    # Cross-validated candidates are judged on their interval's lower bound
+    lower = np.where(source == SOURCE_CV, np.where(ok, candidates["accuracy_ci_low"], -np.inf), scores)
+    is_valid = lower >= validation_threshold
+    return scores, is_valid
+
+
+def within_budgets(candidates: np.ndarray, latency_budget=None, size_budget=None) -> np.ndarray:
+    """
+    Vectorized ``Arbiter._within_budgets``: False for candidates measured
+    over the p99 latency or model size budget (unmeasured ones pass).
+    """
+    within = np.ones(len(candidates), dtype=bool)
+    if latency_budget is not None:
+        within &= ~(candidates["latency_p99"] > latency_budget)
+    if size_budget is not None:
+        within &= ~(candidates["model_size_bytes"] > size_budget)
+    return within
+
+
+def top_k_indices(scores: np.ndarray, is_valid: np.ndarray, k: int,
+                  eligible: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Indices of the ``k`` best-scoring valid candidates, best first.
+
+    Falls back to the single best invalid candidate when none are valid.
+    Candidates outside ``eligible`` (e.g. over a budget) are never chosen.
+    Uses ``argpartition`` so only the selected ``k`` are fully sorted.
+    """
+    if scores.size == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    eligible = np.ones(scores.size, dtype=bool) if eligible is None else eligible
+    pool = np.flatnonzero(is_valid & eligible)
+    if pool.size == 0:
+        pool, k = np.flatnonzero(eligible), 1
+        if pool.size == 0:
+            return np.empty(0, dtype=np.int64)
+
+    k = min(k, pool.size)
+    pool_scores = scores[pool]
+    if k < pool.size:
+        chosen = np.argpartition(-pool_scores, k - 1)[:k]
+    else:
+        chosen = np.arange(pool.size)
+    chosen = chosen[np.argsort(-pool_scores[chosen], kind="stable")]
+    return pool[chosen]
@@ -0,0 +1,129 @@
+# src/cache.py
+"""
+Cache module for persisting candidate fitness across cycles and processes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+FINGERPRINT_CHUNK_ROWS = 65536
+
+
+def fingerprint_dataset(*arrays) -> str:
+    """
+    Return a stable content hash of one or more arrays.
+
+    Arrays are hashed in row chunks, so memory-mapped inputs are streamed
+    rather than loaded.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.asarray(array) if not hasattr(array, "shape") else array
+        digest.update(f"{array.dtype.str}{tuple(array.shape)}".encode())
+        for start in range(0, array.shape[0], FINGERPRINT_CHUNK_ROWS):
+            chunk = np.ascontiguousarray(array[start:start + FINGERPRINT_CHUNK_ROWS])
+            digest.update(chunk.data if chunk.dtype != object else repr(chunk.tolist()).encode())
+    return digest.hexdigest()
+
+
+def solution_key(spec: Dict, fingerprint: str, **settings) -> str:
+    """Hash a candidate spec, a data fingerprint and evaluation settings."""
+    payload = json.dumps(
+        {"spec": spec, "data": fingerprint, "settings": settings},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class FitnessCache:
+    """
+    On-disk LRU cache of candidate scores backed by SQLite.
+
+    Entries are evicted least-recently-used first once the cache holds more
+    than ``max_entries`` entries or ``max_bytes`` of serialized scores. The
+    database can be shared by several processes.
+    """
+
+    def __init__(self, path: str = "neurocortex_fitness_cache.sqlite",
+                 max_entries: Optional[int] = 10000, max_bytes: Optional[int] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS fitness ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS fitness_lru ON fitness (last_access)")
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection that commits on success."""
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached score for ``key`` (refreshing its LRU position) or None."""
+        with self._connect() as db:
+            row = db.execute("SELECT value FROM fitness WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute("UPDATE fitness SET last_access = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict):
+        """Store a score and evict old entries beyond the configured limits."""
+        payload = json.dumps(value, default=float)
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO fitness (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            self._evict(db)
+
+    def _evict(self, db):
+        if self.max_entries is not None:
+            db.execute(
+                "DELETE FROM fitness WHERE key IN ("
+                " SELECT key FROM fitness ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        if self.max_bytes is not None:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM fitness").fetchone()[0]
+            rows = db.execute("SELECT key, size FROM fitness ORDER BY last_access")
+            stale = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                stale.append((key,))
+                total -= size
+            db.executemany("DELETE FROM fitness WHERE key = ?", stale)
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM fitness").fetchone()[0]
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM fitness")
+
+    def stats(self) -> Dict:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,226 @@
+# src/candidates.py
+"""
+Candidates module for turning Generator proposals into trainable models.
+
+A candidate spec is a plain, JSON-serialisable dict such as::
+
+    {"estimator": "GradientBoostingClassifier",
+     "params": {"n_estimators": 200, "learning_rate": 0.1},
+     "resample": None}
+
+so it can be stored in histories, hashed and shipped to worker processes.
+scikit-learn is only imported when a spec is actually built.
+"""
+
+import pickle
+import time
+import numpy as np
+from typing import Dict
+from .compiled import compile_forest
+from .metrics import ConfusionAccumulator
+from .oversampling import SMOTEOversampler, shared_oversampler, window_neighbors
+from .profiler import DEFAULT_BATCH_SIZES, profile_inference
+
+ESTIMATOR_MODULES = {
+    "RandomForestClassifier": "sklearn.ensemble",
+    "ExtraTreesClassifier": "sklearn.ensemble",
+    "GradientBoostingClassifier": "sklearn.ensemble",
+    "HistGradientBoostingClassifier": "sklearn.ensemble",
+    "DecisionTreeClassifier": "sklearn.tree",
+    "LogisticRegression": "sklearn.linear_model",
+    "MLPClassifier": "sklearn.neural_network",
+}
+
+
+def _import_estimator(name: str):
+    if name not in ESTIMATOR_MODULES:
+        raise ValueError(f"Unknown estimator '{name}'")
+    try:
+        module = __import__(ESTIMATOR_MODULES[name], fromlist=[name])
+    except ImportError as exc:
+        raise ImportError(
+            "Training candidates requires scikit-learn: pip install scikit-learn"
+        ) from exc
+    return getattr(module, name)
+
+
+def build_estimator(spec: Dict):
+    """
+    Instantiate the (unfitted) estimator described by ``spec``.
+
+    ``"VotingEnsemble"`` builds a soft-voting ensemble whose members are
+    themselves specs listed under ``"members"``.
+    """
+    name = spec["estimator"]
+    params = dict(spec.get("params", {}))
+
+    if name == "VotingEnsemble":
+        from sklearn.ensemble import VotingClassifier
+        members = [
+            (f"{member['estimator']}_{i}", build_estimator(member))
+            for i, member in enumerate(spec["members"])
+        ]
+        return VotingClassifier(members, voting=params.pop("voting", "soft"), **params)
+
+    return _import_estimator(name)(**params)
+
+
+def prepare_training_data(spec: Dict, X, y, neighbors=None):
+    """
+    Apply the spec's data preparation (recency window, resampling).
+
+    ``neighbors`` is an optional same-class neighbour table of the rows
+    (see ``shared_neighbor_table``); worker processes get one from the
+    parent instead of indexing their training split for SMOTE.
+    """
+    fraction = spec.get("train_fraction")
+    if fraction:
+        # Keep the most recent rows, assuming data is in arrival order
+        start = int(len(y) * (1.0 - fraction))
+        if neighbors is not None:
+            neighbors = window_neighbors(neighbors[start:], start, len(y) - start, len(y))
+        X, y = X[start:], y[start:]
+
+    if spec.get("resample") == "smote":
+        k_neighbors, random_state = spec.get("k_neighbors", 5), spec.get("random_state", 42)
+        if neighbors is not None:
+            X, y = SMOTEOversampler(k_neighbors, random_state).fit_resample(X, y, neighbors=neighbors)
+        else:
+            # Reuses the neighbour indices built for this dataset by earlier cycles
+            X, y = shared_oversampler(X, k_neighbors, random_state).fit_resample(X, y)
+
+    return X, y
+
+
+def fit_estimator(spec: Dict, X, y, neighbors=None):
+    """Prepare the data and fit the candidate's estimator, without compiling it."""
+    X, y = prepare_training_data(spec, X, y, neighbors)
+    model = build_estimator(spec)
+    if spec.get("sample_weighting") == "recency":
+        # Linearly up-weight later rows so the fit leans toward current data
+        model.fit(X, y, sample_weight=np.linspace(0.1, 1.0, len(y)))
+    else:
+        model.fit(X, y)
+    return model
+
+
+def fit_candidate(spec: Dict, X, y):
+    """
+    Fit the candidate, compiling it when the spec has a ``"compile"`` entry.
+
+    ``"compile"`` holds keyword arguments for ``compile_forest`` (e.g.
+    ``{"max_depth": 8, "threshold_dtype": "int16"}``).
+    """
+    model = fit_estimator(spec, X, y)
+    if spec.get("compile") is not None:
+        model = compile_forest(model, **spec["compile"])
+    return model
+
+
+def score_model(model, X_val, y_val, profile_rows: int = 256, batch_sizes=(1,)) -> Dict:
+    """
+    Accuracy/precision/recall/F1, p99 latency and serialized size of ``model``.
+
+    ``latency_p99`` is measured at the smallest of ``batch_sizes``; the
+    whole sweep is returned under ``"profile"``.
+    """
+    scores = ConfusionAccumulator().update(y_val, model.predict(X_val)).metrics()
+    profile = profile_inference(model, X_val[:profile_rows], batch_sizes=batch_sizes,
+                                warmup_runs=1, repeats=5)
+    scores["latency_p99"] = profile[min(profile)]["latency_p99"] if profile else None
+    scores["model_size_bytes"] = len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    scores["profile"] = profile
+    return scores
+
+
+def _compile_gains(compiled_profile: Dict, baseline_profile: Dict) -> Dict:
+    """Per-batch-size p99 speedups of the compiled model and its throughput ratio."""
+    by_batch = {
+        str(size): baseline_profile[size]["latency_p99"] / compiled_profile[size]["latency_p99"]
+        for size in compiled_profile
+        if size in baseline_profile and compiled_profile[size]["latency_p99"] > 0
+    }
+    def best(profile):
+        return max(p["rows_per_second"] for p in profile.values())
+
+    return {
+        # The worst batch size, so a large-batch slowdown is not hidden by a 1-row win
+        "compile_speedup": min(by_batch.values()) if by_batch else None,
+        "compile_speedup_by_batch": by_batch,
+        "compile_throughput_speedup": (
+            best(compiled_profile) / best(baseline_profile)
+            if compiled_profile and baseline_profile else None
+        )
+    }
+
+
+def train_and_score(spec: Dict, X_train, y_train, X_val, y_val, neighbors=None) -> Dict:
+    """
+    Fit the candidate on the training split and score it on the validation split.
+
+    Compiled candidates are also scored uncompiled, over the Trawler's
+    batch-size sweep, to report what the compilation bought and cost.
+    ``neighbors`` is passed on to ``prepare_training_data``.
+
+    Returns:
+        dict: Validation metrics plus ``fit_seconds``, ``latency_p99`` and
+        ``model_size_bytes``; for compiled candidates also
+        ``compile_speedup`` (uncompiled over compiled p99 latency at the
+        least favourable batch size), ``compile_speedup_by_batch``,
+        ``compile_throughput_speedup`` (ratio of best rows per second) and
+        ``compile_accuracy_delta`` (compiled minus uncompiled accuracy)
+    """
+    start = time.perf_counter()
+    model = fit_estimator(spec, X_train, y_train, neighbors)
+    fit_seconds = time.perf_counter() - start
+
+    if spec.get("compile") is None:
+        scores = score_model(model, X_val, y_val)
+        del scores["profile"]
+        scores["fit_seconds"] = fit_seconds
+        return scores
+
+    start = time.perf_counter()
+    compiled = compile_forest(model, **spec["compile"])
+    fit_seconds += time.perf_counter() - start
+    scores = score_model(compiled, X_val, y_val, batch_sizes=DEFAULT_BATCH_SIZES)
+    baseline = score_model(model, X_val, y_val, batch_sizes=DEFAULT_BATCH_SIZES)
+    scores.update(_compile_gains(scores.pop("profile"), baseline["profile"]))
+    scores["fit_seconds"] = fit_seconds
+    scores["compile_accuracy_delta"] = scores["accuracy"] - baseline["accuracy"]
+    return scores
+
+
+def holdout_split(n_rows: int, validation_fraction: float = 0.25, random_state: int = 0):
+    """Return shuffled train/validation row indices."""
+    if not 0 < validation_fraction < 1:
+        raise ValueError("validation_fraction must be in (0, 1)")
+    order = np.random.default_rng(random_state).permutation(n_rows)
+    n_val = max(1, int(round(n_rows * validation_fraction)))
+    return np.sort(order[n_val:]), np.sort(order[:n_val])
+
+
+def stratified_folds(labels, n_folds: int = 5, random_state: int = 0):
+    """
+    Assign rows to ``n_folds`` class-stratified folds.
+
+    Returns:
+        tuple: ``order`` (row indices grouped fold by fold) and ``bounds``
+        (``n_folds + 1`` offsets into ``order``), so fold ``f`` is
+        ``order[bounds[f]:bounds[f + 1]]``
+    """
+    if n_folds < 2:
+        raise ValueError("n_folds must be at least 2")
+    labels = np.asarray(labels)
+    rng = np.random.default_rng(random_state)
+
+    shuffled = rng.permutation(len(labels))
+    # Stable sort by class keeps the shuffle within each class; dealing the
+    # sorted rows round-robin then spreads every class evenly over the folds
+    by_class = shuffled[np.argsort(labels[shuffled], kind="stable")]
+    fold_of = np.empty(len(labels), dtype=np.int64)
+    fold_of[by_class] = np.arange(len(labels)) % n_folds
+
+    order = np.argsort(fold_of, kind="stable")
+    bounds = np.searchsorted(fold_of[order], np.arange(n_folds + 1))
+    return order, bounds
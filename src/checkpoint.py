@@ -0,0 +1,193 @@
+# src/checkpoint.py
+"""
+Checkpoint module for an append-only, compacting log of completed cycles.
+"""
+
+import json
+import os
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+def _to_json(value):
+    """Fallback encoder for NumPy values found in cycle results."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _encode(record: Dict) -> bytes:
+    return (json.dumps(record, default=_to_json, separators=(",", ":")) + "\n").encode()
+
+
+class CheckpointLog:
+    """
+    JSON Lines log holding one snapshot followed by the cycles since.
+
+    Every completed cycle costs one appended line and one ``fsync``. After
+    ``snapshot_every`` cycles the caller compacts the log: it is atomically
+    replaced by a single snapshot of the current state. The file therefore
+    stays bounded, and ``load`` reads one snapshot plus at most
+    ``snapshot_every`` cycles however long the framework has been running.
+
+    With ``background=True`` the snapshot is encoded and written on a
+    worker thread while cycles keep being appended to the old log; the
+    cycles appended meanwhile are copied after the snapshot before the
+    swap, so the file on disk is complete at every moment.
+    """
+
+    def __init__(self, path: str = "neurocortex_checkpoint.jsonl",
+                 snapshot_every: int = 100, fsync: bool = True):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.cycles_since_snapshot = 0
+        self.compaction_error = None  # why the last background compaction failed
+        self._file = None
+        self._lock = threading.Lock()
+        self._tail = None  # lines appended while a background compaction runs
+        self._compaction = None
+
+    def _open(self):
+        if self._file is None:
+            # Count what is already there and cut off a torn final line
+            self.cycles_since_snapshot = len(self.load()[1])
+            self._file = open(self.path, "ab")
+        return self._file
+
+    def _sync(self, f):
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    @property
+    def compaction_due(self) -> bool:
+        return self.cycles_since_snapshot >= self.snapshot_every
+
+    @property
+    def compacting(self) -> bool:
+        return self._compaction is not None and self._compaction.is_alive()
+
+    def append(self, cycle: Dict):
+        """Durably append one completed cycle."""
+        line = _encode({"type": "cycle", "cycle": cycle})
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            self._sync(f)
+            if self._tail is not None:
+                self._tail.append(line)
+            self.cycles_since_snapshot += 1
+
+    def compact(self, state: Dict, background: bool = False):
+        """
+        Atomically replace the log with a single snapshot of ``state``.
+
+        Args:
+            state: JSON-serializable state; with ``background`` it is encoded
+                later, so the caller must not mutate it afterwards
+            background: Return at once and write the snapshot on a worker
+                thread; ignored while an earlier compaction is still running
+        """
+        if not background:
+            self.wait()
+            with self._lock:
+                self._tail = []
+            self._replace(state)
+            return
+        if self.compacting:
+            return
+        with self._lock:
+            self._tail = []
+            self.cycles_since_snapshot = 0
+        self._compaction = threading.Thread(
+            target=self._replace, args=(state,), name="srdf-checkpoint", daemon=True
+        )
+        self._compaction.start()
+
+    def _replace(self, state: Dict):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_encode({"type": "snapshot", "state": state}))
+                self._sync(f)
+                with self._lock:
+                    # Cycles appended while the snapshot was written follow it
+                    tail, self._tail = self._tail, None
+                    f.writelines(tail)
+                    self._sync(f)
+                    if self._file is not None:
+                        self._file.close()
+                        self._file = None
+                    os.replace(tmp_path, self.path)
+                    self._sync_directory()
+                    self._file = open(self.path, "ab")
+                    self.cycles_since_snapshot = len(tail)
+        except Exception as exc:
+            # The old log still holds every cycle; only the compaction is lost
+            with self._lock:
+                self._tail = None
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if threading.current_thread() is not self._compaction:
+                raise
+            self.compaction_error = exc
+
+    def _sync_directory(self):
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def wait(self):
+        """Block until a background compaction has finished."""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+    def load(self) -> Tuple[Optional[Dict], List[Dict]]:
+        """
+        Read the log.
+
+        A final line left incomplete by a crash is discarded (and truncated
+        away, so later appends start on a clean line).
+
+        Returns:
+            tuple: ``(snapshot_state, cycles)``; the state is None if the
+            log has not been compacted yet
+        """
+        if not os.path.exists(self.path):
+            return None, []
+
+        state, cycles = None, []
+        good_bytes = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                good_bytes += len(line)
+                if record["type"] == "snapshot":
+                    state, cycles = record["state"], []
+                else:
+                    cycles.append(record["cycle"])
+
+        if good_bytes < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good_bytes)
+        return state, cycles
+
+    def close(self):
+        self.wait()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
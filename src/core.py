@@ -4,12 +4,45 @@ Core module for the NeuroCortex SRDF framework.
 Main orchestrator of the Trawler-Generator-Arbiter cycle.
 """
 
-import time
+import asyncio
 import json
+import pickle
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .trawler import Trawler
 from .generator import Generator
 from .arbiter import Arbiter
+from .artifacts import ArtifactStore
+from .cache import FitnessCache, fingerprint_dataset
+from .candidates import fit_candidate
+from .checkpoint import CheckpointLog
+from .data import iter_chunks, open_array
+from .deployment import STATE_PROBATION, STATE_SHADOW, ModelDeployment
+from .executor import DEFAULT_TIMEOUT, CandidateExecutor
+from .fleet import ModelFleet
+from .history import DEFAULT_HISTORY_SIZE, HistoryStore
+from .pipeline import CyclePipeline
+from .scheduler import TRIGGER_DRIFT, TRIGGER_MANUAL, TRIGGER_METRIC, CycleScheduler
+from .telemetry import Telemetry
+
+def _summarize_cycle(cycle):
+    """Numeric fields kept for cycles evicted from the history."""
+    return {
+        "duration_seconds": cycle["duration_seconds"],
+        "selected_score": (cycle["selected_solution"] or {}).get("validation_score")
+    }
+
+def _require_no_running_loop(method, coroutine):
+    """``asyncio.run`` cannot nest: point callers inside a loop at the coroutine."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(f"{method}() cannot be called from a running event loop; "
+                       f"use 'await framework.{coroutine}(...)' instead")
 
 class SRDFFramework:
     """
@@ -17,25 +50,119 @@ class SRDFFramework:
     Orchestrates the continuous improvement cycle.
     """
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, executor=None, telemetry=None):
         self.config = config or self._default_config()
-        self.trawler = Trawler()
-        self.generator = Generator()
+        self.telemetry = telemetry or Telemetry(
+            enabled=self.config.get("telemetry", True),
+            trace_memory=self.config.get("telemetry_trace_memory", False)
+        )
+        if self.config.get("metrics_port") is not None:
+            self.telemetry.serve(self.config["metrics_port"])
+        history_size = self.config.get("history_size", DEFAULT_HISTORY_SIZE)
+        progressive = {
+            "fraction": self.config.get("progressive_sample_fraction"),
+            "growth": self.config.get("progressive_growth", 4.0),
+            "min_rows": self.config.get("progressive_min_rows", 1000)
+        }
+        self.trawler = Trawler(
+            history_size=history_size, window_size=self.config.get("stream_window_size"),
+            sample_fraction=progressive["fraction"], sample_growth=progressive["growth"],
+            min_sample_rows=progressive["min_rows"]
+        )
+        # Serializes Trawler access between observe() and a running cycle
+        self._trawler_lock = threading.Lock()
+        self.generator = Generator(history_size=history_size)
+        cache_path = self.config.get("fitness_cache_path")
+        self.executor = executor or CandidateExecutor(
+            max_workers=self.config.get("candidate_workers"),
+            timeout=self.config.get("candidate_timeout", DEFAULT_TIMEOUT),
+            cache=FitnessCache(
+                cache_path, max_entries=self.config.get("fitness_cache_entries", 10000)
+            ) if cache_path else None,
+            telemetry=self.telemetry
+        )
         self.arbiter = Arbiter(
-            validation_threshold=self.config.get("validation_threshold", 0.8)
+            validation_threshold=self.config.get("validation_threshold", 0.8),
+            history_size=history_size,
+            executor=self.executor,
+            cv_folds=self.config.get("cv_folds", 5),
+            latency_budget=self.config.get("latency_budget"),
+            size_budget=self.config.get("size_budget"),
+            progressive_fraction=progressive["fraction"],
+            progressive_growth=progressive["growth"],
+            progressive_min_rows=progressive["min_rows"]
         )
         
         self.cycle_count = 0
-        self.cycle_history = []
+        self.cycle_history = HistoryStore(history_size, summarize=_summarize_cycle)
         self.is_running = False
+        self.pipeline = None
+        self._loop = None
+        self.deployment = None  # created around the first model a cycle sees
+        artifact_path = self.config.get("artifact_store_path")
+        self.artifacts = ArtifactStore(
+            artifact_path, max_bytes=self.config.get("artifact_store_max_bytes")
+        ) if artifact_path else None
+        self._artifact_ids = weakref.WeakKeyDictionary()  # stored model -> digest
+        checkpoint_path = self.config.get("checkpoint_path")
+        self.checkpoint = CheckpointLog(
+            checkpoint_path, snapshot_every=self.config.get("checkpoint_snapshot_every", 100)
+        ) if checkpoint_path else None
+        self.scheduler = CycleScheduler(
+            interval=self.config.get("cycle_interval", 3600),
+            debounce=self.config.get("trigger_debounce", 60.0)
+        )
+        self.fleet = ModelFleet(
+            self,
+            max_concurrent=self.config.get("fleet_max_concurrent"),
+            cycle_interval=self.config.get("cycle_interval", 3600),
+            severity_weight=self.config.get("fleet_severity_weight", 10.0)
+        )
     
-    def _default_config(self):
+    @staticmethod
+    def _default_config():
         """Return default configuration."""
         return {
             "cycle_interval": 3600,  # 1 hour between cycles
+            "trigger_debounce": 60.0,  # min seconds between event-triggered cycles
+            "accuracy_drop_trigger": 0.05,  # observed accuracy drop that triggers a cycle
+            "stream_window_size": None,  # rows kept by observe() for metric triggers
+            "pipelined": False,  # overlap the phases of consecutive cycles
+            "pipeline_queue_size": 1,  # cycles buffered between pipeline stages
+            "fleet_max_concurrent": None,  # fleet cycles in flight (default: half the CPUs)
+            "fleet_severity_weight": 10.0,  # how strongly regressions jump the fleet queue
             "validation_threshold": 0.8,
             "max_cycles": 100,
             "performance_metrics": ["accuracy", "precision", "recall", "f1_score"],
+            "history_size": DEFAULT_HISTORY_SIZE,  # records kept verbatim per history
+            "evaluate_candidates": True,  # train and score proposals before validation
+            "candidate_workers": None,  # defaults to the CPU count
+            "candidate_timeout": DEFAULT_TIMEOUT,
+            "candidate_evaluation": "cv",  # "cv", "holdout" or "halving" (race, then CV)
+            "cv_folds": 5,
+            "progressive_sample_fraction": None,  # e.g. 0.01: start analysis/CV on 1% of rows
+            "progressive_growth": 4.0,  # sample growth while intervals are undecided
+            "progressive_min_rows": 1000,  # smallest progressive sample
+            "surrogate_prescreen": True,  # skip candidates predicted to fail validation
+            "latency_budget": None,  # max p99 seconds for a selected candidate
+            "size_budget": None,  # max serialized model bytes
+            "fitness_cache_path": None,  # e.g. "neurocortex_fitness_cache.sqlite"
+            "fitness_cache_entries": 10000,
+            "deploy_solutions": True,  # shadow-test and hot-swap selected candidates
+            "shadow_fraction": 0.25,  # share of predict() batches mirrored to a shadow
+            "shadow_min_rows": 500,  # mirrored rows before promoting or rolling back
+            "shadow_replay_rows": 2000,  # recent rows replayed to a freshly staged candidate
+            "rollback_accuracy_tolerance": 0.01,
+            "rollback_latency_tolerance": 0.25,  # per-row slowdown vs. the live model / shadow measurement
+            "artifact_store_path": None,  # e.g. "neurocortex_artifacts"
+            "artifact_store_max_bytes": None,  # GC threshold for unreferenced models
+            "checkpoint_path": None,  # e.g. "neurocortex_checkpoint.jsonl"
+            "checkpoint_snapshot_every": 100,  # cycles between log compactions
+            "telemetry": True,  # phase/candidate spans and counters (False: no-op)
+            "telemetry_trace_memory": False,  # per-phase Python heap peaks via tracemalloc
+            "metrics_path": None,  # e.g. "srdf.prom", rewritten after every cycle
+            "metrics_format": "prometheus",  # or "openmetrics"
+            "metrics_port": None,  # e.g. 9464 to serve GET /metrics
             "log_level": "info"
         }
     
@@ -43,6 +170,10 @@ class SRDFFramework:
         """
         Start the autonomous evolution process.
         
+        Blocks until ``max_cycles`` cycles have run or ``stop_evolution`` is
+        called (from another thread or a signal handler). See
+        ``run_evolution`` for use inside a running event loop.
+        
         Args:
             initial_model: Initial machine learning model
             data: Training/validation data
@@ -50,76 +181,570 @@ class SRDFFramework:
             
         Returns:
             Evolution results
+            
+        Raises:
+            RuntimeError: When called from a running event loop
         """
+        _require_no_running_loop("start_evolution", "run_evolution")
+        self.scheduler.reset()
+        return asyncio.run(self._evolve(initial_model, data, labels))
+    
+    async def run_evolution(self, initial_model=None, data=None, labels=None):
+        """
+        Run the evolution process on the current event loop.
+        
+        Cycles are started by ``self.scheduler``: on the ``cycle_interval``
+        timer, or earlier on manual, metric and drift triggers. Each blocking
+        phase runs in a worker thread so the loop stays responsive.
+        
+        Returns:
+            Evolution results
+        """
+        self.scheduler.reset()
+        return await self._evolve(initial_model, data, labels)
+    
+    async def _evolve(self, initial_model, data, labels):
         self.is_running = True
         results = []
         
         print("🚀 Starting NeuroCortex SRDF Evolution...")
         print(f"📊 Configuration: {json.dumps(self.config, indent=2)}")
         
-        for cycle in range(self.config["max_cycles"]):
-            if not self.is_running:
-                break
-                
-            cycle_result = self._run_cycle(cycle, initial_model, data, labels)
+        def report(cycle_result):
             results.append(cycle_result)
-            
-            print(f"🔄 Cycle {cycle + 1}/{self.config['max_cycles']} completed")
-            print(f"   Selected: {cycle_result['selected_solution']['proposed_solution']}")
-            
-            time.sleep(self.config["cycle_interval"])
+            triggers = cycle_result["triggers"]
+            print(f"🔄 Cycle {len(results)}/{self.config['max_cycles']} completed ({', '.join(triggers)})")
+            selected = cycle_result["selected_solution"]
+            print(f"   Selected: {selected['proposed_solution'] if selected else 'nothing (no issues found)'}")
+        
+        if self.config.get("pipelined", False):
+            await self._run_pipelined(initial_model, data, labels, report)
+            return results
+        
+        first_cycle = self.cycle_count
+        
+        async def cycle(n, triggers):
+            cycle_result = await self._run_cycle_async(
+                pool, first_cycle + n, initial_model, data, labels, triggers
+            )
+            report(cycle_result)
+            return cycle_result
+        
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="srdf-cycle")
+        try:
+            await self.scheduler.run(cycle, self.config["max_cycles"])
+        finally:
+            try:
+                # A phase interrupted by stop_evolution cannot be killed; its
+                # cycle is discarded, but wait (off the loop) until it has
+                # finished so it never mutates shared state behind a later run
+                await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+            finally:
+                self.is_running = False
         
         return results
     
-    def _run_cycle(self, cycle_number, model, data, labels):
-        """Execute one complete SRDF cycle."""
-        cycle_start = datetime.now()
+    async def _run_pipelined(self, model, data, labels, report):
+        """
+        Run cycles through a ``CyclePipeline``, one stage per phase.
         
-        # Phase 1: Trawler Analysis
-        analysis_results = self.trawler.analyze_performance(model, data, labels)
+        The scheduler admits a cycle as soon as the analysis stage has room,
+        so the Trawler analyses cycle N+1 while the Arbiter still validates
+        cycle N. Cycles complete, and are recorded, in order. The scheduler
+        sees a cycle as done once it is admitted, so ``cycle_interval``
+        spaces admissions here, not completions; triggers fired meanwhile
+        are served as soon as the analysis stage has room.
+        """
+        def finish(item):
+            cycle_result, cycle_start = item
+            report(self._finish_cycle(cycle_result, cycle_start))
         
-        # Phase 2: Generator Proposals
-        solutions = self.generator.propose_solutions(analysis_results)
+        stages = [
+            (name, lambda item, phase=phase: phase(item[0]))
+            for name, phase in self._cycle_phases(model, data, labels)
+        ]
+        self.pipeline = CyclePipeline(
+            stages, queue_size=self.config.get("pipeline_queue_size", 1), on_complete=finish
+        )
         
-        # Phase 3: Arbiter Validation
-        current_performance = analysis_results.get("performance_metrics", {})
-        validation_results = self.arbiter.validate_solutions(solutions, current_performance)
+        first_cycle = self.cycle_count
         
-        # Phase 4: Implementation (simulated)
-        implementation_result = self._implement_solution(
-            validation_results["selected_solution"]
-        )
+        async def admit(n, triggers):
+            await self.pipeline.submit((self._new_cycle(first_cycle + n, triggers), datetime.now()))
+        
+        self._loop = asyncio.get_running_loop()
+        self.pipeline.start()
+        try:
+            await self.scheduler.run(admit, self.config["max_cycles"])
+            if not self.scheduler.stopped:
+                await self.pipeline.drain()
+        except asyncio.CancelledError:
+            # stop_evolution cancelled the stage workers while draining
+            if not self.scheduler.stopped:
+                raise
+        finally:
+            self._loop = None
+            self.pipeline.cancel()
+            try:
+                await self.pipeline.join()
+            finally:
+                self.is_running = False
+    
+    def register_model(self, name, model, data=None, labels=None, weight=1.0):
+        """
+        Add a model to the fleet evolved by ``start_fleet``.
+        
+        Args:
+            name: Unique model name (e.g. the tenant)
+            model: The model to evolve
+            data: Its analysis data; identical datasets are stored once
+            labels: Corresponding labels
+            weight: Fair-share weight (2.0 gets twice the cycle time of 1.0)
+        """
+        return self.fleet.register(name, model, data, labels, weight)
+    
+    def start_fleet(self, max_cycles=None):
+        """
+        Evolve every registered model, sharing this framework's worker pool.
+        
+        Args:
+            max_cycles: Total cycles across the fleet (default ``max_cycles``
+                per registered model)
+            
+        Returns:
+            list: ``{"model", "cycle"}`` records in completion order
+            
+        Raises:
+            RuntimeError: When called from a running event loop
+        """
+        _require_no_running_loop("start_fleet", "run_fleet")
+        self.fleet.reset()
+        return asyncio.run(self._evolve_fleet(max_cycles))
+    
+    async def run_fleet(self, max_cycles=None):
+        """Evolve every registered model on the current event loop (see ``start_fleet``)."""
+        self.fleet.reset()
+        return await self._evolve_fleet(max_cycles)
+    
+    async def _evolve_fleet(self, max_cycles):
+        if max_cycles is None:
+            max_cycles = self.config["max_cycles"] * len(self.fleet.members)
+        self.is_running = True
+        try:
+            return await self.fleet.run(max_cycles)
+        finally:
+            self.is_running = False
+    
+    def trigger_cycle(self, reason=TRIGGER_MANUAL):
+        """Request a cycle now instead of waiting for the interval (thread-safe)."""
+        self.scheduler.trigger(reason)
+    
+    def observe(self, model, data, labels=None):
+        """
+        Feed live labelled traffic to the Trawler and fire event triggers.
         
-        cycle_result = {
+        Once a deployment exists the traffic is served through it, so the
+        labels also drive shadow comparison and automatic rollback.
+        A ``"metric"`` trigger fires when the window's accuracy has dropped
+        ``accuracy_drop_trigger`` below the last cycle's analysis; a
+        ``"drift"`` trigger fires when any feature drifted from the reference.
+        Requires the ``stream_window_size`` config key.
+        
+        Returns:
+            int: Number of rows added to the window
+        """
+        served = self.deployment if self.deployment is not None else model
+        with self._trawler_lock:
+            n_rows = self.trawler.observe(served, data, labels)
+            window_accuracy = self.trawler.window.metrics().get("accuracy")
+            detector = self.trawler.drift_detector
+            drifted = detector.drifted_features() if detector is not None else []
+        
+        if len(self.cycle_history) and window_accuracy is not None:
+            baseline = self.cycle_history[-1]["analysis_results"]["performance_metrics"].get("accuracy")
+            if baseline is not None and baseline - window_accuracy >= self.config.get("accuracy_drop_trigger", 0.05):
+                self.scheduler.trigger(TRIGGER_METRIC)
+        if drifted:
+            self.scheduler.trigger(TRIGGER_DRIFT)
+        return n_rows
+    
+    def _cycle_phases(self, model, data, labels):
+        """The named blocking phases of one cycle, in order; each fills in the cycle dict."""
+        phases = [
+            ("analyze", lambda cycle: self._analyze(cycle, model, data, labels)),
+            ("propose", self._propose),
+            ("evaluate", lambda cycle: self._evaluate(cycle, data, labels)),
+            ("validate", lambda cycle: self._validate(cycle, data, labels)),
+            ("implement", lambda cycle: self._implement(cycle, model, data, labels))
+        ]
+        return [(name, self._timed_phase(name, phase)) for name, phase in phases]
+    
+    def _timed_phase(self, name, phase):
+        """Wrap ``phase`` in a telemetry span and record its time in the cycle."""
+        def run(cycle):
+            start = time.perf_counter()
+            with self.telemetry.span(name, memory=True):
+                phase(cycle)
+            cycle.setdefault("phase_seconds", {})[name] = time.perf_counter() - start
+        return run
+    
+    def _new_cycle(self, cycle_number, triggers):
+        return {
             "cycle_number": cycle_number,
-            "start_time": cycle_start.isoformat(),
-            "duration_seconds": (datetime.now() - cycle_start).total_seconds(),
-            "analysis_results": analysis_results,
-            "proposed_solutions": solutions,
-            "validation_results": validation_results,
-            "implementation_result": implementation_result,
-            "selected_solution": validation_results["selected_solution"]
+            "start_time": datetime.now().isoformat(),
+            "triggers": list(triggers or [])
         }
-        
+    
+    def _run_cycle(self, cycle_number, model, data, labels, triggers=None):
+        """Execute one complete SRDF cycle."""
+        cycle_start = datetime.now()
+        cycle_result = self._new_cycle(cycle_number, triggers)
+        for _, phase in self._cycle_phases(model, data, labels):
+            phase(cycle_result)
+        return self._finish_cycle(cycle_result, cycle_start)
+    
+    async def _run_cycle_async(self, pool, cycle_number, model, data, labels, triggers=None):
+        """Execute one cycle with every phase in ``pool``; cancellable between phases."""
+        loop = asyncio.get_running_loop()
+        cycle_start = datetime.now()
+        cycle_result = self._new_cycle(cycle_number, triggers)
+        for _, phase in self._cycle_phases(model, data, labels):
+            await loop.run_in_executor(pool, phase, cycle_result)
+        return self._finish_cycle(cycle_result, cycle_start)
+    
+    def _analyze(self, cycle, model, data, labels):
+        """Phase 1: Trawler Analysis"""
+        if self.deployment is not None:
+            model = self.deployment.live  # analyse whatever is being served now
+        with self._trawler_lock:
+            cycle["analysis_results"] = self.trawler.analyze_performance(model, data, labels)
+    
+    def _propose(self, cycle):
+        """Phase 2: Generator Proposals"""
+        cycle["proposed_solutions"] = self.generator.propose_solutions(cycle["analysis_results"])
+    
+    def _evaluate(self, cycle, data, labels):
+        """Phase 2b: Train and score executable proposals concurrently"""
+        solutions = cycle["proposed_solutions"]
+        evaluation_report = None
+        cross_validate = False
+        fingerprint = None
+        if self.config.get("evaluate_candidates", True) and data is not None and labels is not None:
+            current_performance = cycle["analysis_results"].get("performance_metrics", {})
+            to_train = solutions
+            if self.config.get("surrogate_prescreen", True):
+                to_train = self.arbiter.prescreen(solutions, current_performance)
+            
+            mode = self.config.get("candidate_evaluation", "cv")
+            if mode != "holdout" or self.executor.cache is not None:
+                # Hashed once here for the cache, racing and validation alike
+                fingerprint = fingerprint_dataset(open_array(data), open_array(labels))
+            if mode == "holdout":
+                self.executor.evaluate(to_train, data, labels, fingerprint=fingerprint)
+            else:
+                if mode == "halving":
+                    evaluation_report = self.arbiter.race_solutions(to_train, data, labels,
+                                                                    fingerprint=fingerprint)
+                cross_validate = True
+        cycle["evaluation_report"] = evaluation_report
+        cycle["cross_validated"] = cross_validate
+        cycle["data_fingerprint"] = fingerprint
+    
+    def _validate(self, cycle, data, labels):
+        """Phase 3: Arbiter Validation (k-fold CV of the remaining candidates)"""
+        current_performance = cycle["analysis_results"].get("performance_metrics", {})
+        cv_data, cv_labels = (data, labels) if cycle["cross_validated"] else (None, None)
+        validation_results = self.arbiter.validate_solutions(
+            cycle["proposed_solutions"], current_performance, cv_data, cv_labels,
+            fingerprint=cycle["data_fingerprint"]
+        )
+        cycle["validation_results"] = validation_results
+        cycle["selected_solution"] = validation_results["selected_solution"]
+    
+    def _implement(self, cycle, model, data, labels):
+        """Phase 4: Implementation (shadow deployment and hot-swap)"""
+        cycle["implementation_result"] = self._implement_solution(
+            cycle["selected_solution"], model, data, labels
+        )
+    
+    def _finish_cycle(self, cycle_result, cycle_start):
+        cycle_result["duration_seconds"] = (datetime.now() - cycle_start).total_seconds()
         self.cycle_count += 1
         self.cycle_history.append(cycle_result)
-        
+        if self.checkpoint is not None:
+            self.checkpoint.append(cycle_result)
+            if self.checkpoint.compaction_due:
+                # Written on a worker thread; cycles appended meanwhile are kept
+                self.checkpoint.compact(self._checkpoint_state(), background=True)
+        if self.telemetry.enabled:
+            self._record_cycle_telemetry(cycle_result)
         return cycle_result
     
-    def _implement_solution(self, solution):
-        """Simulate solution implementation."""
-        # In a real implementation, this would actually modify the model
+    def _record_cycle_telemetry(self, cycle):
+        """Fold one finished cycle into the telemetry counters and export them."""
+        telemetry = self.telemetry
+        telemetry.record_span("cycle", cycle["duration_seconds"])
+        telemetry.count("cycles")
+        
+        selected = cycle.get("selected_solution")
+        for solution in cycle.get("validation_results", {}).get("validated_solutions", []):
+            measured = solution.get("cross_validation") or solution.get("evaluation") or {}
+            status = measured.get("status")
+            if measured.get("cached"):
+                telemetry.count("fitness_cache_hits")
+            elif status in ("ok", "eliminated"):
+                telemetry.count("candidates_evaluated")
+            
+            if status == "skipped":
+                telemetry.count("candidates_rejected", reason="surrogate")
+            elif status == "eliminated":
+                telemetry.count("candidates_rejected", reason="halving")
+            elif status in ("error", "timeout"):
+                telemetry.count("candidates_rejected", reason="failed")
+            elif not solution.get("is_valid"):
+                telemetry.count("candidates_rejected", reason="validation")
+        if selected is not None and (cycle.get("implementation_result") or {}).get("status") == "rejected":
+            telemetry.count("candidates_rejected", reason="shadow")
+        
+        if self.config.get("metrics_path"):
+            telemetry.write(self.config["metrics_path"], self.config.get("metrics_format", "prometheus"))
+    
+    def _checkpoint_state(self):
         return {
-            "status": "success",
-            "implementation_time": random.uniform(1.0, 5.0),
-            "changes_applied": True,
-            "rollback_possible": True,
-            "notes": f"Implemented {solution['proposed_solution']}"
+            "cycle_count": self.cycle_count,
+            "cycle_history": self.cycle_history.state(),
+            "save_time": datetime.now().isoformat()
         }
     
+    def resume(self, path=None):
+        """
+        Rebuild framework state from a checkpoint log.
+        
+        Loads the latest snapshot and replays only the cycles logged after
+        it. The retained cycles are also replayed into the Trawler and
+        Arbiter histories, so e.g. the Arbiter's surrogate picks up where it
+        left off.
+        
+        Args:
+            path: Checkpoint log (defaults to the ``checkpoint_path`` config key)
+            
+        Returns:
+            int: The restored cycle count
+        """
+        log = self.checkpoint if path is None else CheckpointLog(path)
+        if log is None:
+            raise ValueError("no checkpoint_path configured")
+        state, cycles = log.load()
+        
+        if state is not None:
+            self.cycle_count = state["cycle_count"]
+            self.cycle_history.load_state(state["cycle_history"])
+        else:
+            self.cycle_count = 0
+            self.cycle_history.clear()
+        for cycle in cycles:
+            self.cycle_history.append(cycle)
+            self.cycle_count += 1
+        
+        self.trawler.analysis_history.clear()
+        self.arbiter.validation_history.clear()
+        for cycle in self.cycle_history:
+            self.trawler.analysis_history.append(cycle["analysis_results"])
+            self.arbiter.validation_history.append(cycle["validation_results"])
+        
+        print(f"♻️ Resumed at cycle {self.cycle_count} from {log.path}")
+        return self.cycle_count
+    
+    def predict(self, X, y=None):
+        """Serve predictions from the deployed model (labels, if known, feed the shadow)."""
+        if self.deployment is None:
+            raise RuntimeError("no model deployed yet; run a cycle first")
+        return self.deployment.predict(X, y)
+    
+    def _store_artifact(self, model):
+        """Persist a model in the artifact store; None if disabled or unpicklable."""
+        if self.artifacts is None:
+            return None
+        try:
+            digest = self.artifacts.put(model)
+        except (pickle.PicklingError, TypeError, AttributeError, BufferError):
+            return None
+        if self.artifacts.max_bytes is not None:
+            self.artifacts.collect(self._referenced_artifacts() | {digest})
+        self._remember_artifact(model, digest)
+        return digest
+    
+    def _remember_artifact(self, model, digest):
+        try:
+            self._artifact_ids[model] = digest
+        except TypeError:
+            pass  # not weak-referenceable; its refs are dropped instead
+    
+    def _pin_deployment(self, event):
+        """Deployment hook: point the "live"/"previous" refs at the models now in place."""
+        if self.artifacts is None or event not in ("promoted", "rolled_back", "replaced"):
+            return
+        for name, model in (("live", self.deployment.live), ("previous", self.deployment.previous)):
+            try:
+                digest = self._artifact_ids.get(model)
+            except TypeError:
+                digest = None
+            self.artifacts.pin(name, digest)
+    
+    def _referenced_artifacts(self):
+        """Artifacts named by retained cycles, which must survive garbage collection."""
+        return {
+            cycle["implementation_result"].get("artifact")
+            for cycle in self.cycle_history
+        } - {None}
+    
+    def load_artifact(self, digest):
+        """Load a stored model (arrays memory-mapped) without retraining it."""
+        if self.artifacts is None:
+            raise RuntimeError("no artifact_store_path configured")
+        model = self.artifacts.get(digest)
+        self._remember_artifact(model, digest)
+        return model
+    
+    def redeploy(self, digest, shadow=True):
+        """
+        Bring a stored model back, e.g. a past winner.
+        
+        Args:
+            digest: Artifact id (``implementation_result["artifact"]``)
+            shadow: Stage it for shadow evaluation (default) or swap it in at once
+        """
+        model = self.load_artifact(digest)
+        if self.deployment is None:
+            self._deployment_for(model)
+        elif shadow:
+            self.deployment.stage(model)
+        else:
+            self.deployment.replace(model)
+        return self.deployment.report()
+    
+    def _deployment_for(self, model):
+        if self.deployment is None and model is not None:
+            if self.artifacts is not None:
+                self.artifacts.pin("live", self._store_artifact(model))
+            self.deployment = ModelDeployment(
+                model,
+                shadow_fraction=self.config.get("shadow_fraction", 0.25),
+                min_shadow_rows=self.config.get("shadow_min_rows", 500),
+                accuracy_tolerance=self.config.get("rollback_accuracy_tolerance", 0.01),
+                latency_tolerance=self.config.get("rollback_latency_tolerance", 0.25),
+                max_row_latency=self.config.get("latency_budget"),
+                on_change=self._pin_deployment
+            )
+        return self.deployment
+    
+    def _implement_solution(self, solution, model=None, data=None, labels=None):
+        """
+        Deploy the selected solution behind a shadow evaluation.
+        
+        The candidate is fitted on all but the most recent rows, staged next
+        to the live model and fed those recent rows as mirrored traffic. The
+        deployment promotes it with an atomic swap if it holds up against
+        the live model, and rolls back later if it regresses on live traffic.
+        A promotion still in probation is first judged on those recent rows;
+        nothing new is staged until it has been committed or rolled back.
+        """
+        start = time.perf_counter()
+        replay = None
+        if data is not None and labels is not None:
+            X, y = open_array(data), open_array(labels)
+            n_replay = min(self.config.get("shadow_replay_rows", 2000), len(y) // 4)
+            replay = (X[len(y) - n_replay:], y[len(y) - n_replay:])
+        deployment = self.deployment
+        if deployment is not None and deployment.state == STATE_PROBATION and replay is not None:
+            self._replay(deployment, *replay)
+        
+        if solution is None:
+            return {
+                "status": "skipped",
+                "changes_applied": False,
+                "notes": "No solution selected"
+            }
+        
+        if not solution.get("is_valid", True):
+            return {
+                "status": "skipped",
+                "changes_applied": False,
+                "notes": f"{solution['proposed_solution']} did not pass validation (selection fallback)"
+            }
+        
+        deployment = self._deployment_for(model)
+        spec = solution.get("candidate")
+        if (not self.config.get("deploy_solutions", True) or spec is None
+                or deployment is None or replay is None):
+            return {
+                "status": "skipped",
+                "changes_applied": False,
+                "notes": f"{solution['proposed_solution']} has no deployable candidate"
+            }
+        if n_replay == 0:
+            return {
+                "status": "skipped",
+                "changes_applied": False,
+                "notes": f"{solution['proposed_solution']} needs at least 4 rows to replay in shadow"
+            }
+        if deployment.state == STATE_PROBATION:
+            return {
+                "status": "deferred",
+                "implementation_time": time.perf_counter() - start,
+                "changes_applied": False,
+                "notes": f"{solution['proposed_solution']} waits for the last promotion's probation "
+                         f"({deployment.rows_to_decide} more mirrored rows)",
+                "deployment": deployment.report()
+            }
+        
+        try:
+            candidate = fit_candidate(spec, X[:len(y) - n_replay], y[:len(y) - n_replay])
+        except Exception as exc:
+            return {
+                "status": "failed",
+                "implementation_time": time.perf_counter() - start,
+                "changes_applied": False,
+                "notes": f"Could not fit {solution['proposed_solution']}: {type(exc).__name__}: {exc}"
+            }
+        
+        artifact = self._store_artifact(candidate)
+        # Small datasets cannot replay shadow_min_rows; decide on what they have
+        deployment.stage(candidate, min_shadow_rows=min(self.config.get("shadow_min_rows", 500), n_replay))
+        self._replay(deployment, *replay)
+        
+        promoted = deployment.state == STATE_PROBATION
+        status = {STATE_PROBATION: "promoted", STATE_SHADOW: "shadowing"}.get(deployment.state, "rejected")
+        return {
+            "status": status,
+            "implementation_time": time.perf_counter() - start,
+            "changes_applied": promoted,
+            "rollback_possible": deployment.previous is not None,
+            "artifact": artifact,
+            "notes": f"{solution['proposed_solution']} {status}",
+            "deployment": deployment.report()
+        }
+    
+    def _replay(self, deployment, X, y):
+        """Mirror ``X``/``y`` to the shadow until the current phase is decided."""
+        phase = deployment.state
+        for X_chunk, y_chunk in iter_chunks(X, y, 256):
+            deployment.predict(X_chunk, y_chunk, mirror=True)
+            deployment.wait_for_shadow()
+            if deployment.state != phase:
+                break
+    
     def stop_evolution(self):
-        """Stop the evolution process."""
+        """Stop the evolution process immediately, even mid-cycle or mid-wait."""
         self.is_running = False
+        self.scheduler.stop()
+        self.fleet.stop()
+        for framework in [self] + [m.framework for m in self.fleet.members.values()]:
+            if framework.deployment is not None:
+                framework.deployment.close()
+        loop = self._loop
+        if self.pipeline is not None and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.pipeline.cancel)
         print("⏹️ Evolution process stopped")
     
     def get_status(self):
@@ -128,13 +753,17 @@ class SRDFFramework:
             "is_running": self.is_running,
             "cycle_count": self.cycle_count,
             "config": self.config,
+            "pipeline": self.pipeline.stats() if self.pipeline is not None else None,
+            "fleet": self.fleet.stats() if self.fleet.members else None,
+            "spans": self.telemetry.span_stats() if self.telemetry.enabled else None,
             "last_activity": datetime.now().isoformat()
         }
     
     def save_progress(self, filename="neurocortex_progress.json"):
         """Save evolution progress to file."""
         progress_data = {
-            "cycle_history": self.cycle_history,
+            "cycle_history": self.cycle_history.to_list(),
+            "cycle_aggregates": self.cycle_history.get_aggregates(),
             "config": self.config,
             "save_time": datetime.now().isoformat()
         }
@@ -147,8 +776,11 @@ class SRDFFramework:
     def load_config(self, config):
         """Update framework configuration."""
         self.config.update(config)
+        self.scheduler.interval = self.config.get("cycle_interval", 3600)
+        self.fleet.cycle_interval = self.config.get("cycle_interval", 3600)
+        self.scheduler.debounce = self.config.get("trigger_debounce", 60.0)
         print("⚙️ Configuration updated")
     
     def get_cycle_history(self):
-        """Return complete cycle history."""
-        return self.cycle_history
+        """Return a read-only view of the retained cycle history."""
+        return self.cycle_history.view()
@@ -0,0 +1,61 @@
+# src/data.py
+"""
+Data module for streaming datasets to the SRDF units one chunk at a time.
+"""
+
+import os
+import numpy as np
+from typing import Iterator, Tuple
+
+PathTypes = (str, bytes, os.PathLike)
+
+
+def open_array(source):
+    """
+    Open ``source`` without reading it into memory.
+
+    ``.npy`` paths are opened as read-only memory maps; arrays, memmaps and
+    other in-memory sequences are returned unchanged.
+    """
+    if isinstance(source, PathTypes):
+        return np.load(source, mmap_mode="r", allow_pickle=False)
+    return source
+
+
+def iter_chunks(data, labels=None, chunk_size: int = 65536) -> Iterator[Tuple]:
+    """
+    Yield ``(X_chunk, y_chunk)`` pairs covering the whole dataset.
+
+    Args:
+        data: Array, ``np.memmap``, ``.npy`` path, or an iterable of
+            ``(X_chunk, y_chunk)`` pairs when ``labels`` is None
+        labels: Labels aligned with ``data`` (array, memmap or ``.npy`` path)
+        chunk_size: Maximum rows per yielded chunk
+
+    Yields:
+        tuple: Views (not copies) of at most ``chunk_size`` rows
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if labels is None:
+        if isinstance(data, PathTypes) or hasattr(data, "shape"):
+            raise ValueError("labels are required unless data yields (X, y) pairs")
+        for X_chunk, y_chunk in data:
+            yield from _slice_pairs(X_chunk, y_chunk, chunk_size)
+        return
+
+    yield from _slice_pairs(open_array(data), open_array(labels), chunk_size)
+
+
+def _slice_pairs(X, y, chunk_size):
+    """Split aligned sequences into slices of at most ``chunk_size`` rows."""
+    n_rows = len(y)
+    if len(X) != n_rows:
+        raise ValueError(f"data and labels differ in length: {len(X)} != {n_rows}")
+    if n_rows <= chunk_size:
+        yield X, y
+        return
+    for start in range(0, n_rows, chunk_size):
+        stop = start + chunk_size
+        yield X[start:stop], y[start:stop]
@@ -0,0 +1,299 @@
+# src/deployment.py
+"""
+Deployment module for hot-swapping the served model behind shadow evaluation.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from .metrics import ConfusionAccumulator
+
+STATE_LIVE = "live"            # only the live model serves
+STATE_SHADOW = "shadow"        # a candidate sees mirrored traffic
+STATE_PROBATION = "probation"  # candidate promoted; old model kept in shadow
+LATENCY_WINDOW = 1024  # per-batch latencies kept per arm for the median
+
+
+class ArmStats:
+    """Accuracy and per-row latency of one model on the mirrored batches."""
+
+    __slots__ = ("confusion", "row_latencies", "rows")
+
+    def __init__(self):
+        self.confusion = ConfusionAccumulator()
+        self.row_latencies = deque(maxlen=LATENCY_WINDOW)
+        self.rows = 0
+
+    def add(self, y_true, predictions, seconds: float, n_rows: int):
+        if y_true is not None:
+            self.confusion.update(y_true, predictions)
+        self.row_latencies.append(seconds / max(n_rows, 1))
+        self.rows += n_rows
+
+    def summary(self) -> Dict:
+        return {
+            "rows": self.rows,
+            "labelled_rows": self.confusion.total,
+            "accuracy": self.confusion.metrics()["accuracy"] if self.confusion.total else None,
+            "row_latency_median": float(np.median(self.row_latencies)) if self.row_latencies else None
+        }
+
+
+class ModelDeployment:
+    """
+    Serves a live model and swaps in candidates without downtime.
+
+    ``stage`` loads a candidate next to the live model; a ``shadow_fraction``
+    sample of ``predict`` batches is mirrored to it on a background thread,
+    so live latency is unaffected. Once ``min_shadow_rows`` labelled rows
+    have been mirrored (unlabelled rows never decide a candidate) it is
+    promoted if its accuracy is within ``accuracy_tolerance`` of the live
+    model, its median per-row latency at most ``latency_tolerance``
+    (relative) above the live model's and within ``max_row_latency`` (if
+    set), otherwise discarded. Promotion is a
+    single reference assignment, so in-flight ``predict`` calls never block
+    and finish on whichever model they started with. The replaced model
+    then stays in shadow for a probation period of the same length, and the
+    swap is rolled back automatically if the new model falls behind it on
+    accuracy or becomes more than ``latency_tolerance`` (relative) slower
+    than it was in shadow. A new candidate cannot be staged until probation
+    has ended.
+
+    ``on_change(event)`` is called after every state transition (``"staged"``,
+    ``"rejected"``, ``"promoted"``, ``"rolled_back"``, ``"committed"``,
+    ``"replaced"``) with the deployment lock held, on whichever thread made
+    it: automatic decisions happen on the mirror thread. It must not call
+    back into the deployment's locking methods.
+    """
+
+    accepts_labels = True  # Trawler.observe passes labels through to predict
+
+    def __init__(self, model, shadow_fraction: float = 0.25, min_shadow_rows: int = 500,
+                 accuracy_tolerance: float = 0.01, latency_tolerance: float = 0.25,
+                 max_row_latency: Optional[float] = None,
+                 max_pending: int = 16, seed: Optional[int] = None,
+                 on_change: Optional[Callable[[str], None]] = None):
+        self._live = model
+        self._shadow = None
+        self.shadow_fraction = shadow_fraction
+        self.min_shadow_rows = min_shadow_rows
+        self.accuracy_tolerance = accuracy_tolerance
+        self.latency_tolerance = latency_tolerance
+        self.max_row_latency = max_row_latency
+        self.state = STATE_LIVE
+        self.previous = None
+        self.verified = None  # shadow-phase summary of the last promoted model
+        self.events = deque(maxlen=100)
+        self.on_change = on_change
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()  # guards state transitions, never predict
+        self._mirror_pool = None  # started on the first mirrored batch, stopped by close()
+        self._mirror_slots = threading.BoundedSemaphore(max_pending)
+        self.dropped_mirrors = 0
+        self._required_rows = min_shadow_rows
+        self._reset_stats()
+
+    @property
+    def live(self):
+        return self._live
+
+    @property
+    def shadow(self):
+        return self._shadow
+
+    def _reset_stats(self):
+        self._live_stats = ArmStats()
+        self._shadow_stats = ArmStats()
+        self._agreements = 0
+
+    def predict(self, X, y=None, mirror: Optional[bool] = None):
+        """
+        Predict with the live model, mirroring a sample to the shadow.
+
+        Args:
+            X: Input rows
+            y: Labels, when known, used to compare the two models
+            mirror: Force (True) or suppress (False) mirroring of this batch
+        """
+        live = self._live  # one reference read: a concurrent swap cannot tear this call
+        start = time.perf_counter()
+        predictions = live.predict(X)
+        seconds = time.perf_counter() - start
+
+        shadow = self._shadow
+        if shadow is not None and (mirror if mirror is not None else self._rng.random() < self.shadow_fraction):
+            if not self._mirror_slots.acquire(blocking=False):
+                with self._lock:
+                    self.dropped_mirrors += 1  # shed shadow load rather than queue unboundedly
+            else:
+                self._pool().submit(self._mirror, live, shadow, X, y, predictions, seconds)
+        return predictions
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._mirror_pool is None:
+                self._mirror_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="srdf-shadow")
+            return self._mirror_pool
+
+    def _mirror(self, live, shadow, X, y, live_predictions, live_seconds):
+        try:
+            start = time.perf_counter()
+            shadow_predictions = shadow.predict(X)
+            seconds = time.perf_counter() - start
+            with self._lock:
+                if live is not self._live or shadow is not self._shadow:
+                    return  # a swap or rollback happened meanwhile
+                n_rows = len(live_predictions)
+                self._live_stats.add(y, live_predictions, live_seconds, n_rows)
+                self._shadow_stats.add(y, shadow_predictions, seconds, n_rows)
+                self._agreements += int(np.sum(np.asarray(shadow_predictions) == np.asarray(live_predictions)))
+                self._advance()
+        finally:
+            self._mirror_slots.release()
+
+    def wait_for_shadow(self):
+        """Block until every mirrored batch submitted so far is processed."""
+        self._pool().submit(lambda: None).result()
+
+    def stage(self, candidate, min_shadow_rows: Optional[int] = None) -> Dict:
+        """
+        Load ``candidate`` in shadow next to the live model.
+
+        ``min_shadow_rows`` overrides the mirrored rows needed to decide this
+        candidate and its probation, e.g. when only a small replay is available.
+
+        Raises:
+            RuntimeError: While the last promoted model is still in probation
+        """
+        with self._lock:
+            if self.state == STATE_PROBATION:
+                raise RuntimeError("the last promoted model is still in probation")
+            self._shadow = candidate
+            self.state = STATE_SHADOW
+            self._required_rows = self.min_shadow_rows if min_shadow_rows is None else min_shadow_rows
+            self._reset_stats()
+            self._log("staged")
+            self._changed("staged")
+        return self.report()
+
+    @property
+    def rows_to_decide(self) -> int:
+        """Mirrored rows still needed before the shadow or probation phase is decided."""
+        if self.state == STATE_LIVE:
+            return 0
+        return max(0, self._required_rows - self._mirrored_rows())
+
+    def _mirrored_rows(self) -> int:
+        # A candidate is only promoted on rows that can show its accuracy
+        if self.state == STATE_SHADOW:
+            return self._shadow_stats.confusion.total
+        return self._shadow_stats.rows
+
+    def _accuracy_holds(self, candidate: Dict, reference: Dict) -> bool:
+        return reference["accuracy"] is None or \
+            candidate["accuracy"] >= reference["accuracy"] - self.accuracy_tolerance
+
+    def _advance(self):
+        """Move the state machine forward once enough rows have been compared."""
+        if self._mirrored_rows() < self._required_rows:
+            return
+        live, shadow = self._live_stats.summary(), self._shadow_stats.summary()
+        if self.state == STATE_SHADOW:
+            within_budget = self.max_row_latency is None or \
+                shadow["row_latency_median"] <= self.max_row_latency
+            slower = shadow["row_latency_median"] > \
+                live["row_latency_median"] * (1.0 + self.latency_tolerance)
+            if shadow["labelled_rows"] and self._accuracy_holds(shadow, live) \
+                    and within_budget and not slower:
+                self._promote(shadow)
+            else:
+                self._log("rejected")
+                self._shadow = None
+                self.state = STATE_LIVE
+                self._reset_stats()
+                self._changed("rejected")
+        elif self.state == STATE_PROBATION:
+            # The shadow is now the replaced model; the new one must match it
+            # on accuracy and its own latency measured before promotion
+            slower = live["row_latency_median"] > \
+                self.verified["row_latency_median"] * (1.0 + self.latency_tolerance)
+            if not self._accuracy_holds(live, shadow):
+                self._rollback("accuracy regression")
+            elif slower:
+                self._rollback("latency regression")
+            else:
+                self._commit()
+
+    def _promote(self, verified: Dict):
+        self._log("promoted")
+        self.verified = verified
+        self.previous = self._live
+        self._live, self._shadow = self._shadow, self._live  # atomic swap
+        self.state = STATE_PROBATION
+        self._reset_stats()
+        self._changed("promoted")
+
+    def _rollback(self, reason: str):
+        self._log("rolled_back", reason=reason)
+        self._live, self._shadow = self.previous, None
+        self.state = STATE_LIVE
+        self._reset_stats()
+        self._changed("rolled_back")
+
+    def _commit(self):
+        self._log("committed")
+        self._shadow = None
+        self.state = STATE_LIVE
+        self._reset_stats()
+        self._changed("committed")
+
+    def replace(self, model):
+        """Swap ``model`` in immediately, without shadow evaluation."""
+        with self._lock:
+            self._log("replaced")
+            self.previous = self._live
+            self._live, self._shadow = model, None
+            self.state = STATE_LIVE
+            self._reset_stats()
+            self._changed("replaced")
+
+    def rollback(self) -> bool:
+        """Manually restore the model replaced by the last promotion."""
+        with self._lock:
+            if self.previous is None or self._live is self.previous:
+                return False
+            self._rollback("manual")
+            return True
+
+    def _log(self, event: str, **details):
+        self.events.append({
+            "event": event, "time": time.time(),
+            "live": self._live_stats.summary(), "shadow": self._shadow_stats.summary(),
+            **details
+        })
+
+    def _changed(self, event: str):
+        if self.on_change is not None:
+            self.on_change(event)
+
+    def report(self) -> Dict:
+        return {
+            "state": self.state,
+            "live": self._live_stats.summary(),
+            "shadow": self._shadow_stats.summary(),
+            "agreement": self._agreements / self._shadow_stats.rows if self._shadow_stats.rows else None,
+            "dropped_mirrors": self.dropped_mirrors,
+            "events": list(self.events)[-5:]
+        }
+
+    def close(self):
+        """Stop the mirror thread; a later mirrored batch starts a new one."""
+        with self._lock:
+            pool, self._mirror_pool = self._mirror_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
@@ -0,0 +1,231 @@
+# src/drift.py
+"""
+Drift module for constant-memory feature sketches and distribution drift scores.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+EPSILON = 1e-6
+
+
+class DriftDetector:
+    """
+    Per-feature streaming sketches compared against a reference distribution.
+
+    Each feature keeps a fixed-bin histogram (bin edges are reference
+    quantiles) for the reference and the current data, plus a shared row
+    reservoir of the current data. Memory is O(n_bins + reservoir_size) per
+    feature no matter how many rows stream through, and scoring a batch is a
+    single ``searchsorted``/``bincount`` pass.
+
+    Bin edges are fixed from the first batch of the reference and never
+    revised, so that batch should be representative (``fit_reference`` with
+    the training set is the safest). Only numeric columns are sketched:
+    columns of the first batch that do not convert to floats (e.g. string
+    categories in an object array) are skipped, and features are reported
+    by their column index in the input. Without any numeric column the
+    detector stays inert.
+    """
+
+    def __init__(self, n_bins: int = 10, reservoir_size: int = 256,
+                 psi_threshold: float = 0.2, ks_threshold: float = 0.2,
+                 min_samples: int = 100, seed: Optional[int] = None):
+        if n_bins < 2:
+            raise ValueError("n_bins must be at least 2")
+        self.n_bins = n_bins
+        self.reservoir_size = reservoir_size
+        self.psi_threshold = psi_threshold
+        self.ks_threshold = ks_threshold
+        self.min_samples = min_samples
+        self.rng = np.random.default_rng(seed)
+
+        self.edges = None
+        self.columns = None  # input columns being sketched
+        self.n_columns = None
+        self.reference_counts = None
+        self.reference_frozen = False
+        self.reset_current()
+
+    @property
+    def n_features(self) -> int:
+        return 0 if self.edges is None else self.edges.shape[0]
+
+    def reset_current(self):
+        """Forget the current-data sketches, keeping the reference."""
+        self.current_counts = None if self.edges is None else np.zeros_like(self.reference_counts)
+        self.reservoir = None
+        self.rows_seen = 0
+
+    def fit_reference(self, data):
+        """
+        Build the reference sketches from ``data`` and freeze them.
+
+        Args:
+            data: 2-D array of reference rows (e.g. the training set)
+        """
+        self.edges = None
+        self.columns = None
+        self.reference_frozen = False
+        self.update(data)
+        self.freeze_reference()
+        return self
+
+    def freeze_reference(self):
+        """Stop adding to the reference; later updates count as current data."""
+        if self.edges is not None:
+            self.reference_frozen = True
+            self.reset_current()
+
+    def update(self, data):
+        """
+        Fold a batch of rows into the sketches.
+
+        Until the reference is frozen the batch counts towards the reference;
+        bin edges are taken from the quantiles of the first batch seen.
+        """
+        X = self._as_matrix(data)
+        if X.shape[0] == 0:
+            return self
+
+        if self.columns is None:
+            self.n_columns = X.shape[1]
+            self.columns = self._numeric_columns(X)
+        elif X.shape[1] != self.n_columns:
+            raise ValueError(f"expected {self.n_columns} features, got {X.shape[1]}")
+        if not len(self.columns):
+            return self  # nothing numeric to sketch
+        X = self._as_floats(X[:, self.columns])
+        if self.edges is None:
+            self._init_edges(X)
+
+        counts = self._histogram(X)
+        if not self.reference_frozen:
+            self.reference_counts += counts
+        else:
+            self.current_counts += counts
+            self._update_reservoir(X)
+        return self
+
+    def _as_matrix(self, data):
+        X = np.asarray(data)
+        return X.reshape(-1, 1) if X.ndim == 1 else X.reshape(X.shape[0], -1)
+
+    @staticmethod
+    def _numeric_columns(X) -> np.ndarray:
+        if X.dtype.kind in "biuf":
+            return np.arange(X.shape[1])
+        numeric = []
+        for f in range(X.shape[1]):
+            try:
+                X[:, f].astype(np.float64)
+            except (TypeError, ValueError):
+                continue
+            numeric.append(f)
+        return np.array(numeric, dtype=np.int64)
+
+    @staticmethod
+    def _as_floats(X) -> np.ndarray:
+        try:
+            return X.astype(np.float64)
+        except (TypeError, ValueError):
+            # A later value that is not a number lands in the last bin
+            return np.vectorize(_float_or_nan, otypes=[np.float64])(X)
+
+    def _init_edges(self, X):
+        quantiles = np.linspace(0, 1, self.n_bins + 1)[1:-1]
+        self.edges = np.quantile(X, quantiles, axis=0).T
+        self.reference_counts = np.zeros((X.shape[1], self.n_bins), dtype=np.int64)
+        self.reset_current()
+
+    def _histogram(self, X):
+        """Bin every feature of ``X`` with one flattened bincount."""
+        n_features = self.n_features
+        bins = np.empty(X.shape, dtype=np.int64)
+        for f in range(n_features):
+            bins[:, f] = np.searchsorted(self.edges[f], X[:, f], side="right")
+        bins += np.arange(n_features) * self.n_bins
+        counts = np.bincount(bins.ravel(), minlength=n_features * self.n_bins)
+        return counts.reshape(n_features, self.n_bins)
+
+    def _update_reservoir(self, X):
+        """Algorithm R over a whole batch at once."""
+        k = self.reservoir_size
+        if k <= 0:
+            return
+        if self.reservoir is None:
+            self.reservoir = np.empty((k, X.shape[1]))
+
+        n = X.shape[0]
+        positions = self.rows_seen + np.arange(n)
+        fill = positions < k
+        self.reservoir[positions[fill]] = X[fill]
+
+        rest = ~fill
+        if rest.any():
+            slots = self.rng.integers(0, positions[rest] + 1)
+            keep = slots < k
+            # Later rows overwrite earlier ones, as in the sequential algorithm
+            self.reservoir[slots[keep]] = X[rest][keep]
+        self.rows_seen += n
+
+    def sample(self):
+        """Return the reservoir sample of current rows."""
+        if self.reservoir is None:
+            return np.empty((0, self.n_features))
+        return self.reservoir[:min(self.rows_seen, self.reservoir_size)]
+
+    def scores(self) -> Dict:
+        """
+        Compare current sketches with the reference.
+
+        Returns:
+            dict: Per-feature ``psi`` and binned ``ks`` distance
+        """
+        if not self.reference_frozen or self.current_counts is None:
+            return {}
+
+        ref = self.reference_counts / max(self.reference_counts[0].sum(), 1)
+        cur = self.current_counts / max(self.current_counts[0].sum(), 1)
+        ref_p = np.clip(ref, EPSILON, None)
+        cur_p = np.clip(cur, EPSILON, None)
+
+        psi = ((cur_p - ref_p) * np.log(cur_p / ref_p)).sum(axis=1)
+        ks = np.abs(np.cumsum(cur, axis=1) - np.cumsum(ref, axis=1)).max(axis=1)
+        return {
+            int(column): {"psi": float(psi[f]), "ks": float(ks[f])}
+            for f, column in enumerate(self.columns)
+        }
+
+    def drifted_features(self, scores: Optional[Dict] = None) -> List[int]:
+        """Return features whose PSI or KS distance crosses its threshold."""
+        if self.current_samples < self.min_samples:
+            return []
+        scores = self.scores() if scores is None else scores
+        return [
+            f for f, s in scores.items()
+            if s["psi"] >= self.psi_threshold or s["ks"] >= self.ks_threshold
+        ]
+
+    @property
+    def current_samples(self) -> int:
+        return 0 if self.current_counts is None else int(self.current_counts[0].sum())
+
+    def report(self) -> Dict:
+        """Summarize drift for inclusion in analysis results."""
+        scores = self.scores()
+        drifted = self.drifted_features(scores)
+        return {
+            "samples": self.current_samples,
+            "drifted_features": drifted,
+            "max_psi": max((s["psi"] for s in scores.values()), default=0.0),
+            "max_ks": max((s["ks"] for s in scores.values()), default=0.0),
+            "feature_scores": {str(f): s for f, s in scores.items()}
+        }
+
+
+def _float_or_nan(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
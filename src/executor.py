@@ -0,0 +1,308 @@
+# src/executor.py
+"""
+Executor module for training and scoring candidates concurrently in worker processes.
+"""
+
+import os
+import threading
+import time
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .cache import FitnessCache, fingerprint_dataset, solution_key
+from .candidates import holdout_split, train_and_score
+from .data import open_array
+from .oversampling import shared_neighbor_table, window_neighbors
+from .shared import SharedDataset
+
+DEFAULT_TIMEOUT = 600.0
+
+
+def _run_task(connection, fn, args):
+    """Worker entry point: run one task and send back its outcome."""
+    try:
+        connection.send(("ok", fn(*args)))
+    except BaseException as exc:  # report everything, including SystemExit
+        connection.send(("error", f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"))
+    finally:
+        connection.close()
+
+
+class _LaidOutTable:
+    """
+    A table already in layout order, indexed by source row like the other
+    arrays a ``SharedDataset`` copies in ``order``.
+    """
+
+    def __init__(self, table: np.ndarray, order: np.ndarray, n_rows: int):
+        self.table = table
+        self.shape = (n_rows,) + table.shape[1:]
+        self.dtype = table.dtype
+        self._position = np.full(n_rows, -1, dtype=np.int64)
+        self._position[order] = np.arange(len(order))
+
+    def __getitem__(self, rows):
+        return self.table[self._position[rows]]
+
+
+def shared_arrays(solutions: List[Dict], X, y, order: np.ndarray,
+                  fingerprint: Optional[str] = None) -> Dict:
+    """
+    Arrays to place in a ``SharedDataset`` laid out in ``order``.
+
+    When a candidate oversamples with SMOTE, a neighbour table is built
+    here, once, and shipped as ``"neighbors"`` (as positions in the
+    layout), so workers never index their split themselves. A layout
+    of every row reuses the dataset's incremental table; one of a
+    subsample (progressive cross-validation) indexes just those rows.
+    ``fingerprint`` is ``fingerprint_dataset(X, y)``, when known, so the
+    incremental table is reused without hashing the data again.
+    """
+    arrays = {"X": X, "y": y}
+    k_neighbors = [s["candidate"].get("k_neighbors", 5) for s in solutions
+                   if s.get("candidate", {}).get("resample") == "smote"]
+    if not k_neighbors:
+        return arrays
+    if len(order) < len(y):
+        table = shared_neighbor_table(X[order], y[order], max(k_neighbors), incremental=False)
+        arrays["neighbors"] = _LaidOutTable(table.astype(np.int32), order, len(y))
+        return arrays
+    table = shared_neighbor_table(X, y, max(k_neighbors), fingerprint=fingerprint)
+    position = np.empty(len(y), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    arrays["neighbors"] = np.where(
+        table >= 0, position[np.maximum(table, 0)], -1
+    ).astype(np.int32)
+    return arrays
+
+
+def _neighbors(handles, start, size, n_rows):
+    """Shared neighbour table of a training window (see ``window_neighbors``), if shipped."""
+    if "neighbors" not in handles:
+        return None
+    table = handles["neighbors"].open()[start:start + size]
+    return window_neighbors(table, start % n_rows, size, n_rows)
+
+
+def train_and_score_shared(spec, handles, n_train, n_fit=None):
+    """
+    Worker task: open the shared split as views and score one candidate.
+
+    Rows ``[0, n_train)`` are the training split and the rest the validation
+    split; ``n_fit`` restricts fitting to the first rows of the training split.
+    """
+    X, y = handles["X"].open(), handles["y"].open()
+    n_fit = n_train if n_fit is None else n_fit
+    return train_and_score(spec, X[:n_fit], y[:n_fit], X[n_train:], y[n_train:],
+                           neighbors=_neighbors(handles, 0, n_fit, len(y)))
+
+
+def cross_validate_fold(spec, handles, bounds, fold):
+    """
+    Worker task: score one candidate on one fold of a fold-ordered shared dataset.
+
+    The dataset holds the ``n = bounds[-1]`` fold-ordered rows twice in a
+    row, so every training set is one contiguous view: fold ``fold`` is rows
+    ``bounds[fold]:bounds[fold + 1]`` and the candidate is fitted on the
+    ``n - len(fold)`` rows that follow it, wrapping into the second copy.
+    """
+    X, y = handles["X"].open(), handles["y"].open()
+    n_rows = int(bounds[-1])
+    lo, hi = int(bounds[fold]), int(bounds[fold + 1])
+    train = slice(hi, n_rows + lo)
+    return train_and_score(spec, X[train], y[train], X[lo:hi], y[lo:hi],
+                           neighbors=_neighbors(handles, hi, n_rows - (hi - lo), n_rows))
+
+
+class CandidateExecutor:
+    """
+    Bounded process pool with per-task timeouts.
+
+    Each task runs in its own worker process, at most ``max_workers`` at a
+    time. A task that exceeds ``timeout`` seconds of its own runtime (queue
+    time is not counted) is terminated and reported as ``"timeout"``, so a
+    single runaway candidate cannot stall a cycle. With a ``cache``,
+    candidates already scored on identical data are not retrained.
+    
+    ``max_workers`` bounds the processes of all concurrent ``run`` calls
+    together, so one executor can be shared by several threads (e.g. a
+    model fleet) without oversubscribing the machine.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 mp_context: Optional[str] = None,
+                 cache: Optional[FitnessCache] = None,
+                 telemetry=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.context = multiprocessing.get_context(mp_context)
+        self.cache = cache
+        # Optional Telemetry: each task is recorded as a "candidate" span
+        # nested under the caller's current span
+        self.telemetry = telemetry
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+
+    def run(self, tasks: Sequence[Tuple[Callable, tuple]]) -> List[Dict]:
+        """
+        Execute ``(fn, args)`` tasks concurrently.
+
+        Args:
+            tasks: Picklable callables with their positional arguments
+
+        Returns:
+            list: One dict per task, in input order, with ``status``
+            (``"ok"``, ``"error"`` or ``"timeout"``), ``result``, ``error``
+            and ``duration_seconds``
+        """
+        results = [None] * len(tasks)
+        pending = list(enumerate(tasks))[::-1]
+        running = {}  # reader connection -> (index, process, started)
+
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                # Only block for a slot when this call has nothing else to wait on
+                if not self._slots.acquire(blocking=not running):
+                    break
+                index, (fn, args) = pending.pop()
+                started = time.perf_counter()
+                reader = writer = None
+                try:
+                    reader, writer = self.context.Pipe(duplex=False)
+                    process = self.context.Process(target=_run_task, args=(writer, fn, args), daemon=True)
+                    process.start()
+                except BaseException as exc:
+                    # e.g. out of processes or file descriptors, or unpicklable
+                    # arguments under "spawn": give the slot back, fail the task
+                    self._slots.release()
+                    if reader is not None:
+                        reader.close()
+                    if not isinstance(exc, Exception):
+                        raise
+                    results[index] = self._outcome("error", f"could not start worker: {exc!r}", started)
+                    continue
+                finally:
+                    if writer is not None:
+                        writer.close()
+                running[reader] = (index, process, started)
+
+            for reader in wait(list(running), timeout=self._next_deadline(running)):
+                index, process, started = running.pop(reader)
+                try:
+                    status, payload = reader.recv()
+                except EOFError:
+                    status, payload = "error", f"worker exited with code {process.exitcode}"
+                reader.close()
+                process.join()
+                self._slots.release()
+                results[index] = self._outcome(status, payload, started)
+
+            self._reap_timeouts(running, results)
+
+        telemetry = self.telemetry
+        if telemetry is not None and telemetry.enabled:
+            path = telemetry.nested("candidate")
+            for outcome in results:
+                telemetry.record_span(path, outcome["duration_seconds"], status=outcome["status"])
+                telemetry.count("candidate_tasks", status=outcome["status"])
+        return results
+
+    def _next_deadline(self, running):
+        if self.timeout is None:
+            return None
+        now = time.perf_counter()
+        return max(0.0, min(started + self.timeout for _, _, started in running.values()) - now)
+
+    def _reap_timeouts(self, running, results):
+        if self.timeout is None:
+            return
+        now = time.perf_counter()
+        for reader, (index, process, started) in list(running.items()):
+            if now - started >= self.timeout:
+                process.terminate()
+                process.join()
+                reader.close()
+                self._slots.release()
+                del running[reader]
+                results[index] = {
+                    "status": "timeout",
+                    "result": None,
+                    "error": f"exceeded {self.timeout}s",
+                    "duration_seconds": now - started
+                }
+
+    def _outcome(self, status, payload, started):
+        return {
+            "status": status,
+            "result": payload if status == "ok" else None,
+            "error": payload if status == "error" else None,
+            "duration_seconds": time.perf_counter() - started
+        }
+
+    def evaluate(self, solutions: List[Dict], data, labels,
+                 validation_fraction: float = 0.25, random_state: int = 0,
+                 fingerprint: Optional[str] = None) -> List[Dict]:
+        """
+        Train and score every executable solution concurrently.
+
+        Solutions carrying a ``"candidate"`` spec are fitted on a shared
+        training split and scored on the held-out split; the outcome is
+        stored under ``solution["evaluation"]``.
+
+        Args:
+            solutions: Proposals from ``Generator.propose_solutions``
+            data: Feature matrix (array, memmap or ``.npy`` path)
+            labels: Target labels
+            validation_fraction: Share of rows held out for scoring
+            random_state: Seed for the train/validation split
+            fingerprint: Precomputed ``fingerprint_dataset(data, labels)``,
+                so the cache lookup does not hash the data again
+
+        Returns:
+            list: The same solution dicts, with evaluations attached
+        """
+        executable = [s for s in solutions if s.get("candidate")]
+        if not executable:
+            return solutions
+
+        X, y = open_array(data), open_array(labels)
+
+        keys = {}
+        if self.cache is not None:
+            if fingerprint is None:
+                fingerprint = fingerprint_dataset(X, y)
+            for solution in list(executable):
+                key = solution_key(
+                    solution["candidate"], fingerprint,
+                    validation_fraction=validation_fraction, random_state=random_state
+                )
+                cached = self.cache.get(key)
+                if cached is None:
+                    keys[id(solution)] = key
+                    continue
+                solution["evaluation"] = {
+                    "status": "ok", "result": cached, "error": None,
+                    "duration_seconds": 0.0, "cached": True
+                }
+                executable.remove(solution)
+            if not executable:
+                return solutions
+
+        train_idx, val_idx = holdout_split(len(y), validation_fraction, random_state)
+
+        # One shared copy per call, laid out train-then-validation so each
+        # worker slices both splits as views instead of receiving copies
+        order = np.concatenate([train_idx, val_idx])
+        with SharedDataset(shared_arrays(executable, X, y, order, fingerprint), order=order) as shared:
+            tasks = [
+                (train_and_score_shared, (s["candidate"], shared.handles, len(train_idx)))
+                for s in executable
+            ]
+            for solution, outcome in zip(executable, self.run(tasks)):
+                solution["evaluation"] = outcome
+                if outcome["status"] == "ok" and id(solution) in keys:
+                    self.cache.put(keys[id(solution)], outcome["result"])
+
+        return solutions
@@ -0,0 +1,272 @@
+# src/fleet.py
+"""
+Fleet module for evolving many models from one SRDFFramework process.
+"""
+
+import asyncio
+import math
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from .cache import fingerprint_dataset
+from .data import open_array
+
+
+def regression_severity(analysis: Dict, best_accuracy: Optional[float]) -> float:
+    """
+    Score how badly a model has regressed, for fleet prioritisation.
+
+    The relative accuracy drop below the best accuracy seen for the model,
+    plus 1 if any feature drifted. 0 means healthy.
+    """
+    metrics = analysis.get("performance_metrics", {})
+    severity = 0.0
+    accuracy = metrics.get("accuracy")
+    if accuracy is not None and best_accuracy:
+        severity += max(0.0, best_accuracy - accuracy) / best_accuracy
+    if metrics.get("feature_drift", {}).get("drifted_features"):
+        severity += 1.0
+    return severity
+
+
+def member_checkpoint_path(config: Dict, name: str) -> Optional[str]:
+    """The member's own log next to the parent's, e.g. ``cycles.jsonl`` -> ``cycles.tenant-a.jsonl``."""
+    path = config.get("checkpoint_path")
+    if not path:
+        return None
+    root, ext = os.path.splitext(path)
+    return f"{root}.{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}{ext}"
+
+
+class FleetMember:
+    """One registered model with its own Trawler/Generator/Arbiter state."""
+
+    __slots__ = ("name", "framework", "model", "data", "labels", "weight",
+                 "service_seconds", "cycles", "severity", "best_accuracy",
+                 "last_end", "running")
+
+    def __init__(self, name, framework, model, data, labels, weight):
+        self.name = name
+        self.framework = framework
+        self.model = model
+        self.data = data
+        self.labels = labels
+        self.weight = weight
+        self.service_seconds = 0.0
+        self.cycles = 0
+        self.severity = 0.0
+        self.best_accuracy = None
+        self.last_end = None
+        self.running = False
+
+    def priority(self, severity_weight: float) -> float:
+        """Lower runs first: weighted service time, discounted by severity."""
+        return self.service_seconds / self.weight / (1.0 + severity_weight * self.severity)
+
+
+class ModelFleet:
+    """
+    Schedules evolution cycles for many models over one shared worker pool.
+
+    Every member gets its own framework state (histories, drift reference,
+    surrogate) but all share the parent's ``Telemetry`` and
+    ``CandidateExecutor``, whose ``max_workers`` caps candidate processes
+    across the whole fleet, and its fitness cache. Scheduling is
+    fair-share: the next cycle goes to the idle, due member with the least cycle time consumed per unit of
+    ``weight``, divided by ``1 + severity_weight * severity`` so regressed or
+    drifting models jump the queue. Identical datasets are held once.
+    """
+
+    def __init__(self, framework, max_concurrent: Optional[int] = None,
+                 cycle_interval: float = 0.0, severity_weight: float = 10.0):
+        self.framework = framework
+        self.max_concurrent = max_concurrent or max(1, (os.cpu_count() or 1) // 2)
+        self.cycle_interval = cycle_interval
+        self.severity_weight = severity_weight
+        self.members: Dict[str, FleetMember] = {}
+        self._datasets = {}  # identity or content key -> shared array
+        self._fingerprints = {}  # fingerprint -> shared array
+        self._pinned = {}  # id -> registered object, so the id cannot be reused
+        self._loop = None
+        self._task = None
+        self._stopped = False
+
+    def register(self, name: str, model, data=None, labels=None, weight: float = 1.0) -> FleetMember:
+        """Add a model to the fleet; ``data``/``labels`` are deduplicated across members."""
+        if name in self.members:
+            raise ValueError(f"model {name!r} is already registered")
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+
+        parent = self.framework
+        config = dict(parent.config, checkpoint_path=member_checkpoint_path(parent.config, name),
+                      metrics_path=None, metrics_port=None)
+        framework = type(parent)(config, executor=parent.executor, telemetry=parent.telemetry)
+        member = FleetMember(name, framework, model, self._share(data), self._share(labels), weight)
+        self.members[name] = member
+        return member
+
+    def unregister(self, name: str):
+        """Remove a model, dropping datasets no remaining member shares."""
+        del self.members[name]
+        in_use = {id(array) for member in self.members.values()
+                  for array in (member.data, member.labels) if array is not None}
+        for key, shared in list(self._datasets.items()):
+            if id(shared) not in in_use:
+                del self._datasets[key]
+                self._pinned.pop(key, None)
+        for fingerprint, shared in list(self._fingerprints.items()):
+            if id(shared) not in in_use:
+                del self._fingerprints[fingerprint]
+
+    def _share(self, array):
+        """Return the single shared instance of ``array``'s contents."""
+        if array is None:
+            return None
+        key = os.path.abspath(array) if isinstance(array, str) else id(array)
+        shared = self._datasets.get(key)
+        if shared is not None:
+            return shared
+
+        opened = open_array(array)
+        fingerprint = fingerprint_dataset(opened)
+        shared = self._fingerprints.setdefault(fingerprint, opened)
+        self._datasets[key] = shared
+        if not isinstance(array, str):
+            self._pinned[key] = array
+        return shared
+
+    @property
+    def unique_datasets(self) -> int:
+        return len(self._fingerprints)
+
+    def _next_member(self, now: float) -> Optional[FleetMember]:
+        due = [
+            m for m in self.members.values()
+            if not m.running and (m.last_end is None or now >= m.last_end + self.cycle_interval)
+        ]
+        if not due:
+            return None
+        return min(due, key=lambda m: m.priority(self.severity_weight))
+
+    def _next_due_in(self, now: float) -> float:
+        waits = [
+            m.last_end + self.cycle_interval - now
+            for m in self.members.values() if not m.running and m.last_end is not None
+        ]
+        return max(min(waits), 0.0) if waits else math.inf
+
+    def _run_member_cycle(self, member: FleetMember) -> Dict:
+        started = time.perf_counter()
+        framework = member.framework
+        # Members share one Telemetry; label their series by model
+        with framework.telemetry.labelled(model=member.name):
+            cycle = framework._run_cycle(framework.cycle_count, member.model, member.data, member.labels)
+        member.service_seconds += time.perf_counter() - started
+        member.cycles += 1
+
+        analysis = cycle["analysis_results"]
+        member.severity = regression_severity(analysis, member.best_accuracy)
+        accuracy = analysis.get("performance_metrics", {}).get("accuracy")
+        if accuracy is not None:
+            member.best_accuracy = max(member.best_accuracy or accuracy, accuracy)
+        return cycle
+
+    async def run(self, max_cycles: Optional[int] = None) -> List[Dict]:
+        """
+        Run fleet cycles until ``max_cycles`` complete in total or ``stop()``.
+
+        A ``stop()`` issued before the run starts (and not cleared by
+        ``reset()``) makes it return at once.
+
+        Returns:
+            list: ``{"model", "cycle"}`` records in completion order (with
+            ``cycle`` None and an ``error`` if the cycle raised)
+        """
+        if self._stopped:
+            return []  # stopped before the run began
+        self._loop = loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        wake = asyncio.Event()
+        results = []
+        in_flight = set()
+        started = 0
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="srdf-fleet")
+
+        async def run_one(member):
+            try:
+                cycle = await loop.run_in_executor(pool, self._run_member_cycle, member)
+                results.append({"model": member.name, "cycle": cycle})
+            except Exception as exc:
+                # One tenant's failure must not take down the fleet
+                results.append({"model": member.name, "cycle": None, "error": f"{type(exc).__name__}: {exc}"})
+            finally:
+                member.running = False
+                member.last_end = time.monotonic()
+                wake.set()
+
+        try:
+            while max_cycles is None or started < max_cycles or in_flight:
+                wake.clear()
+                now = time.monotonic()
+                while (len(in_flight) < self.max_concurrent
+                       and (max_cycles is None or started < max_cycles)):
+                    member = self._next_member(now)
+                    if member is None:
+                        break
+                    member.running = True
+                    started += 1
+                    task = asyncio.ensure_future(run_one(member))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                if not in_flight and not self.members:
+                    break
+                timeout = self._next_due_in(now)
+                try:
+                    await asyncio.wait_for(wake.wait(), None if math.isinf(timeout) else timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            for task in in_flight:
+                task.cancel()
+            if not self._stopped:
+                raise
+        finally:
+            self._loop = self._task = None
+            # Cycles interrupted by stop() cannot be killed: wait, off the
+            # loop, until they finish so none outlives the run
+            await loop.run_in_executor(None, pool.shutdown)
+        return results
+
+    def reset(self):
+        """Clear an earlier ``stop()`` so the next ``run()`` cycles again."""
+        self._stopped = False
+
+    def stop(self):
+        """Cancel the fleet run immediately. Safe to call from any thread."""
+        self._stopped = True
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    def stats(self) -> Dict:
+        """Per-member scheduling state plus dataset sharing."""
+        return {
+            "members": {
+                name: {
+                    "cycles": m.cycles,
+                    "service_seconds": m.service_seconds,
+                    "weight": m.weight,
+                    "severity": m.severity,
+                    "best_accuracy": m.best_accuracy
+                }
+                for name, m in self.members.items()
+            },
+            "registered_datasets": sum(
+                (m.data is not None) + (m.labels is not None) for m in self.members.values()
+            ),
+            "unique_datasets": self.unique_datasets
+        }
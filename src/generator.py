@@ -4,14 +4,20 @@ Generator module for proposing novel architectural modifications and solutions.
 """
 
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional
+from .history import DEFAULT_HISTORY_SIZE, HistoryStore
+
+def _summarize_solution(solution):
+    """Numeric fields kept for solutions evicted from the history."""
+    return {"confidence_score": solution.get("confidence_score")}
 
 class Generator:
     """Solution proposal unit for generating innovative improvements."""
     
-    def __init__(self):
+    def __init__(self, history_size: Optional[int] = DEFAULT_HISTORY_SIZE):
         self.solution_templates = self._initialize_templates()
-        self.generated_solutions = []
+        self.candidate_specs = self._initialize_candidate_specs()
+        self.generated_solutions = HistoryStore(history_size, summarize=_summarize_solution)
     
     def propose_solutions(self, analysis_results: Dict) -> List[Dict]:
         """
@@ -25,11 +31,12 @@ class Generator:
         """
         issues = analysis_results.get("identified_issues", [])
         recommendations = analysis_results.get("recommendations", [])
+        metrics = analysis_results.get("performance_metrics", {})
         
         solutions = []
         
         for issue, recommendation in zip(issues, recommendations):
-            solution = self._generate_solution(issue, recommendation)
+            solution = self._generate_solution(issue, recommendation, metrics)
             solutions.append(solution)
             self.generated_solutions.append(solution)
         
@@ -52,12 +59,96 @@ class Generator:
                 "Model quantization for faster inference",
                 "Architecture pruning for efficiency",
                 "Knowledge distillation to smaller model"
+            ],
+            "drift": [
+                "Retrain on recent data window",
+                "Importance reweighting toward current distribution",
+                "Online recalibration of decision thresholds"
             ]
         }
     
-    def _generate_solution(self, issue: str, recommendation: str) -> Dict:
+    def _initialize_candidate_specs(self):
+        """Map each template to a trainable candidate spec (see ``src/candidates.py``)."""
+        forest = {"estimator": "RandomForestClassifier", "params": {"n_estimators": 100, "random_state": 42}}
+        return {
+            "GradientBoosting with hyperparameter optimization": {
+                "estimator": "GradientBoostingClassifier",
+                "params": {"random_state": 42},
+                "search_space": {
+                    "n_estimators": [100, 200, 400],
+                    "learning_rate": [0.03, 0.1, 0.3],
+                    "max_depth": [2, 3, 5]
+                }
+            },
+            "Neural Architecture Search for optimal structure": {
+                "estimator": "MLPClassifier",
+                "params": {"max_iter": 500, "random_state": 42},
+                "search_space": {
+                    "hidden_layer_sizes": [[32], [64], [64, 32], [128, 64]],
+                    "alpha": [1e-4, 1e-3, 1e-2]
+                }
+            },
+            "Ensemble of diverse model types": {
+                "estimator": "VotingEnsemble",
+                "params": {"voting": "soft"},
+                "members": [
+                    forest,
+                    {"estimator": "GradientBoostingClassifier", "params": {"random_state": 42}},
+                    {"estimator": "LogisticRegression", "params": {"max_iter": 1000}}
+                ]
+            },
+            "SMOTE for class balancing": {**forest, "resample": "smote"},
+            "Focal loss for imbalanced data": {
+                "estimator": "HistGradientBoostingClassifier",
+                "params": {"class_weight": "balanced", "random_state": 42}
+            },
+            "Cost-sensitive learning approach": {
+                "estimator": "RandomForestClassifier",
+                "params": {"n_estimators": 100, "class_weight": "balanced", "random_state": 42}
+            },
+            # Forest speed templates are compiled into flat-array predictors (see
+            # compiled.py); the unpruned one leaves large batches to sklearn, which
+            # is faster there. A single shallow tree gains nothing from compiling.
+            "Model quantization for faster inference": {
+                **forest, "compile": {"threshold_dtype": "int16", "fallback_rows": 64}
+            },
+            "Architecture pruning for efficiency": {
+                **forest, "compile": {"max_trees": 50, "max_depth": 8, "threshold_dtype": "float32"}
+            },
+            "Knowledge distillation to smaller model": {
+                "estimator": "DecisionTreeClassifier",
+                "params": {"max_depth": 10, "random_state": 42}
+            },
+            "Retrain on recent data window": {**forest, "train_fraction": 0.5},
+            "Importance reweighting toward current distribution": {**forest, "sample_weighting": "recency"},
+            "Online recalibration of decision thresholds": {
+                "estimator": "LogisticRegression",
+                "params": {"max_iter": 1000},
+                "train_fraction": 0.5
+            },
+            "Default optimization": forest
+        }
+    
+    def _build_candidate(self, template: str) -> Optional[Dict]:
+        """Return a concrete spec for ``template``, sampling any search space."""
+        base = self.candidate_specs.get(template)
+        if base is None:
+            return None
+        
+        spec = {key: value for key, value in base.items() if key != "search_space"}
+        spec["params"] = dict(base.get("params", {}))
+        for param, choices in base.get("search_space", {}).items():
+            spec["params"][param] = random.choice(choices)
+        return spec
+    
+    def _generate_solution(self, issue: str, recommendation: str,
+                           metrics: Optional[Dict] = None) -> Dict:
         """Generate a specific solution based on issue type."""
         solution_type = self._identify_solution_type(issue)
+        metrics = metrics or {}
+        
+        if solution_type == "speed" and "inference_time" in metrics:
+            return self._generate_speed_solution(issue, recommendation, metrics)
         
         template = random.choice(self.solution_templates.get(solution_type, ["Default optimization"]))
         
@@ -67,14 +158,49 @@ class Generator:
             "proposed_solution": template,
             "confidence_score": random.uniform(0.7, 0.95),
             "estimated_improvement": f"{random.randint(5, 20)}%",
-            "complexity": random.choice(["low", "medium", "high"])
+            "complexity": random.choice(["low", "medium", "high"]),
+            "solution_type": solution_type,
+            "candidate": self._build_candidate(template)
+        }
+    
+    def _generate_speed_solution(self, issue: str, recommendation: str, metrics: Dict) -> Dict:
+        """Pick a speed template sized to the measured latency gap."""
+        latency = metrics["inference_time"]
+        threshold = metrics.get("latency_threshold", 0.1)
+        # Fraction of the current latency that has to go to meet the threshold
+        required_cut = max(0.0, 1.0 - threshold / latency) if latency > 0 else 0.0
+        
+        templates = self.solution_templates["speed"]
+        if required_cut < 0.5:
+            template, complexity = templates[0], "low"
+        elif required_cut < 0.75:
+            template, complexity = templates[1], "medium"
+        else:
+            template, complexity = templates[2], "high"
+        
+        return {
+            "issue": issue,
+            "recommendation": recommendation,
+            "proposed_solution": template,
+            "confidence_score": random.uniform(0.7, 0.95),
+            "estimated_improvement": f"{round(required_cut * 100)}%",
+            "complexity": complexity,
+            "solution_type": "speed",
+            "candidate": self._build_candidate(template),
+            "measured_latency": {
+                "inference_time": latency,
+                "latency_threshold": threshold,
+                "throughput_rows_per_second": metrics.get("throughput_rows_per_second")
+            }
         }
     
     def _identify_solution_type(self, issue: str) -> str:
         """Identify the type of solution needed based on issue."""
         issue_lower = issue.lower()
         
-        if any(word in issue_lower for word in ["accuracy", "precision", "f1"]):
+        if "drift" in issue_lower:
+            return "drift"
+        elif any(word in issue_lower for word in ["accuracy", "precision", "f1"]):
             return "accuracy"
         elif any(word in issue_lower for word in ["recall", "minority", "class"]):
             return "recall"
@@ -84,5 +210,5 @@ class Generator:
             return "general"
     
     def get_solution_history(self):
-        """Return history of all generated solutions."""
-        return self.generated_solutions
+        """Return a read-only view of the retained generated solutions."""
+        return self.generated_solutions.view()
@@ -0,0 +1,252 @@
+# src/history.py
+"""
+History module providing bounded, ring-buffered stores for SRDF unit histories.
+"""
+
+from collections import deque
+from collections.abc import Sequence
+from typing import Callable, Dict, Optional
+import numpy as np
+
+DEFAULT_HISTORY_SIZE = 1000
+
+
+class AggregateBucket:
+    """Downsampled summary of a run of evicted history records."""
+
+    __slots__ = ("first_index", "last_index", "count", "sums", "mins", "maxs")
+
+    def __init__(self, first_index: int):
+        self.first_index = first_index
+        self.last_index = first_index
+        self.count = 0
+        self.sums = {}
+        self.mins = {}
+        self.maxs = {}
+
+    def add(self, index: int, values: Dict[str, float]):
+        self.last_index = index
+        self.count += 1
+        for key, value in values.items():
+            if value is None:
+                continue
+            self.sums[key] = self.sums.get(key, 0.0) + value
+            self.mins[key] = min(self.mins.get(key, value), value)
+            self.maxs[key] = max(self.maxs.get(key, value), value)
+
+    def state(self) -> Dict:
+        return {
+            "first_index": self.first_index, "last_index": self.last_index, "count": self.count,
+            "sums": dict(self.sums), "mins": dict(self.mins), "maxs": dict(self.maxs)
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "AggregateBucket":
+        bucket = cls(state["first_index"])
+        bucket.last_index = state["last_index"]
+        bucket.count = state["count"]
+        bucket.sums, bucket.mins, bucket.maxs = dict(state["sums"]), dict(state["mins"]), dict(state["maxs"])
+        return bucket
+
+    def to_dict(self) -> Dict:
+        return {
+            "first_index": self.first_index,
+            "last_index": self.last_index,
+            "count": self.count,
+            "mean": {key: total / self.count for key, total in self.sums.items()},
+            "min": dict(self.mins),
+            "max": dict(self.maxs)
+        }
+
+
+class HistoryStore:
+    """
+    Fixed-capacity ring buffer of history records with downsampled overflow.
+
+    The newest ``capacity`` records are kept verbatim. Older records are
+    folded into :class:`AggregateBucket` summaries of ``bucket_size``
+    records each, and only the newest ``max_buckets`` summaries are retained.
+    Records are stored by reference, so a dict shared between several stores
+    is held once.
+
+    The numeric fields ``summarize`` pulls from each record are also kept in
+    float64 columns aligned with the ring buffer (NaN where a field is
+    missing). ``column(name)`` reads a field across the retained records
+    without touching the nested dicts, and eviction folds the stored values
+    instead of re-summarizing the record.
+    """
+
+    def __init__(self, capacity: Optional[int] = DEFAULT_HISTORY_SIZE,
+                 summarize: Optional[Callable[[Dict], Dict[str, float]]] = None,
+                 bucket_size: int = 100, max_buckets: int = 100):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be positive or None")
+        self.capacity = capacity
+        self.summarize = summarize
+        self.bucket_size = bucket_size
+        self.aggregates = deque(maxlen=max_buckets)
+
+        self._buffer = []
+        self._start = 0
+        self._appended = 0
+        self._bucket = None
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self._buffer)
+
+    @property
+    def total_appended(self) -> int:
+        """Number of records ever appended, including evicted ones."""
+        return self._appended
+
+    def append(self, record):
+        values = self.summarize(record) if self.summarize is not None else None
+        if self.capacity is None or len(self._buffer) < self.capacity:
+            slot = len(self._buffer)
+            self._buffer.append(record)
+        else:
+            slot = self._start
+            self._buffer[slot] = record
+            self._start = (self._start + 1) % self.capacity
+            self._fold_values(self._row(slot), self._appended - self.capacity)
+        if values is not None:
+            self._store_row(slot, values)
+        self._appended += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def _store_row(self, slot: int, values: Dict[str, float]):
+        """Write one record's summary into the columns at buffer position ``slot``."""
+        size = len(self._buffer) if self.capacity is None else self.capacity
+        for key in values.keys() - self._columns.keys():
+            self._columns[key] = np.full(max(size, 1), np.nan)
+        for key, column in self._columns.items():
+            if slot >= len(column):  # unbounded store: grow geometrically
+                column = np.concatenate([column, np.full(len(column), np.nan)])
+                self._columns[key] = column
+            value = values.get(key)
+            column[slot] = np.nan if value is None else value
+
+    def _row(self, slot: int) -> Dict[str, Optional[float]]:
+        return {
+            key: None if np.isnan(column[slot]) else float(column[slot])
+            for key, column in self._columns.items()
+        }
+
+    def column(self, name: str) -> np.ndarray:
+        """A summary field of the retained records, oldest first (NaN where missing)."""
+        n = len(self._buffer)
+        column = self._columns.get(name)
+        if column is None:
+            return np.full(n, np.nan)
+        if self.capacity is None or n < self.capacity:
+            return column[:n].copy()
+        return np.concatenate([column[self._start:n], column[:self._start]])
+
+    def _fold(self, record, index):
+        """Add an evicted record to the current aggregate bucket."""
+        if self.summarize is not None:
+            self._fold_values(self.summarize(record), index)
+
+    def _fold_values(self, values: Dict[str, float], index: int):
+        if self.summarize is None:
+            return
+        if self._bucket is None:
+            self._bucket = AggregateBucket(index)
+        self._bucket.add(index, values)
+        if self._bucket.count >= self.bucket_size:
+            self.aggregates.append(self._bucket)
+            self._bucket = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self._buffer)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("history index out of range")
+        if self.capacity is None or n < self.capacity:
+            return self._buffer[index]
+        return self._buffer[(self._start + index) % self.capacity]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def clear(self):
+        self._buffer = []
+        self._start = 0
+        self._appended = 0
+        self._bucket = None
+        self._columns = {}
+        self.aggregates.clear()
+
+    def view(self) -> "HistoryView":
+        """Return a live, read-only view instead of copying the records."""
+        return HistoryView(self)
+
+    def get_aggregates(self):
+        """Return summaries of evicted records, oldest first."""
+        buckets = list(self.aggregates)
+        if self._bucket is not None:
+            buckets.append(self._bucket)
+        return [bucket.to_dict() for bucket in buckets]
+
+    def to_list(self):
+        return list(self)
+
+    def state(self) -> Dict:
+        """Return a JSON-serializable snapshot that ``load_state`` restores."""
+        return {
+            "records": self.to_list(),
+            "total_appended": self._appended,
+            "aggregates": [bucket.state() for bucket in self.aggregates],
+            "open_bucket": self._bucket.state() if self._bucket is not None else None
+        }
+
+    def load_state(self, state: Dict):
+        """Replace the contents with a snapshot taken by ``state()``."""
+        self.clear()
+        self.aggregates.extend(AggregateBucket.from_state(b) for b in state["aggregates"])
+        if state["open_bucket"] is not None:
+            self._bucket = AggregateBucket.from_state(state["open_bucket"])
+
+        records = state["records"]
+        first_index = state["total_appended"] - len(records)
+        excess = 0 if self.capacity is None else max(len(records) - self.capacity, 0)
+        for offset, record in enumerate(records[:excess]):
+            self._fold(record, first_index + offset)
+        self._buffer = list(records[excess:])
+        if self.summarize is not None:
+            for slot, record in enumerate(self._buffer):
+                self._store_row(slot, self.summarize(record))
+        self._appended = state["total_appended"]
+
+
+class HistoryView(Sequence):
+    """Read-only, lazily evaluated window onto a :class:`HistoryStore`."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: HistoryStore):
+        self._store = store
+
+    def __len__(self):
+        return len(self._store)
+
+    def __getitem__(self, index):
+        return self._store[index]
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __repr__(self):
+        return f"HistoryView(len={len(self)}, total_appended={self._store.total_appended})"
+
+    @property
+    def aggregates(self):
+        return self._store.get_aggregates()
@@ -0,0 +1,152 @@
+# src/metrics.py
+"""
+Metrics module for chunked, vectorized evaluation of classification models.
+"""
+
+import numpy as np
+from typing import Dict
+from .data import iter_chunks
+
+DEFAULT_BATCH_SIZE = 65536
+
+
+class ConfusionAccumulator:
+    """Running confusion matrix built from batches of labels and predictions."""
+
+    def __init__(self, classes=None):
+        self.classes = np.asarray([] if classes is None else sorted(classes))
+        self.matrix = np.zeros((len(self.classes), len(self.classes)), dtype=np.int64)
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.classes)
+
+    @property
+    def total(self) -> int:
+        return int(self.matrix.sum())
+
+    def update(self, y_true, y_pred):
+        """
+        Add one batch of labels and predictions to the matrix.
+
+        Args:
+            y_true: Ground-truth labels for the batch
+            y_pred: Model predictions for the same rows
+        """
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        if y_true.shape != y_pred.shape:
+            raise ValueError(
+                f"labels and predictions differ in length: {y_true.size} != {y_pred.size}"
+            )
+        if y_true.size == 0:
+            return self
+
+        self._register_classes(y_true, y_pred)
+        n = self.n_classes
+        true_idx = np.searchsorted(self.classes, y_true)
+        pred_idx = np.searchsorted(self.classes, y_pred)
+        counts = np.bincount(true_idx * n + pred_idx, minlength=n * n)
+        self.matrix += counts.reshape(n, n)
+        return self
+
+    def merge(self, other: "ConfusionAccumulator"):
+        """Fold another accumulator's counts into this one."""
+        if other.n_classes:
+            self._register_classes(other.classes)
+            idx = np.searchsorted(self.classes, other.classes)
+            self.matrix[np.ix_(idx, idx)] += other.matrix
+        return self
+
+    def subtract(self, other: "ConfusionAccumulator"):
+        """Remove another accumulator's counts, e.g. when a window expires."""
+        if other.n_classes:
+            idx = np.searchsorted(self.classes, other.classes)
+            self.matrix[np.ix_(idx, idx)] -= other.matrix
+        return self
+
+    def _register_classes(self, *arrays):
+        """Grow the matrix when previously unseen labels appear."""
+        seen = np.unique(np.concatenate([np.unique(a) for a in arrays]))
+        if self.n_classes and np.isin(seen, self.classes).all():
+            return
+
+        classes = np.union1d(self.classes, seen) if self.n_classes else seen
+        matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+        if self.n_classes:
+            idx = np.searchsorted(classes, self.classes)
+            matrix[np.ix_(idx, idx)] = self.matrix
+        self.classes = classes
+        self.matrix = matrix
+
+    def metrics(self) -> Dict:
+        """Return accuracy and macro-averaged precision, recall and F1."""
+        return metrics_from_confusion(self.matrix, self.classes)
+
+
+def metrics_from_confusion(matrix, classes) -> Dict:
+    """
+    Derive classification metrics from a confusion matrix.
+
+    Args:
+        matrix: Square matrix with true labels on rows and predictions on columns
+        classes: Label for each row/column of the matrix
+
+    Returns:
+        dict: Accuracy, macro precision/recall/F1 and per-class breakdown
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    total = matrix.sum()
+    tp = np.diag(matrix)
+    support = matrix.sum(axis=1)
+    predicted = matrix.sum(axis=0)
+
+    precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+    recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+    denom = precision + recall
+    f1 = np.divide(2 * precision * recall, denom, out=np.zeros_like(tp), where=denom > 0)
+
+    # Macro averages only over classes that actually occur in the labels
+    present = support > 0
+    per_class = {
+        str(label.item() if hasattr(label, "item") else label): {
+            "precision": float(precision[i]),
+            "recall": float(recall[i]),
+            "f1_score": float(f1[i]),
+            "support": int(support[i])
+        }
+        for i, label in enumerate(classes)
+    }
+
+    return {
+        "accuracy": float(tp.sum() / total) if total else 0.0,
+        "precision": float(precision[present].mean()) if present.any() else 0.0,
+        "recall": float(recall[present].mean()) if present.any() else 0.0,
+        "f1_score": float(f1[present].mean()) if present.any() else 0.0,
+        "n_samples": int(total),
+        "per_class": per_class
+    }
+
+
+def evaluate_model(model, data, labels=None, batch_size: int = DEFAULT_BATCH_SIZE) -> ConfusionAccumulator:
+    """
+    Run ``model.predict`` over ``data`` in fixed-size batches.
+
+    Only one batch of predictions is alive at a time, so memory stays flat
+    regardless of the number of rows.
+
+    Args:
+        model: Any object exposing ``predict``
+        data: Input rows (array, memmap, ``.npy`` path or list), or an
+            iterable of ``(X_chunk, y_chunk)`` pairs when ``labels`` is None
+        labels: Target labels aligned with ``data``
+        batch_size: Rows per ``predict`` call
+
+    Returns:
+        ConfusionAccumulator: Counts for the whole dataset
+    """
+    accumulator = ConfusionAccumulator()
+    for X_chunk, y_chunk in iter_chunks(data, labels, batch_size):
+        accumulator.update(y_chunk, model.predict(X_chunk))
+
+    return accumulator
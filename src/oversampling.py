@@ -0,0 +1,332 @@
+# src/oversampling.py
+"""
+Oversampling module for SMOTE class balancing over reusable neighbour indices.
+"""
+
+import threading
+from collections import OrderedDict
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from .cache import fingerprint_dataset
+
+REGISTRY_SIZE = 8
+REGISTRY_KEY_ROWS = 64
+# Shared neighbour tables list this many times k + 1 neighbours per row, so
+# most rows keep k neighbours inside any training split holding half the data
+TABLE_OVERSHOOT = 3
+
+
+def _kd_tree():
+    try:
+        from sklearn.neighbors import KDTree
+    except ImportError as exc:
+        raise ImportError(
+            "SMOTE candidates require scikit-learn: pip install scikit-learn"
+        ) from exc
+    return KDTree
+
+
+class NeighborIndex:
+    """
+    Append-only k-nearest-neighbour index.
+
+    Points live in one growable buffer and are covered by a few static
+    KD-trees over contiguous ranges, with sizes kept roughly halving
+    (the logarithmic method): ``add`` builds a tree over the new points
+    and merges it with smaller trees at the end, so each point is
+    re-indexed O(log n) times in total and existing large trees are left
+    untouched. ``query`` searches every tree and merges the results.
+    """
+
+    def __init__(self, n_features: int, leaf_size: int = 40):
+        self.n_features = n_features
+        self.leaf_size = leaf_size
+        self._points = np.empty((0, n_features), dtype=np.float64)
+        self._size = 0
+        self._trees: List[Tuple[int, int, object]] = []  # (start, end, KDTree)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points[:self._size]
+
+    @property
+    def n_trees(self) -> int:
+        return len(self._trees)
+
+    def add(self, points) -> "NeighborIndex":
+        points = np.asarray(points, dtype=np.float64).reshape(-1, self.n_features)
+        if not len(points):
+            return self
+        end = self._size + len(points)
+        if end > len(self._points):
+            grown = np.empty((max(end, 2 * len(self._points)), self.n_features), dtype=np.float64)
+            grown[:self._size] = self._points[:self._size]
+            self._points = grown
+        self._points[self._size:end] = points
+
+        start = self._size
+        while self._trees and self._trees[-1][1] - self._trees[-1][0] <= end - start:
+            start = self._trees.pop()[0]
+        KDTree = _kd_tree()
+        self._trees.append((start, end, KDTree(self._points[start:end], leaf_size=self.leaf_size)))
+        self._size = end
+        return self
+
+    def query(self, X, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The ``k`` nearest indexed points of every row of ``X``.
+
+        Returns:
+            tuple: ``(distances, indices)``, each of shape ``(len(X), k)``,
+            nearest first; indices are insertion positions
+        """
+        if k > self._size:
+            raise ValueError(f"cannot query {k} neighbours of {self._size} points")
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.n_features)
+        distances, indices = [], []
+        for start, end, tree in self._trees:
+            d, i = tree.query(X, k=min(k, end - start))
+            distances.append(d)
+            indices.append(i + start)
+        if len(distances) == 1:
+            return distances[0], indices[0]
+
+        distances = np.concatenate(distances, axis=1)
+        indices = np.concatenate(indices, axis=1)
+        order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(distances, order, axis=1), np.take_along_axis(indices, order, axis=1)
+
+
+class SMOTEOversampler:
+    """
+    SMOTE that keeps its per-class neighbour indices between calls.
+
+    Every class except the majority is topped up to the majority count
+    with points interpolated between a random member and one of its
+    ``k_neighbors`` nearest same-class neighbours. Each class keeps a
+    ``NeighborIndex`` and, once it is oversampled, a table of every
+    member's nearest neighbours, so synthetic samples are drawn in one vectorized gather per class. When
+    ``fit_resample`` receives the rows it saw last time plus new ones
+    appended at the end (checked by hashing the previously indexed rows),
+    only the new rows are indexed and merged into the tables; any other
+    input rebuilds them. A cycle on unchanged or growing data therefore
+    costs the hash plus work proportional to the new and synthetic samples.
+
+    Output depends only on the input and ``random_state`` (up to ties
+    between equidistant neighbours), never on what was indexed before.
+
+    Worker processes cannot keep indices between tasks, so the parent
+    builds a ``shared_neighbor_table`` of the whole dataset and workers
+    pass the rows of their training split to ``fit_resample(neighbors=...)``:
+    a row's nearest neighbours within any subset are the first entries of
+    its global list that fall inside the subset.
+    """
+
+    def __init__(self, k_neighbors: int = 5, random_state: int = 42):
+        if k_neighbors < 1:
+            raise ValueError("k_neighbors must be at least 1")
+        self.k_neighbors = k_neighbors
+        self.random_state = random_state
+        self._indices: Dict = {}  # class label -> NeighborIndex
+        self._tables: Dict = {}  # class label -> (distances, neighbours), self included
+        self._n_rows = 0
+        self._fingerprint = None
+        self._shape = None
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+
+    def partial_fit(self, X, y) -> "SMOTEOversampler":
+        """Index new rows of every class and update existing neighbour tables."""
+        X, y = np.asarray(X), np.asarray(y)
+        for label in np.unique(y):
+            index = self._indices.get(label)
+            if index is None:
+                index = self._indices[label] = NeighborIndex(X.shape[1])
+            new_points = np.asarray(X[y == label], dtype=np.float64)
+            index.add(new_points)
+            if label in self._tables:
+                self._tables[label] = self._extend_table(index, self._tables[label], new_points)
+        return self
+
+    def _table(self, label):
+        """Neighbour table of ``label``, built the first time the class is oversampled."""
+        table = self._tables.get(label)
+        if table is None:
+            index = self._indices[label]
+            table = self._tables[label] = index.query(index.points, min(self.k_neighbors + 1, len(index)))
+        return table
+
+    def _extend_table(self, index: NeighborIndex, table, new_points: np.ndarray):
+        k = min(self.k_neighbors + 1, len(index))
+        n_old = len(index) - len(new_points)
+        if table[0].shape[1] < k:
+            return index.query(index.points, k)
+
+        # Old rows: merge their neighbour lists with the nearest new points
+        m = min(k, len(new_points))
+        d_new, i_new = _kd_tree()(new_points).query(index.points[:n_old], k=m)
+        distances = np.concatenate([table[0], d_new], axis=1)
+        neighbours = np.concatenate([table[1], i_new + n_old], axis=1)
+        order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+        old = (np.take_along_axis(distances, order, axis=1), np.take_along_axis(neighbours, order, axis=1))
+
+        new = index.query(new_points, k)
+        return np.concatenate([old[0], new[0]]), np.concatenate([old[1], new[1]])
+
+    def _sync(self, X, y, fingerprint: Optional[str] = None):
+        """Bring the indices up to date with ``X``/``y``, reusing them if possible."""
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            return  # same rows as last time, known without hashing them
+        seen = self._n_rows
+        prefix = None
+        if self._fingerprint is not None and len(y) >= seen and X.shape[1:] == self._shape:
+            prefix = fingerprint_dataset(X[:seen], y[:seen])
+        if prefix is None or prefix != self._fingerprint:
+            self._indices, self._tables = {}, {}
+            self.rebuilds += 1
+            seen = 0
+        elif len(y) == seen:
+            return  # same rows as last time
+        self.partial_fit(X[seen:], y[seen:])
+        self._n_rows = len(y)
+        self._shape = X.shape[1:]
+        self._fingerprint = fingerprint or fingerprint_dataset(X, y)
+
+    def neighbor_table(self, X, y, fingerprint: Optional[str] = None) -> np.ndarray:
+        """
+        Same-class neighbours of every row of ``X`` as row indices.
+
+        ``fingerprint`` is ``fingerprint_dataset(X, y)``, if the caller has
+        it, so unchanged rows are recognised without hashing them.
+
+        Returns:
+            array: ``(len(y), k_neighbors + 1)`` int64, nearest first (each
+            row itself or a duplicate of it first), padded with -1 for
+            classes smaller than the table
+        """
+        X, y = np.asarray(X), np.asarray(y)
+        table = np.full((len(y), self.k_neighbors + 1), -1, dtype=np.int64)
+        with self._lock:
+            self._sync(X, y, fingerprint)
+            for label in self._indices:
+                rows = np.flatnonzero(y == label)  # insertion order is row order
+                neighbours = self._table(label)[1]
+                table[rows, :neighbours.shape[1]] = rows[neighbours]
+        return table
+
+    def fit_resample(self, X, y, neighbors=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``X``/``y`` with synthetic minority rows appended.
+
+        Args:
+            X: Feature rows
+            y: Labels
+            neighbors: Optional ``(len(y), width)`` table of same-class
+                neighbour row positions in ``X`` (-1 for rows outside it),
+                e.g. ``window_neighbors`` of a ``shared_neighbor_table``;
+                used instead of this oversampler's own indices
+        """
+        X, y = np.asarray(X), np.asarray(y)
+        labels, counts = np.unique(y, return_counts=True)
+        target = counts.max() if len(counts) else 0
+        rng = np.random.default_rng([self.random_state, len(y)])
+
+        new_X, new_y = [X], [y]
+        with self._lock:
+            if neighbors is None:
+                self._sync(X, y)
+            for label, count in zip(labels, counts):
+                n_new = target - count
+                if n_new == 0 or count < 2:
+                    continue  # majority class, or nothing to interpolate between
+                if neighbors is None:
+                    points = self._indices[label].points
+                    table = self._table(label)[1]
+                else:
+                    points, table = self._class_table(X, y, label, neighbors)
+                base = rng.integers(0, count, size=n_new)
+                # Column 0 is the point itself (or a duplicate of it)
+                pick = table[base, rng.integers(1, table.shape[1], size=n_new)]
+                gap = rng.random((n_new, 1))
+                new_X.append(points[base] + gap * (points[pick] - points[base]))
+                new_y.append(np.full(n_new, label, dtype=y.dtype))
+
+        return np.concatenate(new_X).astype(np.result_type(X.dtype, np.float64), copy=False), \
+            np.concatenate(new_y)
+
+    def _class_table(self, X, y, label, neighbors):
+        """Points of ``label`` and their k + 1 nearest, as positions within the class."""
+        rows = np.flatnonzero(y == label)
+        points = np.asarray(X[rows], dtype=np.float64)
+        width = min(self.k_neighbors + 1, len(rows))
+        position = np.full(len(y), -1, dtype=np.int64)
+        position[rows] = np.arange(len(rows))
+
+        candidates = np.asarray(neighbors)[rows]
+        candidates = np.where(candidates >= 0, position[np.maximum(candidates, 0)], -1)
+        valid = candidates >= 0
+        # Keep the first ``width`` valid entries of every row, nearest first
+        order = np.argsort(~valid, axis=1, kind="stable")[:, :width]
+        table = np.take_along_axis(candidates, order, axis=1)
+        short = np.flatnonzero(valid.sum(axis=1) < width)
+        if len(short):
+            # Too few listed neighbours fall in this subset: search it directly
+            table[short] = _kd_tree()(points).query(points[short], k=width)[1]
+        return points, table
+
+
+def window_neighbors(neighbors, start: int, size: int, n_rows: int) -> np.ndarray:
+    """
+    Renumber the neighbour table of a window of rows for the window itself.
+
+    The window is the ``size`` rows from position ``start`` of an
+    ``n_rows``-row table, wrapping around to position 0 after the end (as
+    in a cross-validation training set that skips one fold); ``neighbors``
+    holds just the window's rows. Neighbours outside the window become -1.
+    """
+    neighbors = np.asarray(neighbors, dtype=np.int64)
+    local = (neighbors - start) % n_rows
+    return np.where((neighbors >= 0) & (local < size), local, -1)
+
+
+def shared_neighbor_table(X, y, k_neighbors: int = 5, incremental: bool = True,
+                          fingerprint: Optional[str] = None) -> np.ndarray:
+    """
+    ``TABLE_OVERSHOOT * (k_neighbors + 1)`` same-class neighbours of every
+    row, for workers that oversample subsets of ``X``.
+
+    Built by this process's ``shared_oversampler`` for the dataset, so a
+    later call on the same rows plus appended ones only indexes the new rows.
+    With ``incremental=False`` (a one-off sample of the data) a throwaway
+    oversampler is used instead, leaving the registry alone.
+    ``fingerprint`` is passed on to ``neighbor_table``.
+    """
+    width = TABLE_OVERSHOOT * (k_neighbors + 1)
+    if not incremental:
+        return SMOTEOversampler(width - 1, random_state=0).neighbor_table(X, y)
+    return shared_oversampler(X, k_neighbors=width - 1, random_state=0).neighbor_table(X, y, fingerprint)
+
+
+_registry: "OrderedDict[tuple, SMOTEOversampler]" = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def shared_oversampler(X, k_neighbors: int = 5, random_state: int = 42) -> SMOTEOversampler:
+    """
+    The process-wide oversampler for the dataset ``X`` belongs to.
+
+    Datasets are told apart by their first rows, which stay the same as
+    rows are appended, so successive cycles on a growing dataset reuse one
+    oversampler. The least recently used of ``REGISTRY_SIZE`` is dropped.
+    """
+    X = np.asarray(X)
+    key = (k_neighbors, random_state, X.shape[1:], fingerprint_dataset(X[:REGISTRY_KEY_ROWS]))
+    with _registry_lock:
+        oversampler = _registry.pop(key, None) or SMOTEOversampler(k_neighbors, random_state)
+        _registry[key] = oversampler
+        while len(_registry) > REGISTRY_SIZE:
+            _registry.popitem(last=False)
+    return oversampler
@@ -0,0 +1,88 @@
+# src/pareto.py
+"""
+Pareto module for an incrementally maintained multi-objective candidate front.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+
+class ParetoFront:
+    """
+    Non-dominated set over (accuracy, p99 latency, model size).
+
+    Accuracy is maximised; latency and size are minimised. Each insertion
+    is compared only against the current front (vectorized), never against
+    every candidate seen, and dominated members are dropped on the spot.
+    """
+
+    def __init__(self):
+        # Stored as (-accuracy, latency, size) so every column is minimised
+        self._objectives = np.empty((0, 3), dtype=np.float64)
+        self._payloads: List[Any] = []
+        self.inserted = 0
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def insert(self, accuracy: float, latency: float, size: float, payload: Any = None) -> bool:
+        """
+        Offer a candidate to the front.
+
+        Returns:
+            bool: True if the candidate joined the front
+        """
+        self.inserted += 1
+        point = np.array([-accuracy, latency, size], dtype=np.float64)
+        front = self._objectives
+
+        if len(front):
+            # Weakly dominated (including exact duplicates) candidates are rejected
+            if np.any(np.all(front <= point, axis=1)):
+                return False
+            survivors = ~np.all(point <= front, axis=1)
+            if not survivors.all():
+                front = front[survivors]
+                self._payloads = [p for p, keep in zip(self._payloads, survivors) if keep]
+
+        self._objectives = np.vstack([front, point])
+        self._payloads.append(payload)
+        return True
+
+    def query(self, max_latency: Optional[float] = None, max_size: Optional[float] = None,
+              min_accuracy: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the most accurate front member meeting the constraints.
+
+        The most accurate candidate under any latency/size budget is always
+        on the front, so only front members need to be checked.
+        """
+        if not len(self):
+            return None
+
+        accuracy = -self._objectives[:, 0]
+        mask = np.ones(len(self), dtype=bool)
+        if max_latency is not None:
+            mask &= self._objectives[:, 1] <= max_latency
+        if max_size is not None:
+            mask &= self._objectives[:, 2] <= max_size
+        if min_accuracy is not None:
+            mask &= accuracy >= min_accuracy
+        if not mask.any():
+            return None
+
+        candidates = np.flatnonzero(mask)
+        return self._payloads[candidates[np.argmax(accuracy[candidates])]]
+
+    def members(self) -> List[Dict]:
+        """Return the front as dicts ordered by decreasing accuracy."""
+        order = np.argsort(self._objectives[:, 0], kind="stable")
+        return [
+            {
+                "accuracy": float(-self._objectives[i, 0]),
+                "latency_p99": float(self._objectives[i, 1]),
+                "model_size_bytes": float(self._objectives[i, 2]),
+                "payload": self._payloads[i]
+            }
+            for i in order
+        ]
@@ -0,0 +1,144 @@
+# src/pipeline.py
+"""
+Pipeline module for overlapping the phases of consecutive cycles.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+_DONE = object()
+
+
+class PipelineStage:
+    """One stage: a blocking function run on its own worker thread."""
+
+    __slots__ = ("name", "fn", "pool", "items", "busy_seconds", "blocked_seconds")
+
+    def __init__(self, name: str, fn: Callable[[Any], None]):
+        self.name = name
+        self.fn = fn
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"srdf-{name}")
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0  # waiting for room in the downstream queue
+
+
+class CyclePipeline:
+    """
+    Runs items through a chain of blocking stages concurrently.
+
+    Each stage processes one item at a time, in submission order, on its own
+    thread, so stage ``i`` can work on item N+1 while stage ``i + 1`` works
+    on item N. Stages are connected by ``asyncio.Queue``s of ``queue_size``
+    items; a slow stage fills its input queue and stalls everything upstream
+    (backpressure) instead of letting work pile up.
+    """
+
+    def __init__(self, stages: Sequence[Tuple[str, Callable[[Any], None]]],
+                 queue_size: int = 1,
+                 on_complete: Optional[Callable[[Any], None]] = None):
+        self.stages = [PipelineStage(name, fn) for name, fn in stages]
+        self.queue_size = queue_size
+        self.on_complete = on_complete
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        self._started = None
+        self._finished = None
+        self.submit_blocked_seconds = 0.0
+
+    def start(self):
+        """Start the stage workers on the running event loop."""
+        self._queues = [asyncio.Queue(self.queue_size) for _ in self.stages]
+        self._tasks = [
+            asyncio.ensure_future(self._work(i)) for i in range(len(self.stages))
+        ]
+        self._started = time.perf_counter()
+        self._finished = None
+
+    async def submit(self, item):
+        """Queue an item for the first stage, waiting while the queue is full."""
+        waited = time.perf_counter()
+        await self._queues[0].put(item)
+        self.submit_blocked_seconds += time.perf_counter() - waited
+
+    async def drain(self):
+        """Finish every submitted item, then stop the workers."""
+        if not self._tasks:
+            return
+        await self._queues[0].put(_DONE)
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            self._close()
+
+    def cancel(self):
+        """Stop immediately; items in flight are dropped."""
+        for task in self._tasks:
+            task.cancel()
+        self._close()
+
+    async def join(self):
+        """Wait, without blocking the loop, for calls interrupted by ``cancel()`` to finish."""
+        loop = asyncio.get_running_loop()
+        for stage in self.stages:
+            await loop.run_in_executor(None, stage.pool.shutdown)
+
+    def _close(self):
+        if self._finished is None:
+            self._finished = time.perf_counter()
+        for stage in self.stages:
+            # A blocking call interrupted by cancel() finishes in the background
+            stage.pool.shutdown(wait=False)
+        self._tasks = []
+
+    async def _work(self, index: int):
+        loop = asyncio.get_running_loop()
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self.stages) else None
+        while True:
+            item = await inbox.get()
+            if item is not _DONE:
+                started = time.perf_counter()
+                await loop.run_in_executor(stage.pool, stage.fn, item)
+                stage.busy_seconds += time.perf_counter() - started
+                stage.items += 1
+            if outbox is not None:
+                waited = time.perf_counter()
+                await outbox.put(item)
+                stage.blocked_seconds += time.perf_counter() - waited
+            elif item is not _DONE and self.on_complete is not None:
+                self.on_complete(item)
+            if item is _DONE:
+                return
+
+    def stats(self) -> Dict:
+        """
+        Per-stage utilisation since ``start()``.
+
+        ``utilization`` is the fraction of wall time a stage spent working;
+        the stage with the highest utilisation is the ``bottleneck`` that
+        bounds cycle throughput.
+        """
+        if self._started is None:
+            return {"wall_seconds": 0.0, "stages": {}, "bottleneck": None}
+        end = self._finished if self._finished is not None else time.perf_counter()
+        wall = max(end - self._started, 1e-9)
+        stages = {
+            stage.name: {
+                "items": stage.items,
+                "busy_seconds": stage.busy_seconds,
+                "blocked_seconds": stage.blocked_seconds,
+                "utilization": stage.busy_seconds / wall
+            }
+            for stage in self.stages
+        }
+        bottleneck = max(stages, key=lambda name: stages[name]["utilization"]) if stages else None
+        return {
+            "wall_seconds": wall,
+            "submit_blocked_seconds": self.submit_blocked_seconds,
+            "stages": stages,
+            "bottleneck": bottleneck
+        }
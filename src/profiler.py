@@ -0,0 +1,82 @@
+# src/profiler.py
+"""
+Profiler module for measuring model inference latency and throughput.
+"""
+
+import time
+import numpy as np
+from typing import Dict, Sequence
+
+DEFAULT_BATCH_SIZES = (1, 32, 256)
+
+
+def profile_inference(model, data, batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+                      warmup_runs: int = 2, repeats: int = 10) -> Dict:
+    """
+    Benchmark ``model.predict`` over a sweep of batch sizes.
+
+    Each batch size gets ``warmup_runs`` untimed calls followed by
+    ``repeats`` timed calls on the leading rows of ``data``. Batch sizes
+    larger than ``data`` are skipped; if none fit, the whole sample is used.
+
+    Args:
+        model: Any object exposing ``predict``
+        data: Sample rows to feed the model
+        batch_sizes: Batch sizes to sweep
+        warmup_runs: Untimed calls before measuring
+        repeats: Timed calls per batch size
+
+    Returns:
+        dict: Per-batch-size p50/p95/p99 latency (seconds) and rows per second
+    """
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+
+    n_rows = len(data)
+    sizes = sorted({size for size in batch_sizes if 0 < size <= n_rows})
+    if not sizes and n_rows:
+        sizes = [n_rows]
+
+    profile = {}
+    for size in sizes:
+        batch = data[:size]
+        for _ in range(warmup_runs):
+            model.predict(batch)
+
+        latencies = np.empty(repeats)
+        for i in range(repeats):
+            start = time.perf_counter()
+            model.predict(batch)
+            latencies[i] = time.perf_counter() - start
+
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        mean = latencies.mean()
+        profile[size] = {
+            "latency_p50": float(p50),
+            "latency_p95": float(p95),
+            "latency_p99": float(p99),
+            "rows_per_second": float(size / mean) if mean > 0 else float("inf")
+        }
+
+    return profile
+
+
+def summarize_profile(profile: Dict) -> Dict:
+    """
+    Flatten a profile into headline latency/throughput metrics.
+
+    Latency is reported for the smallest batch size (request latency);
+    throughput is the best rows-per-second across the sweep.
+    """
+    if not profile:
+        return {}
+
+    smallest = profile[min(profile)]
+    return {
+        "inference_time": smallest["latency_p99"],
+        "latency_p50": smallest["latency_p50"],
+        "latency_p95": smallest["latency_p95"],
+        "latency_p99": smallest["latency_p99"],
+        "throughput_rows_per_second": max(p["rows_per_second"] for p in profile.values()),
+        "latency_profile": {str(size): stats for size, stats in profile.items()}
+    }
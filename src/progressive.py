@@ -0,0 +1,90 @@
+# src/progressive.py
+"""
+Progressive module for deciding metric thresholds on growing stratified subsamples.
+"""
+
+import math
+import numpy as np
+from statistics import NormalDist
+from typing import List, Optional, Tuple
+
+DEFAULT_GROWTH = 4.0
+DEFAULT_MIN_ROWS = 1000
+
+
+def stratified_order(labels, random_state: int = 0) -> np.ndarray:
+    """
+    Row permutation whose every prefix is a stratified random sample.
+
+    Rows are shuffled within their class and each gets the key
+    ``(rank in class + u) / class size`` with ``u`` uniform in [0, 1), so
+    sorting by key interleaves the classes in proportion to their sizes.
+    """
+    labels = np.asarray(labels)
+    rng = np.random.default_rng(random_state)
+    shuffled = rng.permutation(len(labels))
+    by_class = shuffled[np.argsort(labels[shuffled], kind="stable")]
+
+    _, first, counts = np.unique(labels[by_class], return_index=True, return_counts=True)
+    class_size = np.repeat(counts, counts)
+    rank = np.arange(len(labels)) - np.repeat(first, counts)
+    keys = (rank + rng.random(len(labels))) / class_size
+    return by_class[np.argsort(keys, kind="stable")]
+
+
+def sample_schedule(n_rows: int, start_fraction: float, growth: float = DEFAULT_GROWTH,
+                    min_rows: int = DEFAULT_MIN_ROWS) -> List[int]:
+    """
+    Increasing sample sizes: ``start_fraction`` of the rows (at least
+    ``min_rows``), multiplied by ``growth`` until the whole dataset.
+    """
+    if not 0 < start_fraction <= 1:
+        raise ValueError("start_fraction must be in (0, 1]")
+    if growth <= 1:
+        raise ValueError("growth must be greater than 1")
+    sizes = []
+    size = max(min_rows, math.ceil(n_rows * start_fraction))
+    while size < n_rows:
+        sizes.append(size)
+        size = math.ceil(size * growth)
+    sizes.append(n_rows)
+    return sizes
+
+
+def wilson_interval(successes: float, n: float, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = float(successes) / n
+    denom = 1 + z ** 2 / n
+    centre = (p + z ** 2 / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def macro_recall_interval(matrix, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Normal-approximation interval for macro-averaged recall.
+
+    Per-class recalls are independent binomial proportions over their
+    class's rows; a Wilson-style ``z^2`` correction keeps the interval
+    from collapsing when a class's recall is 0 or 1 on a small sample.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    support = matrix.sum(axis=1)
+    present = support > 0
+    if not present.any():
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    n = support[present]
+    recall = np.diag(matrix)[present] / n
+    variance = (recall * (1 - recall) + z ** 2 / (4 * n)) / n
+    mean = float(recall.mean())
+    half = z * math.sqrt(variance.sum()) / int(present.sum())
+    return max(0.0, mean - half), min(1.0, mean + half)
+
+
+def decides(interval: Optional[Tuple[float, float]], threshold: float) -> bool:
+    """True when the whole interval lies on one side of ``threshold``."""
+    return interval is not None and (interval[0] >= threshold or interval[1] < threshold)
@@ -0,0 +1,145 @@
+# src/scheduler.py
+"""
+Scheduler module for deciding when SRDF cycles run.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import Counter
+from typing import Awaitable, Callable, List, Optional, Set
+
+TRIGGER_START = "start"
+TRIGGER_INTERVAL = "interval"
+TRIGGER_MANUAL = "manual"
+TRIGGER_METRIC = "metric"
+TRIGGER_DRIFT = "drift"
+
+
+class CycleScheduler:
+    """
+    Event-driven asyncio scheduler for evolution cycles.
+
+    A cycle runs immediately on start, then whenever ``interval`` seconds
+    have passed since the previous cycle finished, or earlier when an event
+    trigger (manual, metric, drift) fires. Event triggers are debounced: none
+    is served sooner than ``debounce`` seconds after the previous cycle, and
+    every trigger fired meanwhile is coalesced into that one cycle. Waiting
+    never blocks the event loop, and ``stop()`` cancels the run at once, even
+    mid-cycle. A ``stop()`` that arrives before ``run()`` has started is not
+    lost: that run returns without cycling. ``reset()`` forgets a stop, so the
+    owner calls it before starting a new run. A cycle has "finished" when
+    ``cycle_fn`` returns; a ``cycle_fn`` that only queues the work (the
+    pipelined framework) therefore spaces cycle starts, not completions.
+    """
+
+    def __init__(self, interval: Optional[float] = 3600.0, debounce: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.interval = interval
+        self.debounce = debounce
+        self.clock = clock
+        self.trigger_counts = Counter()
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._wake = None
+        self._task = None
+        self._stopped = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def stopped(self) -> bool:
+        """True once ``stop()`` ended the current or last run."""
+        return self._stopped
+
+    def trigger(self, reason: str = TRIGGER_MANUAL):
+        """Request a cycle. Safe to call from any thread."""
+        with self._lock:
+            self._pending.add(reason)
+            loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    def reset(self):
+        """Clear an earlier ``stop()`` so the next ``run()`` cycles again."""
+        with self._lock:
+            self._stopped = False
+
+    def stop(self):
+        """Cancel the run immediately. Safe to call from any thread."""
+        with self._lock:
+            self._stopped = True
+            loop, task = self._loop, self._task
+        if loop is not None and task is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    async def run(self, cycle_fn: Callable[[int, List[str]], Awaitable],
+                  max_cycles: Optional[int] = None) -> List:
+        """
+        Run cycles until ``max_cycles`` complete or ``stop()`` is called.
+
+        Args:
+            cycle_fn: Coroutine function called with the cycle number and
+                the sorted trigger reasons
+            max_cycles: Upper bound on cycles (None for no bound)
+
+        Returns:
+            list: Results of every cycle that completed
+        """
+        with self._lock:
+            if self._stopped:
+                return []  # stopped before the run began
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.current_task()
+
+        results = []
+        last_end = None
+        try:
+            while max_cycles is None or len(results) < max_cycles:
+                reasons = await self._next_trigger(last_end)
+                self.trigger_counts.update(reasons)
+                results.append(await cycle_fn(len(results), reasons))
+                last_end = self.clock()
+        except asyncio.CancelledError:
+            if not self._stopped:
+                raise
+        finally:
+            with self._lock:
+                self._loop = self._wake = self._task = None
+        return results
+
+    async def _next_trigger(self, last_end: Optional[float]) -> List[str]:
+        """Wait until a cycle is due and return why."""
+        if last_end is None:
+            with self._lock:
+                reasons = self._pending | {TRIGGER_START}
+                self._pending = set()
+            return sorted(reasons)
+
+        interval_at = last_end + self.interval if self.interval is not None else math.inf
+        while True:
+            # Cleared before reading, so a trigger racing with the read still wakes us
+            self._wake.clear()
+            with self._lock:
+                pending = bool(self._pending)
+            event_at = last_end + self.debounce if pending else math.inf
+            now = self.clock()
+
+            if now >= min(interval_at, event_at):
+                with self._lock:
+                    reasons = self._pending
+                    self._pending = set()
+                if now >= interval_at:
+                    reasons.add(TRIGGER_INTERVAL)
+                return sorted(reasons)
+
+            timeout = min(interval_at, event_at) - now
+            try:
+                await asyncio.wait_for(self._wake.wait(), None if math.isinf(timeout) else timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,87 @@
+# src/shared.py
+"""
+Shared module for placing cycle datasets in memory-mapped files that worker
+processes open as zero-copy NumPy views.
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# Prefer RAM-backed tmpfs so "files" never touch disk when available
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+COPY_CHUNK_ROWS = 65536
+
+
+class SharedArrayHandle(NamedTuple):
+    """Picklable description of a shared array; cheap to send to workers."""
+
+    path: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    def open(self):
+        """Map the array read-only; pages are shared with every other process."""
+        return np.memmap(self.path, dtype=np.dtype(self.dtype), mode="r", shape=self.shape)
+
+
+class SharedDataset:
+    """
+    Write arrays once into memory-mapped files and hand out handles to them.
+
+    Used as a context manager around one cycle: workers receive
+    :class:`SharedArrayHandle` tuples (a path, shape and dtype), so neither
+    the memory of concurrent workers nor their startup cost grows with the
+    dataset size. Files are removed on ``close()``.
+    """
+
+    def __init__(self, arrays: Dict[str, object], order: Optional[np.ndarray] = None,
+                 directory: Optional[str] = SHARED_DIR):
+        """
+        Args:
+            arrays: Named arrays (arrays, memmaps or lists) with equal row counts
+            order: Optional row permutation applied while copying, e.g. to
+                lay out train rows before validation rows so both are
+                contiguous slices
+            directory: Where to create the backing files
+        """
+        self.directory = tempfile.mkdtemp(prefix="neurocortex-", dir=directory)
+        self.handles = {}
+        try:
+            for name, array in arrays.items():
+                self.handles[name] = self._write(name, array, order)
+        except BaseException:
+            self.close()
+            raise
+
+    def _write(self, name, array, order):
+        """Copy ``array`` into a backing file in bounded chunks."""
+        array = np.asarray(array) if not hasattr(array, "shape") else array
+        n_rows = array.shape[0] if order is None else len(order)
+        shape = (n_rows,) + tuple(array.shape[1:])
+        path = os.path.join(self.directory, f"{name}.bin")
+
+        target = np.memmap(path, dtype=array.dtype, mode="w+", shape=shape)
+        for start in range(0, n_rows, COPY_CHUNK_ROWS):
+            stop = min(start + COPY_CHUNK_ROWS, n_rows)
+            rows = slice(start, stop) if order is None else order[start:stop]
+            target[start:stop] = array[rows]
+        target.flush()
+        del target
+
+        return SharedArrayHandle(path, shape, array.dtype.str)
+
+    def open(self, name: str):
+        return self.handles[name].open()
+
+    def close(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.handles = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,147 @@
+# src/streaming.py
+"""
+Streaming module for sliding-window metric accumulators over live traffic.
+"""
+
+import time
+import numpy as np
+from collections import deque
+from typing import Dict, Optional
+from .metrics import ConfusionAccumulator
+
+
+class _WindowBlock:
+    """One ingested batch: its counts, arrival time and latency."""
+
+    __slots__ = ("timestamp", "y_true", "y_pred", "counts", "latency", "n_rows")
+
+    def __init__(self, timestamp, y_true, y_pred, counts, latency, n_rows):
+        self.timestamp = timestamp
+        self.y_true = y_true
+        self.y_pred = y_pred
+        self.counts = counts
+        self.latency = latency
+        self.n_rows = n_rows
+
+
+class SlidingWindowMetrics:
+    """
+    Confusion-matrix and latency accumulators over a sliding window.
+
+    The window is bounded by sample count (``max_samples``), by age
+    (``max_seconds``), or both. Totals are kept incrementally: adding a batch
+    costs O(batch) and expired batches are subtracted, so reading the current
+    metrics never revisits old data.
+    """
+
+    def __init__(self, max_samples: Optional[int] = None,
+                 max_seconds: Optional[float] = None, clock=time.monotonic):
+        if max_samples is None and max_seconds is None:
+            raise ValueError("set max_samples, max_seconds or both")
+        if max_samples is not None and max_samples <= 0:
+            raise ValueError("max_samples must be positive")
+        if max_seconds is not None and max_seconds <= 0:
+            raise ValueError("max_seconds must be positive")
+
+        self.max_samples = max_samples
+        self.max_seconds = max_seconds
+        self.clock = clock
+
+        self._blocks = deque()
+        self._confusion = ConfusionAccumulator()
+        self._n_rows = 0
+        self._latency_total = 0.0
+        self._latency_batches = 0
+        self._latency_rows = 0
+
+    def __len__(self):
+        self._expire()
+        return self._n_rows
+
+    def add(self, y_true, y_pred, latency: Optional[float] = None):
+        """
+        Add one batch of labelled predictions to the window.
+
+        Args:
+            y_true: Ground-truth labels
+            y_pred: Model predictions for the same rows
+            latency: Seconds spent producing ``y_pred``, if measured
+        """
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        if y_true.size == 0:
+            return self
+
+        counts = ConfusionAccumulator().update(y_true, y_pred)
+        # Raw labels are only needed to trim a block partially on count limits
+        keep_rows = self.max_samples is not None
+        block = _WindowBlock(
+            self.clock(),
+            y_true.copy() if keep_rows else None,
+            y_pred.copy() if keep_rows else None,
+            counts,
+            latency,
+            y_true.size
+        )
+
+        self._blocks.append(block)
+        self._confusion.merge(counts)
+        self._n_rows += block.n_rows
+        if latency is not None:
+            self._latency_total += latency
+            self._latency_batches += 1
+            self._latency_rows += block.n_rows
+
+        self._expire()
+        return self
+
+    def _expire(self):
+        """Drop batches that fell out of the window."""
+        if self.max_seconds is not None:
+            horizon = self.clock() - self.max_seconds
+            while self._blocks and self._blocks[0].timestamp < horizon:
+                self._drop_oldest()
+
+        if self.max_samples is not None:
+            while self._blocks and self._n_rows - self._blocks[0].n_rows >= self.max_samples:
+                self._drop_oldest()
+            excess = self._n_rows - self.max_samples
+            if excess > 0:
+                self._trim_oldest(excess)
+
+    def _drop_oldest(self):
+        block = self._blocks.popleft()
+        self._confusion.subtract(block.counts)
+        self._n_rows -= block.n_rows
+        if block.latency is not None:
+            self._latency_total -= block.latency
+            self._latency_batches -= 1
+            self._latency_rows -= block.n_rows
+
+    def _trim_oldest(self, n_rows):
+        """Remove the first ``n_rows`` samples of the oldest batch."""
+        block = self._blocks[0]
+        removed = ConfusionAccumulator().update(block.y_true[:n_rows], block.y_pred[:n_rows])
+        self._confusion.subtract(removed)
+        block.counts.subtract(removed)
+        if block.latency is not None:
+            # Attribute the batch latency to its rows evenly
+            share = block.latency * n_rows / block.n_rows
+            block.latency -= share
+            self._latency_total -= share
+            self._latency_rows -= n_rows
+        block.y_true = block.y_true[n_rows:]
+        block.y_pred = block.y_pred[n_rows:]
+        block.n_rows -= n_rows
+        self._n_rows -= n_rows
+
+    def metrics(self) -> Dict:
+        """Return current window metrics without touching past batches."""
+        self._expire()
+        metrics = self._confusion.metrics()
+        metrics["window_samples"] = self._n_rows
+        metrics["window_batches"] = len(self._blocks)
+        if self._latency_batches:
+            metrics["mean_batch_latency"] = self._latency_total / self._latency_batches
+            metrics["mean_row_latency"] = self._latency_total / self._latency_rows
+        return metrics
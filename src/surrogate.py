@@ -0,0 +1,142 @@
+# src/surrogate.py
+"""
+Surrogate module for predicting candidate scores before any training happens.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SOLUTION_TYPES = ("accuracy", "recall", "speed", "drift", "general")
+COMPLEXITY_LEVELS = {"low": 0.0, "medium": 1.0, "high": 2.0}
+METRIC_FEATURES = ("accuracy", "precision", "recall", "f1_score")
+
+
+def measured_score(solution: Dict) -> Optional[float]:
+    """The empirical accuracy recorded on a validated solution, if any."""
+    cross_validation = solution.get("cross_validation")
+    if cross_validation is not None and cross_validation["status"] == "ok":
+        return cross_validation["accuracy"]["mean"]
+    evaluation = solution.get("evaluation")
+    if evaluation is not None and evaluation["status"] == "ok":
+        return evaluation["result"]["accuracy"]
+    return None
+
+
+class SurrogateModel:
+    """
+    Bayesian linear regression from candidate descriptors to measured score.
+
+    Features are a one-hot solution type and template, the complexity level,
+    the current Trawler metrics and log inference time. The closed-form
+    posterior gives a predictive mean and standard deviation, which is all
+    that pre-screening needs.
+
+    Fitting is incremental: ``update`` folds each new observation into the
+    sufficient statistics ``Phi.T @ Phi`` (a rank-one update), ``Phi.T @ y``
+    and ``y.T @ y``, then re-solves the small posterior. An update costs
+    the same however many validations came before, and the result equals a
+    batch ``fit`` on every observation seen so far.
+    """
+
+    def __init__(self, prior_precision: float = 1.0, min_samples: int = 10):
+        self.prior_precision = prior_precision
+        self.min_samples = min_samples
+        self._reset()
+
+    def _reset(self):
+        self.templates: Dict[str, int] = {}
+        self.n_samples = 0
+        self._gram = np.zeros((self._n_features(0), self._n_features(0)))
+        self._moment = np.zeros(self._n_features(0))
+        self._sum_y = 0.0
+        self._sum_y2 = 0.0
+        self._mean = None
+        self._covariance = None
+        self._noise_variance = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._mean is not None
+
+    @staticmethod
+    def _n_features(n_templates: int) -> int:
+        return 1 + len(SOLUTION_TYPES) + n_templates + 2 + len(METRIC_FEATURES)
+
+    def _features(self, solution: Dict, performance: Dict) -> np.ndarray:
+        n_types = len(SOLUTION_TYPES)
+        phi = np.zeros(self._n_features(len(self.templates)))
+        phi[0] = 1.0
+        solution_type = solution.get("solution_type", "general")
+        phi[1 + (SOLUTION_TYPES.index(solution_type) if solution_type in SOLUTION_TYPES else n_types - 1)] = 1.0
+        offset = 1 + n_types
+        template = self.templates.get(solution.get("proposed_solution"))
+        if template is not None:
+            phi[offset + template] = 1.0
+        offset += len(self.templates)
+        phi[offset] = COMPLEXITY_LEVELS.get(solution.get("complexity", "medium"), 1.0)
+        phi[offset + 1] = np.log10(max(performance.get("inference_time", 1e-3), 1e-6))
+        offset += 2
+        for i, metric in enumerate(METRIC_FEATURES):
+            phi[offset + i] = performance.get(metric, 0.0)
+        return phi
+
+    def _add_template(self, template):
+        """Give a new template its own feature; earlier observations had it at 0."""
+        column = 1 + len(SOLUTION_TYPES) + len(self.templates)
+        self.templates[template] = len(self.templates)
+        self._gram = np.insert(np.insert(self._gram, column, 0.0, axis=0), column, 0.0, axis=1)
+        self._moment = np.insert(self._moment, column, 0.0)
+
+    def fit(self, observations: Iterable[Tuple[Dict, Dict, float]]):
+        """
+        Fit from scratch on ``(solution, current_performance, measured_score)`` triples.
+
+        Leaves the model unfitted when there are fewer than ``min_samples``.
+        """
+        self._reset()
+        return self.update(observations)
+
+    def update(self, observations: Iterable[Tuple[Dict, Dict, float]]):
+        """Add ``(solution, current_performance, measured_score)`` triples to the fit."""
+        for solution, performance, score in observations:
+            template = solution.get("proposed_solution")
+            if template not in self.templates:
+                self._add_template(template)
+            phi = self._features(solution, performance)
+            self._gram += np.outer(phi, phi)
+            self._moment += score * phi
+            self._sum_y += score
+            self._sum_y2 += score * score
+            self.n_samples += 1
+        if self.n_samples < self.min_samples:
+            self._mean = None
+            return self
+
+        n = self.n_samples
+        eye = np.eye(len(self._moment))
+        # Start from the target variance as noise, then re-estimate it from residuals
+        noise_variance = max(self._sum_y2 / n - (self._sum_y / n) ** 2, 1e-4)
+        for _ in range(2):
+            precision = self.prior_precision * eye + self._gram / noise_variance
+            covariance = np.linalg.inv(precision)
+            mean = covariance @ self._moment / noise_variance
+            # ||y - Phi @ mean||^2 from the sufficient statistics
+            residual = self._sum_y2 - 2.0 * mean @ self._moment + mean @ self._gram @ mean
+            noise_variance = max(float(residual) / max(n - 1, 1), 1e-6)
+
+        self._mean, self._covariance, self._noise_variance = mean, covariance, noise_variance
+        return self
+
+    def predict(self, solutions: List[Dict], performance: Dict):
+        """
+        Predict score mean and standard deviation for each solution.
+
+        Returns:
+            tuple: ``(means, stds)`` arrays, or ``(None, None)`` if unfitted
+        """
+        if not self.is_fitted:
+            return None, None
+        Phi = np.array([self._features(s, performance) for s in solutions]).reshape(len(solutions), -1)
+        means = Phi @ self._mean
+        variances = self._noise_variance + np.einsum("ij,jk,ik->i", Phi, self._covariance, Phi)
+        return means, np.sqrt(variances)
@@ -0,0 +1,375 @@
+# src/telemetry.py
+"""
+Telemetry module for cycle tracing spans, counters and metrics export.
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PREFIX = "srdf"
+DURATION_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 2.5, 10.0, 60.0, 300.0, 1800.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+FORMATS = ("prometheus", "openmetrics")
+
+HELP = {
+    "span_duration_seconds": "Wall-clock time spent in instrumented spans.",
+    "span_peak_traced_bytes": "Peak Python heap traced by tracemalloc during a span.",
+    "process_peak_rss_bytes": "Peak resident set size of this process.",
+    "workers_peak_rss_bytes": "Peak resident set size of any finished worker process.",
+    "cycles": "Completed SRDF cycles.",
+    "candidates_evaluated": "Candidates trained and scored (fresh, not from the cache).",
+    "candidate_tasks": "Executor tasks (one fit and score each) by outcome.",
+    "fitness_cache_hits": "Candidates whose scores came from the fitness cache.",
+    "candidates_rejected": "Candidates not selected, by the stage that rejected them.",
+}
+
+
+class _NoopSpan:
+    """Shared do-nothing span returned while telemetry is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("telemetry", "name", "labels", "memory", "overlapped", "path", "start")
+
+    def __init__(self, telemetry, name, labels, memory):
+        self.telemetry = telemetry
+        self.name = name
+        self.labels = labels
+        self.memory = memory and tracemalloc.is_tracing()
+        self.overlapped = False
+
+    def __enter__(self):
+        stack = self.telemetry._stack()
+        stack.append(self.name)
+        self.path = "/".join(stack)
+        if self.memory:
+            self.telemetry._enter_memory_span(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        self.telemetry._stack().pop()
+        labels = dict(self.labels, span=self.path)
+        if exc_info[0] is not None:
+            labels["error"] = exc_info[0].__name__
+        self.telemetry.record_span(self.path, seconds, **labels)
+        if self.memory:
+            self.telemetry._exit_memory_span(self)
+        return False
+
+
+class _Labelled:
+    """Context manager adding labels to everything recorded on this thread."""
+
+    __slots__ = ("telemetry", "labels", "previous")
+
+    def __init__(self, telemetry, labels):
+        self.telemetry = telemetry
+        self.labels = labels
+
+    def __enter__(self):
+        local = self.telemetry._local
+        self.previous = getattr(local, "labels", None)
+        local.labels = {**(self.previous or {}), **self.labels}
+        return self
+
+    def __exit__(self, *exc_info):
+        self.telemetry._local.labels = self.previous
+        return False
+
+
+def _label_key(labels: Dict) -> Tuple:
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: Tuple, extra: Tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Telemetry:
+    """
+    In-process spans, counters and gauges for the SRDF cycle.
+
+    ``span(name)`` is a context manager timing a block; spans opened inside
+    it on the same thread nest under it (``"evaluate/candidate"``). Span
+    durations are aggregated into a histogram per path and label set, and
+    the most recent ``trace_size`` spans are kept for inspection. With
+    ``trace_memory=True``, ``span(..., memory=True)`` also records the
+    peak traced Python heap during the span (tracemalloc slows allocation
+    down noticeably, so it is off by default). tracemalloc keeps a single
+    process-wide peak, so a memory span that overlaps another one (e.g.
+    pipeline stages or fleet members running concurrently) records no
+    peak rather than one inflated by the other's allocations.
+
+    ``labelled(model=name)`` adds labels to every span, counter and gauge
+    recorded on the current thread inside it, so models sharing one
+    ``Telemetry`` (a fleet) export separate series.
+
+    When ``enabled`` is False every method returns immediately and
+    ``span`` hands out a shared no-op context manager.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False,
+                 trace_size: int = 1000, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.buckets = tuple(sorted(buckets))
+        self.spans = deque(maxlen=trace_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Tuple, float]] = {}
+        self._gauges: Dict[str, Dict[Tuple, float]] = {}
+        # label key -> [bucket counts..., +Inf count, sum]
+        self._histograms: Dict[Tuple, List[float]] = {}
+        self._memory_spans = set()  # open spans tracking the tracemalloc peak
+        self._server = None
+        self._tracing = enabled and trace_memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, memory: bool = False, **labels):
+        """Time a block as span ``name`` (nested under the enclosing span)."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, labels, memory)
+
+    def labelled(self, **labels):
+        """Add ``labels`` to everything this thread records inside the block."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Labelled(self, labels)
+
+    def _with_context(self, labels: Dict) -> Dict:
+        context = getattr(self._local, "labels", None)
+        return {**context, **labels} if context else labels
+
+    def _enter_memory_span(self, span: _Span):
+        with self._lock:
+            if self._memory_spans:
+                # One process-wide peak: neither span can be measured alone
+                span.overlapped = True
+                for other in self._memory_spans:
+                    other.overlapped = True
+            else:
+                tracemalloc.reset_peak()
+            self._memory_spans.add(span)
+
+    def _exit_memory_span(self, span: _Span):
+        with self._lock:
+            self._memory_spans.discard(span)
+        if not span.overlapped:
+            self.gauge_max("span_peak_traced_bytes", tracemalloc.get_traced_memory()[1], span=span.path)
+
+    def record_span(self, path: str, seconds: float, **labels):
+        """Record a span measured elsewhere, e.g. a task timed by a worker pool."""
+        if not self.enabled:
+            return
+        labels = self._with_context(labels)
+        labels.setdefault("span", path)
+        key = _label_key(labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram[i] += 1
+            histogram[-2] += 1
+            histogram[-1] += seconds
+            self.spans.append({"path": path, "seconds": seconds, "end_time": time.time(), "labels": labels})
+
+    def nested(self, name: str) -> str:
+        """Path ``name`` would have if opened as a span on this thread now."""
+        return "/".join(self._stack() + [name])
+
+    def count(self, name: str, value: float = 1, **labels):
+        """Increase counter ``name`` (exported as ``srdf_<name>_total``)."""
+        if not self.enabled or not value:
+            return
+        key = _label_key(self._with_context(labels))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        key = _label_key(self._with_context(labels))
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def gauge_max(self, name: str, value: float, **labels):
+        """Raise gauge ``name`` to ``value`` if it is higher (peak tracking)."""
+        if not self.enabled:
+            return
+        key = _label_key(self._with_context(labels))
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = max(series.get(key, value), value)
+
+    def sample_memory(self):
+        """Update the process and worker peak RSS gauges."""
+        if not self.enabled or resource is None:
+            return
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        # Process-wide, so never under a model's labels
+        with self._lock:
+            self._gauges.setdefault("process_peak_rss_bytes", {})[()] = (
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale)
+            self._gauges.setdefault("workers_peak_rss_bytes", {})[()] = (
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale)
+
+    def counter_value(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def span_stats(self) -> Dict[str, Dict]:
+        """Count and total seconds per span path, over all label sets."""
+        stats = {}
+        with self._lock:
+            for key, histogram in self._histograms.items():
+                path = dict(key)["span"]
+                entry = stats.setdefault(path, {"count": 0, "seconds": 0.0})
+                entry["count"] += histogram[-2]
+                entry["seconds"] += histogram[-1]
+        return stats
+
+    def render(self, fmt: str = "prometheus") -> str:
+        """
+        Render every metric in Prometheus text exposition format (0.0.4)
+        or OpenMetrics (1.0.0).
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}")
+        openmetrics = fmt == "openmetrics"
+        self.sample_memory()
+        lines = []
+
+        def family(name, kind, suffix=""):
+            lines.append(f"# HELP {PREFIX}_{name}{suffix} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {PREFIX}_{name}{suffix} {kind}")
+
+        with self._lock:
+            if self._histograms:
+                family("span_duration_seconds", "histogram")
+                metric = f"{PREFIX}_span_duration_seconds"
+                for key, histogram in sorted(self._histograms.items()):
+                    for bound, n in zip(self.buckets + (float("inf"),), histogram[:-1]):
+                        lines.append(f"{metric}_bucket{_format_labels(key, (('le', _format_value(bound)),))} {n}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {_format_value(histogram[-1])}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {histogram[-2]}")
+
+            for name, series in sorted(self._counters.items()):
+                # OpenMetrics names the family without the _total suffix
+                family(name, "counter", "" if openmetrics else "_total")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{PREFIX}_{name}_total{_format_labels(key)} {_format_value(value)}")
+
+            for name, series in sorted(self._gauges.items()):
+                family(name, "gauge")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{PREFIX}_{name}{_format_labels(key)} {_format_value(value)}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, fmt: str = "prometheus"):
+        """Atomically write the metrics to ``path`` (e.g. for a textfile collector)."""
+        if not self.enabled:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render(fmt))
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the metrics over HTTP from a daemon thread.
+
+        ``GET /metrics`` answers in OpenMetrics when the ``Accept`` header
+        asks for it and in the Prometheus text format otherwise.
+        """
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = telemetry.render("openmetrics" if openmetrics else "prometheus").encode()
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # scrapes are not worth a log line each
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="srdf-metrics", daemon=True).start()
+        return self._server
+
+    @property
+    def server_port(self) -> Optional[int]:
+        return self._server.server_port if self._server is not None else None
+
+    def close(self):
+        """Stop the HTTP endpoint and any tracemalloc session started here."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
@@ -3,33 +3,147 @@
 Trawler module for continuous performance analysis and anomaly detection.
 """
 
+import time
+import itertools
 import numpy as np
 from datetime import datetime
 import json
+from typing import Optional, Sequence
+from .data import iter_chunks, open_array
+from .drift import DriftDetector
+from .history import DEFAULT_HISTORY_SIZE, HistoryStore
+from .metrics import DEFAULT_BATCH_SIZE, ConfusionAccumulator, evaluate_model
+from .profiler import DEFAULT_BATCH_SIZES, profile_inference, summarize_profile
+from .progressive import (DEFAULT_GROWTH, DEFAULT_MIN_ROWS, decides, macro_recall_interval,
+                          sample_schedule, stratified_order, wilson_interval)
+from .streaming import SlidingWindowMetrics
+
+# Below these the model is flagged for improvement
+ACCURACY_THRESHOLD = 0.9
+RECALL_THRESHOLD = 0.8
+
+def _summarize_analysis(analysis):
+    """Numeric fields kept for analyses evicted from the history."""
+    metrics = analysis["performance_metrics"]
+    return {
+        key: metrics.get(key)
+        for key in ("accuracy", "precision", "recall", "f1_score", "inference_time")
+    }
 
 class Trawler:
     """Continuous analysis unit for identifying improvement areas."""
     
-    def __init__(self):
-        self.analysis_history = []
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE,
+                 window_size: Optional[int] = None,
+                 window_seconds: Optional[float] = None,
+                 profile_batch_sizes: Optional[Sequence[int]] = DEFAULT_BATCH_SIZES,
+                 warmup_runs: int = 2,
+                 profile_repeats: int = 10,
+                 latency_threshold: float = 0.1,
+                 detect_drift: bool = True,
+                 history_size: Optional[int] = DEFAULT_HISTORY_SIZE,
+                 sample_fraction: Optional[float] = None,
+                 sample_growth: float = DEFAULT_GROWTH,
+                 min_sample_rows: int = DEFAULT_MIN_ROWS,
+                 confidence_level: float = 0.95,
+                 random_state: int = 0):
+        self.batch_size = batch_size
+        self.profile_batch_sizes = profile_batch_sizes
+        self.warmup_runs = warmup_runs
+        self.profile_repeats = profile_repeats
+        self.latency_threshold = latency_threshold
+        # The first analysed dataset becomes the drift reference unless
+        # drift_detector.fit_reference() is called with e.g. training data
+        self.drift_detector = DriftDetector() if detect_drift else None
+        self.analysis_history = HistoryStore(history_size, summarize=_summarize_analysis)
         self.last_analysis_time = None
+        
+        # Progressive mode: analyse a growing stratified subsample until the
+        # confidence intervals settle every threshold in _identify_issues
+        self.sample_fraction = sample_fraction
+        self.sample_growth = sample_growth
+        self.min_sample_rows = min_sample_rows
+        self.confidence_level = confidence_level
+        self.random_state = random_state
+        
+        # Streaming mode: running accumulators over the last N samples / T seconds
+        self.window = None
+        if window_size is not None or window_seconds is not None:
+            self.window = SlidingWindowMetrics(window_size, window_seconds)
     
-    def analyze_performance(self, model, data, labels):
+    def analyze_performance(self, model, data, labels=None):
         """
         Analyze model performance and identify improvement areas.
         
         Args:
             model: The machine learning model to analyze
-            data: Input data for analysis
-            labels: Target labels
+            data: Input data for analysis; an array, ``np.memmap``, ``.npy``
+                path, or an iterator of ``(X_chunk, y_chunk)`` pairs
+            labels: Target labels (array, memmap or ``.npy`` path); omit
+                when ``data`` already yields labelled chunks
+            
+        Returns:
+            dict: Analysis results with recommendations
+        """
+        performance_metrics = self._calculate_metrics(model, data, labels)
+        return self._record_analysis(model, performance_metrics)
+    
+    def observe(self, model, data, labels=None):
+        """
+        Feed newly labelled traffic into the streaming window.
+        
+        Only the new rows are predicted; earlier traffic is already folded
+        into the window's running accumulators.
+        
+        Args:
+            model: The machine learning model serving the traffic
+            data: New input rows (same forms as ``analyze_performance``)
+            labels: Labels for the new rows
+            
+        Returns:
+            int: Number of rows added to the window
+        """
+        if self.window is None:
+            raise RuntimeError("streaming mode requires window_size or window_seconds")
+        
+        n_rows = 0
+        for X_chunk, y_chunk in self._track_drift(iter_chunks(data, labels, self.batch_size)):
+            start = time.perf_counter()
+            if getattr(model, "accepts_labels", False):
+                # e.g. a ModelDeployment comparing a shadow model on labelled traffic
+                predictions = model.predict(X_chunk, y_chunk)
+            else:
+                predictions = model.predict(X_chunk)
+            self.window.add(y_chunk, predictions, time.perf_counter() - start)
+            n_rows += len(y_chunk)
+        
+        return n_rows
+    
+    def analyze_window(self, model=None):
+        """
+        Analyze the current sliding window without re-evaluating past data.
+        
+        Args:
+            model: The model being monitored (used for reporting only)
             
         Returns:
             dict: Analysis results with recommendations
         """
+        if self.window is None:
+            raise RuntimeError("streaming mode requires window_size or window_seconds")
+        
+        performance_metrics = self.window.metrics()
+        if "mean_row_latency" in performance_metrics:
+            # Per row, like a profile's one-row latency, not per observed batch
+            performance_metrics["inference_time"] = performance_metrics["mean_row_latency"]
+        performance_metrics["latency_threshold"] = self.latency_threshold
+        self._add_drift_report(performance_metrics)
+        return self._record_analysis(model, performance_metrics)
+    
+    def _record_analysis(self, model, performance_metrics):
+        """Turn metrics into issues and recommendations and log the result."""
         analysis_time = datetime.now()
         
-        # Simulate performance analysis
-        performance_metrics = self._calculate_metrics(model, data, labels)
         issues = self._identify_issues(performance_metrics)
         recommendations = self._generate_recommendations(issues)
         
@@ -47,26 +161,139 @@ class Trawler:
         return analysis_result
     
     def _calculate_metrics(self, model, data, labels):
-        """Calculate various performance metrics."""
-        # Placeholder for actual metric calculation
-        return {
-            "accuracy": 0.85,
-            "precision": 0.82,
-            "recall": 0.78,
-            "f1_score": 0.80,
-            "inference_time": 0.15
+        """Calculate various performance metrics from a batched prediction pass."""
+        if self.drift_detector is not None:
+            self.drift_detector.reset_current()
+        if self.sample_fraction is not None and labels is not None:
+            accumulator, first_chunk, sample = self._progressive_pass(model, data, labels)
+        else:
+            chunks = self._track_drift(iter_chunks(data, labels, self.batch_size))
+            first_chunk = next(chunks, None)
+            accumulator = evaluate_model(
+                model, itertools.chain([first_chunk], chunks), batch_size=self.batch_size
+            ) if first_chunk is not None else None
+            sample = None
+        if first_chunk is None:
+            # No rows: zeroed metrics, without asking the model to predict nothing
+            metrics = ConfusionAccumulator().metrics()
+            metrics["latency_threshold"] = self.latency_threshold
+            return metrics
+        
+        metrics = accumulator.metrics()
+        if sample is not None:
+            metrics["sample"] = sample
+        
+        # Benchmark on the first chunk, which is already in memory even for streams
+        if self.profile_batch_sizes:
+            profile = profile_inference(
+                model, first_chunk[0], self.profile_batch_sizes,
+                self.warmup_runs, self.profile_repeats
+            )
+            metrics.update(summarize_profile(profile))
+        metrics["latency_threshold"] = self.latency_threshold
+        self._add_drift_report(metrics)
+        return metrics
+    
+    def _progressive_pass(self, model, data, labels):
+        """
+        Evaluate growing stratified subsamples until the issue thresholds are decided.
+        
+        Each step only predicts the rows added since the previous one.
+        
+        Returns:
+            tuple: ``(accumulator, first_chunk, sample_report)``
+        """
+        X, y = open_array(data), np.asarray(open_array(labels))
+        if not hasattr(X, "shape"):
+            X = np.asarray(X)
+        if len(X) != len(y):
+            raise ValueError(f"data and labels differ in length: {len(X)} != {len(y)}")
+        accumulator = ConfusionAccumulator()
+        if len(y) == 0:
+            return accumulator, None, None
+        
+        order = stratified_order(y, self.random_state)
+        schedule = sample_schedule(len(y), self.sample_fraction, self.sample_growth, self.min_sample_rows)
+        first_chunk, seen = None, 0
+        for step, size in enumerate(schedule, 1):
+            # Sorted rows keep memory-mapped reads sequential
+            rows = np.sort(order[seen:size])
+            batches = (rows[i:i + self.batch_size] for i in range(0, len(rows), self.batch_size))
+            for X_chunk, y_chunk in self._track_drift((X[batch], y[batch]) for batch in batches):
+                if first_chunk is None:
+                    first_chunk = (X_chunk, y_chunk)
+                accumulator.update(y_chunk, model.predict(X_chunk))
+            seen = size
+            
+            intervals = {
+                "accuracy": wilson_interval(np.trace(accumulator.matrix), accumulator.total,
+                                            self.confidence_level),
+                "recall": macro_recall_interval(accumulator.matrix, self.confidence_level)
+            }
+            if (decides(intervals["accuracy"], ACCURACY_THRESHOLD)
+                    and decides(intervals["recall"], RECALL_THRESHOLD)):
+                break
+        
+        return accumulator, first_chunk, {
+            "rows": seen,
+            "total_rows": len(y),
+            "fraction": seen / len(y),
+            "steps": step,
+            "confidence_level": self.confidence_level,
+            "intervals": intervals
         }
     
+    def _track_drift(self, chunks):
+        """Pass non-empty chunks through while folding their features into the drift sketches."""
+        for X_chunk, y_chunk in chunks:
+            if len(y_chunk) == 0:
+                continue
+            if self.drift_detector is not None:
+                self.drift_detector.update(X_chunk)
+            yield X_chunk, y_chunk
+    
+    def _add_drift_report(self, metrics):
+        """Attach the drift report and start a fresh comparison window."""
+        detector = self.drift_detector
+        if detector is None:
+            return
+        if not detector.reference_frozen:
+            detector.freeze_reference()
+            return
+        metrics["feature_drift"] = detector.report()
+        detector.reset_current()
+    
+    def detect_anomalies(self):
+        """
+        Return the features whose distribution drifted in the latest analysis.
+        
+        Returns:
+            list: Indices of drifted features (empty if none or not analysed yet)
+        """
+        if not self.analysis_history:
+            return []
+        drift = self.analysis_history[-1]["performance_metrics"].get("feature_drift", {})
+        return drift.get("drifted_features", [])
+    
     def _identify_issues(self, metrics):
         """Identify performance issues based on metrics."""
         issues = []
         
-        if metrics["accuracy"] < 0.9:
+        if metrics["accuracy"] < ACCURACY_THRESHOLD:
             issues.append("Low accuracy - needs improvement")
-        if metrics["recall"] < 0.8:
+        if metrics["recall"] < RECALL_THRESHOLD:
             issues.append("Poor recall on minority classes")
-        if metrics["inference_time"] > 0.1:
-            issues.append("Slow inference speed")
+        if metrics.get("inference_time", 0.0) > self.latency_threshold:
+            issues.append(
+                f"Slow inference speed ({metrics['inference_time'] * 1000:.1f} ms"
+                f" > {self.latency_threshold * 1000:.1f} ms)"
+            )
+        drift = metrics.get("feature_drift", {})
+        if drift.get("drifted_features"):
+            issues.append(
+                f"Feature drift detected in features {drift['drifted_features']}"
+                f" (max PSI {drift['max_psi']:.2f})"
+            )
             
         return issues
     
@@ -81,14 +308,16 @@ class Trawler:
                 recommendations.append("Apply class balancing techniques")
             elif "speed" in issue:
                 recommendations.append("Optimize model architecture or use quantization")
+            elif "drift" in issue:
+                recommendations.append("Retrain or recalibrate on recent data")
         
         return recommendations
     
     def get_analysis_history(self):
-        """Return complete analysis history."""
-        return self.analysis_history
+        """Return a read-only view of the retained analysis history."""
+        return self.analysis_history.view()
     
     def save_analysis_report(self, filename="trawler_analysis.json"):
         """Save analysis history to JSON file."""
         with open(filename, 'w') as f:
-            json.dump(self.analysis_history, f, indent=2)
+            json.dump(self.analysis_history.to_list(), f, indent=2)
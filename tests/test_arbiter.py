@@ -1,6 +1,14 @@
 # tests/test_arbiter.py
+import os
+import tempfile
 import unittest
-from src.arbiter import Arbiter
+from unittest import mock
+import numpy as np
+from src.arbiter import Arbiter, _t_critical
+from src.cache import FitnessCache, fingerprint_dataset
+from src.candidates import stratified_folds, train_and_score
+from src.executor import CandidateExecutor, cross_validate_fold, shared_arrays
+from src.shared import SharedDataset
 
 class TestArbiter(unittest.TestCase):
     def setUp(self):
@@ -23,6 +31,153 @@ class TestArbiter(unittest.TestCase):
         
         self.assertIn("selected_solution", result)
         self.assertIn("validated_solutions", result)
+    
+    def test_race_solutions_eliminates_losers(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(3000, 4))
+        labels = (data[:, 0] + data[:, 1] > 0).astype(int)
+        solutions = [
+            {"proposed_solution": f"tree depth {depth}",
+             "candidate": {"estimator": "DecisionTreeClassifier",
+                           "params": {"max_depth": depth, "random_state": 0}}}
+            for depth in (1, 1, 1, 1, 1, 1, 1, 1, 6)
+        ]
+        arbiter = Arbiter(executor=CandidateExecutor(max_workers=4, timeout=60))
+        
+        report = arbiter.race_solutions(solutions, data, labels, eta=3, min_rows=100)
+        
+        self.assertEqual([r["candidates"] for r in report["rungs"]], [9, 3, 1])
+        self.assertGreater(report["compute_saved"], 0.5)
+        statuses = [s["evaluation"]["status"] for s in solutions]
+        self.assertEqual(statuses.count("ok"), 1)
+        self.assertEqual(statuses[-1], "ok")
+        
+        result = arbiter.validate_solutions(solutions, {"accuracy": 0.7})
+        self.assertEqual(result["selected_solution"]["proposed_solution"], "tree depth 6")
+
+    def test_race_rungs_come_from_the_fitness_cache(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(1000, 4))
+        labels = (data[:, 0] > 0).astype(int)
+        
+        def proposals():
+            return [
+                {"proposed_solution": f"tree depth {depth}",
+                 "candidate": {"estimator": "DecisionTreeClassifier",
+                               "params": {"max_depth": depth, "random_state": 0}}}
+                for depth in (1, 2, 4)
+            ]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FitnessCache(os.path.join(tmp, "fitness.sqlite"))
+            arbiter = Arbiter(executor=CandidateExecutor(max_workers=2, timeout=60, cache=cache))
+            first, second = proposals(), proposals()
+            cold = arbiter.race_solutions(first, data, labels, eta=3, min_rows=100)
+            warm = arbiter.race_solutions(second, data, labels, eta=3, min_rows=100)
+        
+        self.assertEqual(warm["rungs"], cold["rungs"])
+        self.assertEqual(warm["compute_rows"], 0)
+        self.assertEqual(warm["compute_saved"], 1.0)
+        for before, after in zip(first, second):
+            self.assertEqual(after["evaluation"]["status"], before["evaluation"]["status"])
+            self.assertEqual(after["evaluation"]["result"], before["evaluation"]["result"])
+            self.assertTrue(after["evaluation"]["cached"])
+    
+    def test_cross_validation_interval_decides_validity(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(600, 4))
+        labels = (data[:, 0] > 0).astype(int)
+        solutions = [
+            {"proposed_solution": "stump",
+             "candidate": {"estimator": "DecisionTreeClassifier", "params": {"max_depth": 1}}},
+            {"proposed_solution": "coin flip",
+             "candidate": {"estimator": "DecisionTreeClassifier", "params": {"max_depth": 1}},
+             "confidence_score": 0.99, "complexity": "low"}
+        ]
+        # Shuffled labels make the second candidate no better than chance
+        arbiter = Arbiter(executor=CandidateExecutor(max_workers=4, timeout=60), cv_folds=4)
+        arbiter.cross_validate(solutions[1:], data, rng.permutation(labels))
+        
+        result = arbiter.validate_solutions(solutions[:1], {"accuracy": 0.7}, data, labels)
+        stump, = result["validated_solutions"]
+        shuffled = arbiter.validate_solutions(solutions[1:], {"accuracy": 0.7})["validated_solutions"][0]
+        
+        cv = stump["cross_validation"]
+        self.assertEqual(cv["folds"], 4)
+        self.assertLessEqual(cv["accuracy"]["ci_low"], cv["accuracy"]["mean"])
+        self.assertTrue(stump["is_valid"])
+        self.assertFalse(shuffled["is_valid"])
+    
+    def test_t_critical_is_exact_for_few_folds(self):
+        # Tabulated two-sided 95% and 99% Student-t quantiles
+        for confidence, df, expected in [(0.95, 1, 12.7062), (0.95, 2, 4.3027), (0.95, 3, 3.1824),
+                                         (0.99, 1, 63.6567), (0.99, 2, 9.9248), (0.99, 9, 3.2498)]:
+            self.assertAlmostEqual(_t_critical(confidence, df), expected, places=3)
+    
+    def test_fold_training_sets_are_views_of_the_doubled_layout(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(1)
+        X = rng.normal(size=(500, 3))
+        y = (X[:, 0] + rng.normal(scale=0.5, size=500) > 1.0).astype(int)
+        spec = {"estimator": "LogisticRegression", "resample": "smote", "random_state": 2}
+        order, bounds = stratified_folds(y, 4)
+        
+        with SharedDataset(shared_arrays([{"candidate": spec}], X, y, order),
+                           order=np.concatenate([order, order])) as shared:
+            result = cross_validate_fold(spec, shared.handles, bounds, 1)
+        
+        train = np.r_[order[bounds[2]:], order[:bounds[1]]]
+        test = order[bounds[1]:bounds[2]]
+        expected = train_and_score(spec, X[train], y[train], X[test], y[test])
+        self.assertAlmostEqual(result["accuracy"], expected["accuracy"])
+        self.assertAlmostEqual(result["recall"], expected["recall"])
+    
+    def test_validation_hashes_the_dataset_once(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(2)
+        data = rng.normal(size=(400, 3))
+        labels = (data[:, 0] > 0.8).astype(int)
+        solutions = [{"proposed_solution": "balanced",
+                      "candidate": {"estimator": "LogisticRegression", "resample": "smote"}}]
+        full_hashes = []
+        
+        def counting(*arrays):
+            if len(arrays[0]) == len(labels):
+                full_hashes.append(arrays)
+            return fingerprint_dataset(*arrays)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FitnessCache(os.path.join(tmp, "fitness.sqlite"))
+            arbiter = Arbiter(executor=CandidateExecutor(max_workers=2, timeout=60, cache=cache))
+            with mock.patch("src.arbiter.fingerprint_dataset", counting), \
+                    mock.patch("src.oversampling.fingerprint_dataset", counting):
+                arbiter.validate_solutions(solutions, {"accuracy": 0.5}, data, labels)
+        
+        self.assertEqual(solutions[0]["cross_validation"]["status"], "ok")
+        self.assertEqual(len(full_hashes), 1)
 
 if __name__ == "__main__":
     unittest.main()
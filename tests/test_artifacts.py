@@ -0,0 +1,92 @@
+# tests/test_artifacts.py
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.artifacts import ArtifactStore
+from src.core import SRDFFramework
+
+def fitted(seed, n_features=50):
+    try:
+        from sklearn.linear_model import LogisticRegression
+    except ImportError:
+        raise unittest.SkipTest("scikit-learn not installed")
+    
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(500, n_features))
+    return LogisticRegression().fit(X, (X[:, 0] > 0).astype(int)), X
+
+class TestArtifactStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "artifacts")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_round_trip_memory_maps_arrays(self):
+        store = ArtifactStore(self.root)
+        model, X = fitted(0)
+        
+        digest = store.put(model)
+        loaded = store.get(digest)
+        
+        self.assertEqual(store.put(model), digest)  # content-addressed
+        self.assertEqual(len(store.digests()), 1)
+        np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+        self.assertFalse(loaded.coef_.flags.writeable)  # a view of the mapped file
+    
+    def test_strided_arrays_round_trip(self):
+        store = ArtifactStore(self.root)
+        model = {"columns": np.arange(60.0).reshape(6, 10)[:, ::3], "fortran": np.asfortranarray(np.eye(3))}
+        
+        loaded = store.get(store.put(model))
+        
+        for name, array in model.items():
+            np.testing.assert_array_equal(loaded[name], array)
+    
+    def test_collect_keeps_referenced_artifacts(self):
+        store = ArtifactStore(self.root)
+        digests = [store.put(fitted(seed)[0]) for seed in range(4)]
+        store.pin("live", digests[0])
+        store.max_bytes = store.size(digests[0]) * 2 + 1
+        
+        removed = store.collect(referenced=[digests[3]])
+        
+        self.assertEqual(sorted(removed), sorted(digests[1:3]))
+        self.assertEqual(sorted(store.digests()), sorted([digests[0], digests[3]]))
+        
+        store.max_bytes = None
+        store.pin("live", None)
+        self.assertEqual(sorted(store.collect()), sorted([digests[0], digests[3]]))
+
+class TestFrameworkArtifacts(unittest.TestCase):
+    def test_promoted_candidate_is_stored_and_redeployable(self):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(4000, 4))
+        y = (X[:, 0] + X[:, 1] * X[:, 2] > 0.3).astype(int)
+        live, _ = fitted(1, n_features=4)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            framework = SRDFFramework()
+            # The selected candidate is many times slower per row than the linear live model
+            framework.load_config({"candidate_evaluation": "holdout", "validation_threshold": 0.6,
+                                   "rollback_latency_tolerance": 1e4})
+            framework.artifacts = ArtifactStore(tmp)
+            
+            result = framework._run_cycle(0, live, X, y)["implementation_result"]
+            self.assertEqual(result["status"], "promoted")
+            refs = framework.artifacts.refs()
+            self.assertEqual(refs["live"], result["artifact"])
+            self.assertIn("previous", refs)
+            
+            # Refs follow the deployment, however the swap happens
+            self.assertTrue(framework.deployment.rollback())
+            self.assertEqual(framework.artifacts.refs()["live"], refs["previous"])
+            np.testing.assert_array_equal(framework.predict(X[:100]), live.predict(X[:100]))
+            
+            framework.redeploy(result["artifact"], shadow=False)
+            self.assertEqual(framework.artifacts.refs(), {"live": result["artifact"], "previous": refs["previous"]})
+
+if __name__ == "__main__":
+    unittest.main()
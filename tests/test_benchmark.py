@@ -0,0 +1,69 @@
+# tests/test_benchmark.py
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from src import benchmark
+from src.benchmark import compare_results, main, make_classification, run_benchmarks
+
+def results(**cases):
+    return {"schema": benchmark.SCHEMA_VERSION, "environment": {},
+            "results": {key: {"min": value, "median": value} for key, value in cases.items()}}
+
+class TestSyntheticData(unittest.TestCase):
+    def test_chunked_files_match_in_memory_data(self):
+        chunk_rows = benchmark.CHUNK_ROWS
+        benchmark.CHUNK_ROWS = 700
+        self.addCleanup(setattr, benchmark, "CHUNK_ROWS", chunk_rows)
+        X, y = make_classification(2000, weights=[0.8, 0.2], random_state=3)
+
+        self.assertEqual(X.shape, (2000, 20))
+        self.assertEqual(X.dtype, np.float32)
+        self.assertAlmostEqual(np.mean(y), 0.2, delta=0.04)
+        with tempfile.TemporaryDirectory() as tmp:
+            X_path, y_path = make_classification(2000, weights=[0.8, 0.2], random_state=3,
+                                                 path=os.path.join(tmp, "data"))
+            np.testing.assert_array_equal(np.load(X_path), X)
+            np.testing.assert_array_equal(np.load(y_path), y)
+
+class TestComparison(unittest.TestCase):
+    def test_regressions_need_relative_and_absolute_slowdown(self):
+        baseline = results(hot=1.0, tiny=0.001, gone=0.5)
+        current = results(hot=1.3, tiny=0.002, fresh=0.1)
+        report = compare_results(baseline, current, tolerance=0.25, min_seconds=0.005)
+
+        self.assertEqual(report["regressions"], ["hot"])
+        self.assertEqual(report["missing"], ["gone"])
+        self.assertEqual(report["new"], ["fresh"])
+        self.assertEqual(compare_results(baseline, current, tolerance=0.5)["regressions"], [])
+
+    def test_run_and_compare_commands(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            code = main(["run", "--cases", "generator,arbiter", "--generator-sizes", "10",
+                         "--arbiter-sizes", "1e2", "--repeats", "2", "--output", path])
+            self.assertEqual(code, 0)
+            with open(path) as f:
+                current = json.load(f)
+            self.assertEqual(sorted(current["results"]), [
+                "arbiter.validate_solutions[candidates=100]",
+                "generator.propose_solutions[candidates=10]",
+            ])
+
+            slow = os.path.join(tmp, "slow.json")
+            for entry in current["results"].values():
+                entry["min"] += 1.0
+            with open(slow, "w") as f:
+                json.dump(current, f)
+            self.assertEqual(main(["compare", path, slow]), 1)
+            self.assertEqual(main(["compare", slow, path]), 0)
+
+    def test_trawler_case_runs_on_synthetic_data(self):
+        report = run_benchmarks(cases=["trawler"], sizes={"trawler": [1000]}, repeats=1, warmup=0)
+        entry = report["results"]["trawler.analyze_performance[rows=1000]"]
+        self.assertEqual(len(entry["seconds"]), 1)
+        self.assertGreater(entry["min"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# tests/test_bulk.py
+import random
+import unittest
+import numpy as np
+from src.arbiter import Arbiter
+from src.bulk import top_k_indices
+
+def make_candidates(n, seed=0):
+    rng = random.Random(seed)
+    solutions = []
+    for i in range(n):
+        solution = {
+            "proposed_solution": f"variant {i}",
+            "confidence_score": rng.uniform(0.5, 0.95),
+            "complexity": rng.choice(["low", "medium", "high"])
+        }
+        if i % 3 == 1:
+            solution["evaluation"] = {"status": "ok", "result": {"accuracy": rng.uniform(0.6, 0.95)}}
+        if i % 7 == 2:
+            solution["evaluation"] = {"status": "timeout", "result": None}
+        solutions.append(solution)
+    return solutions
+
+class TestBulkScoring(unittest.TestCase):
+    def test_matches_scalar_validation(self):
+        solutions = make_candidates(200)
+        performance = {"accuracy": 0.65}
+        
+        bulk = Arbiter().validate_bulk(solutions, performance, top_k=5)
+        scalar = Arbiter().validate_solutions(solutions, performance)
+        
+        expected = sorted(s["validation_score"] for s in scalar["validated_solutions"] if s["is_valid"])
+        self.assertEqual(
+            [s["validation_score"] for s in bulk["validated_solutions"]],
+            expected[::-1][:5]
+        )
+        self.assertEqual(bulk["selected_solution"]["validation_score"],
+                         scalar["selected_solution"]["validation_score"])
+        self.assertEqual(bulk["valid_candidates"],
+                         sum(s["is_valid"] for s in scalar["validated_solutions"]))
+        self.assertEqual(bulk["candidates_scored"], 200)
+    
+    def test_over_budget_candidates_are_never_kept(self):
+        def measured(name, accuracy, latency, size):
+            return {"proposed_solution": name, "evaluation": {"status": "ok", "result": {
+                "accuracy": accuracy, "latency_p99": latency, "model_size_bytes": size}}}
+        
+        solutions = [measured("forest", 0.95, 0.020, 5_000_000), measured("tree", 0.85, 0.002, 40_000),
+                     measured("huge", 0.97, 0.001, 90_000_000)]
+        arbiter = Arbiter(validation_threshold=0.8, latency_budget=0.005, size_budget=10_000_000)
+        
+        result = arbiter.validate_bulk(solutions, {"accuracy": 0.8}, top_k=3)
+        self.assertEqual([s["proposed_solution"] for s in result["validated_solutions"]], ["tree"])
+        self.assertEqual(result["over_budget"], 2)
+        
+        # Nothing within budget: no fallback to an over-budget candidate
+        none_fit = arbiter.validate_bulk(solutions[:1], {"accuracy": 0.8})
+        self.assertIsNone(none_fit["selected_solution"])
+        self.assertFalse(none_fit["selection_fallback"])
+    
+    def test_top_k_falls_back_to_best_invalid(self):
+        scores = np.array([0.2, 0.6, 0.4])
+        
+        self.assertEqual(top_k_indices(scores, np.zeros(3, dtype=bool), 2).tolist(), [1])
+        self.assertEqual(top_k_indices(scores, np.ones(3, dtype=bool), 2).tolist(), [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# tests/test_cache.py
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from src.cache import FitnessCache, fingerprint_dataset, solution_key
+from src.core import SRDFFramework
+from src.executor import CandidateExecutor
+
+class Majority:
+    def predict(self, X):
+        return np.zeros(len(X), dtype=int)
+
+class TestFitnessCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "fitness.sqlite")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_keys_follow_spec_and_data(self):
+        data = np.arange(10.0).reshape(5, 2)
+        spec = {"estimator": "RandomForestClassifier", "params": {"n_estimators": 10}}
+        fingerprint = fingerprint_dataset(data)
+        
+        self.assertEqual(solution_key(spec, fingerprint), solution_key(dict(spec), fingerprint))
+        self.assertNotEqual(fingerprint, fingerprint_dataset(data + 1))
+        self.assertNotEqual(
+            solution_key(spec, fingerprint),
+            solution_key({**spec, "params": {"n_estimators": 20}}, fingerprint)
+        )
+    
+    def test_lru_eviction_persists_across_instances(self):
+        cache = FitnessCache(self.path, max_entries=2)
+        cache.put("a", {"accuracy": 0.8})
+        cache.put("b", {"accuracy": 0.9})
+        cache.get("a")
+        cache.put("c", {"accuracy": 0.7})
+        
+        reopened = FitnessCache(self.path, max_entries=2)
+        self.assertEqual(reopened.get("a"), {"accuracy": 0.8})
+        self.assertIsNone(reopened.get("b"))
+        self.assertEqual(len(reopened), 2)
+    
+    def test_executor_skips_cached_candidates(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(200, 3))
+        labels = (data[:, 0] > 0).astype(int)
+        spec = {"estimator": "DecisionTreeClassifier", "params": {"max_depth": 3}}
+        executor = CandidateExecutor(max_workers=1, timeout=60, cache=FitnessCache(self.path))
+        
+        first = executor.evaluate([{"candidate": spec}], data, labels)[0]
+        second = executor.evaluate([{"candidate": spec}], data, labels)[0]
+        
+        self.assertNotIn("cached", first["evaluation"])
+        self.assertTrue(second["evaluation"]["cached"])
+        self.assertEqual(second["evaluation"]["result"]["accuracy"],
+                         first["evaluation"]["result"]["accuracy"])
+    
+    def test_cycle_hashes_the_dataset_once(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(1)
+        data = rng.normal(size=(600, 3))
+        labels = (data[:, 0] > 0.5).astype(int)
+        executor = CandidateExecutor(max_workers=2, timeout=60, cache=FitnessCache(self.path))
+        framework = SRDFFramework(executor=executor)
+        framework.load_config({"candidate_evaluation": "halving", "deploy_solutions": False})
+        full_hashes = []
+        
+        def counting(*arrays):
+            if len(arrays[0]) == len(labels):
+                full_hashes.append(arrays)
+            return fingerprint_dataset(*arrays)
+        
+        with mock.patch("src.core.fingerprint_dataset", counting), \
+                mock.patch("src.arbiter.fingerprint_dataset", counting), \
+                mock.patch("src.executor.fingerprint_dataset", counting), \
+                mock.patch("src.oversampling.fingerprint_dataset", counting):
+            cycle = framework._run_cycle(0, Majority(), data, labels)
+        
+        self.assertIsNotNone(cycle["evaluation_report"])
+        self.assertEqual(len(full_hashes), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# tests/test_checkpoint.py
+import os
+import tempfile
+import threading
+import time
+import unittest
+import numpy as np
+from src.checkpoint import CheckpointLog
+from src.core import SRDFFramework
+from src.history import HistoryStore
+
+class TestCheckpointLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "checkpoint.jsonl")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_compaction_keeps_snapshot_and_tail(self):
+        log = CheckpointLog(self.path, snapshot_every=3)
+        for i in range(4):
+            log.append({"cycle_number": i, "score": np.float64(0.5)})
+            if log.compaction_due:
+                log.compact({"cycle_count": i + 1})
+        log.close()
+        
+        state, cycles = CheckpointLog(self.path).load()
+        
+        self.assertEqual(state, {"cycle_count": 3})
+        self.assertEqual(cycles, [{"cycle_number": 3, "score": 0.5}])
+    
+    def test_background_compaction_keeps_cycles_appended_meanwhile(self):
+        encoding = threading.Event()
+        
+        class SlowValue:
+            def __str__(self):
+                encoding.set()
+                time.sleep(0.2)
+                return "slow"
+        
+        log = CheckpointLog(self.path, snapshot_every=2)
+        log.append({"cycle_number": 0})
+        log.append({"cycle_number": 1})
+        log.compact({"cycle_count": 2, "value": SlowValue()}, background=True)
+        self.assertFalse(log.compaction_due)
+        encoding.wait()
+        log.append({"cycle_number": 2})  # does not wait for the snapshot
+        self.assertTrue(log.compacting)
+        self.assertEqual(len(CheckpointLog(self.path).load()[1]), 3)  # old log still complete
+        log.close()
+        
+        state, cycles = CheckpointLog(self.path).load()
+        self.assertEqual(state, {"cycle_count": 2, "value": "slow"})
+        self.assertEqual(cycles, [{"cycle_number": 2}])
+        self.assertEqual(log.cycles_since_snapshot, 1)
+        self.assertIsNone(log.compaction_error)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+    
+    def test_torn_final_line_is_discarded(self):
+        log = CheckpointLog(self.path)
+        log.append({"cycle_number": 0})
+        log.close()
+        with open(self.path, "ab") as f:
+            f.write(b'{"type": "cycle", "cyc')
+        
+        log = CheckpointLog(self.path)
+        self.assertEqual(log.load(), (None, [{"cycle_number": 0}]))
+        log.append({"cycle_number": 1})
+        log.close()
+        
+        self.assertEqual(len(CheckpointLog(self.path).load()[1]), 2)
+    
+    def test_history_state_round_trip(self):
+        store = HistoryStore(3, summarize=lambda r: {"v": r["v"]}, bucket_size=2)
+        store.extend({"v": float(i)} for i in range(6))
+        
+        restored = HistoryStore(3, summarize=lambda r: {"v": r["v"]}, bucket_size=2)
+        restored.load_state(store.state())
+        
+        self.assertEqual(restored.to_list(), store.to_list())
+        self.assertEqual(restored.get_aggregates(), store.get_aggregates())
+        self.assertEqual(restored.total_appended, 6)
+
+class TestFrameworkResume(unittest.TestCase):
+    def test_resume_restores_cycles(self):
+        try:
+            from sklearn.tree import DecisionTreeClassifier
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 3))
+        y = (X[:, 0] > 0).astype(int)
+        model = DecisionTreeClassifier(max_depth=1).fit(X, y)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            config = {
+                "evaluate_candidates": False, "history_size": 4,
+                "checkpoint_path": os.path.join(tmp, "cycles.jsonl"),
+                "checkpoint_snapshot_every": 3
+            }
+            framework = SRDFFramework({**SRDFFramework._default_config(), **config})
+            for cycle in range(7):
+                framework._run_cycle(cycle, model, X, y)
+            framework.checkpoint.close()  # also waits for a background compaction
+            with open(config["checkpoint_path"]) as f:
+                self.assertEqual(len(f.readlines()), 2)  # snapshot + one cycle
+            
+            resumed = SRDFFramework({**SRDFFramework._default_config(), **config})
+            self.assertEqual(resumed.resume(), 7)
+        
+        self.assertEqual([c["cycle_number"] for c in resumed.cycle_history], [3, 4, 5, 6])
+        self.assertEqual(resumed.cycle_history.total_appended, 7)
+        self.assertEqual(len(resumed.arbiter.validation_history), 4)
+
+if __name__ == "__main__":
+    unittest.main()
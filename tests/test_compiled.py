@@ -0,0 +1,107 @@
+# tests/test_compiled.py
+import time
+import unittest
+import numpy as np
+from src.arbiter import Arbiter
+from src.candidates import fit_candidate, train_and_score
+from src.compiled import compile_forest
+
+def make_data(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 6))
+    X[:, 2] = np.round(X[:, 2])  # ties on split thresholds
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0.2).astype(int)
+    return X, y
+
+class TestCompileForest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from sklearn.ensemble import RandomForestClassifier
+        except ImportError:
+            raise unittest.SkipTest("scikit-learn not installed")
+        
+        X, y = make_data(3000)
+        cls.X_test = make_data(2000, seed=1)[0]
+        cls.forest = RandomForestClassifier(n_estimators=30, random_state=0).fit(X, y)
+    
+    def test_matches_sklearn_for_every_threshold_dtype(self):
+        expected = self.forest.predict_proba(self.X_test)
+        for dtype in ("float64", "float32", "int16"):
+            compiled = compile_forest(self.forest, threshold_dtype=dtype)
+            np.testing.assert_allclose(compiled.predict_proba(self.X_test), expected, atol=1e-6)
+            np.testing.assert_array_equal(compiled.predict(self.X_test), self.forest.predict(self.X_test))
+    
+    def test_pruning_shrinks_the_ensemble(self):
+        full = compile_forest(self.forest)
+        pruned = compile_forest(self.forest, max_depth=4, max_trees=10)
+        
+        self.assertEqual(pruned.n_trees, 10)
+        self.assertEqual(pruned.depth, 4)
+        self.assertLess(pruned.nbytes, full.nbytes / 5)
+        agreement = np.mean(pruned.predict(self.X_test) == self.forest.predict(self.X_test))
+        self.assertGreater(agreement, 0.8)
+    
+    def test_single_row_prediction_is_faster(self):
+        compiled = compile_forest(self.forest)
+        rows = [self.X_test[i:i + 1] for i in range(50)]
+        
+        def seconds(model):
+            start = time.perf_counter()
+            for row in rows:
+                model.predict(row)
+            return time.perf_counter() - start
+        
+        self.assertLess(seconds(compiled), seconds(self.forest))
+    
+    def test_fallback_serves_large_batches(self):
+        compiled = compile_forest(self.forest, threshold_dtype="int16", fallback_rows=64)
+        compiled._proba_chunk = None  # any compiled traversal would now fail
+        
+        np.testing.assert_array_equal(compiled.predict(self.X_test), self.forest.predict(self.X_test))
+        with self.assertRaises(TypeError):
+            compiled.predict(self.X_test[:10])
+        with self.assertRaises(ValueError):
+            compile_forest(self.forest, max_depth=4, fallback_rows=64)
+    
+    def test_rejects_unsupported_models(self):
+        from sklearn.ensemble import GradientBoostingClassifier
+        
+        X, y = make_data(200)
+        with self.assertRaises(TypeError):
+            compile_forest(GradientBoostingClassifier(n_estimators=5).fit(X, y))
+        with self.assertRaises(ValueError):
+            compile_forest(self.forest, threshold_dtype="int8")
+
+class TestCompiledCandidates(unittest.TestCase):
+    def test_speedup_and_accuracy_delta_reach_the_arbiter(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        X, y = make_data(1200)
+        spec = {
+            "estimator": "RandomForestClassifier",
+            "params": {"n_estimators": 20, "random_state": 0},
+            "compile": {"max_depth": 6, "threshold_dtype": "int16"}
+        }
+        self.assertEqual(type(fit_candidate(spec, X, y)).__name__, "CompiledForest")
+        
+        scores = train_and_score(spec, X[:900], y[:900], X[900:], y[900:])
+        self.assertEqual(sorted(scores["compile_speedup_by_batch"]), ["1", "256", "32"])
+        self.assertEqual(scores["compile_speedup"], min(scores["compile_speedup_by_batch"].values()))
+        self.assertGreater(scores["compile_speedup_by_batch"]["1"], 1.0)
+        self.assertGreater(scores["compile_throughput_speedup"], 0)
+        self.assertLessEqual(abs(scores["compile_accuracy_delta"]), 1.0)
+        
+        solution = {"candidate": spec, "evaluation": {"status": "ok", "result": scores}}
+        report = Arbiter()._validate_solution(solution, {"accuracy": 0.8})["compile_report"]
+        self.assertEqual(report, {
+            "speedup": scores["compile_speedup"],
+            "throughput_speedup": scores["compile_throughput_speedup"],
+            "accuracy_delta": scores["compile_accuracy_delta"]
+        })
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# tests/test_data.py
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.data import iter_chunks
+from src.trawler import Trawler
+
+class ParityModel:
+    def predict(self, data):
+        return (np.asarray(data)[:, 0] % 2).astype(int)
+
+class TestData(unittest.TestCase):
+    def setUp(self):
+        self.data = np.arange(20, dtype=np.int64).reshape(10, 2)
+        self.labels = self.data[:, 0] % 2
+    
+    def test_array_chunks_are_views(self):
+        chunks = list(iter_chunks(self.data, self.labels, chunk_size=4))
+        
+        self.assertEqual([len(y) for _, y in chunks], [4, 4, 2])
+        self.assertTrue(np.shares_memory(chunks[0][0], self.data))
+    
+    def test_npy_paths_are_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = os.path.join(tmp, "X.npy")
+            labels_path = os.path.join(tmp, "y.npy")
+            np.save(data_path, self.data)
+            np.save(labels_path, self.labels)
+            
+            X_chunk, _ = next(iter_chunks(data_path, labels_path, chunk_size=3))
+            self.assertIsInstance(X_chunk, np.memmap)
+            
+            result = Trawler(batch_size=3).analyze_performance(ParityModel(), data_path, labels_path)
+            self.assertEqual(result["performance_metrics"]["accuracy"], 1.0)
+    
+    def test_pair_iterator(self):
+        pairs = ((self.data[i:i + 5], self.labels[i:i + 5]) for i in (0, 5))
+        
+        result = Trawler(batch_size=2).analyze_performance(ParityModel(), pairs)
+        
+        self.assertEqual(result["performance_metrics"]["n_samples"], 10)
+
+if __name__ == "__main__":
+    unittest.main()
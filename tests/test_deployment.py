@@ -0,0 +1,207 @@
+# tests/test_deployment.py
+import time
+import unittest
+import numpy as np
+from src.core import SRDFFramework
+from src.deployment import STATE_LIVE, STATE_PROBATION, STATE_SHADOW, ModelDeployment
+
+class Constant:
+    def __init__(self, value):
+        self.value = value
+    
+    def predict(self, X):
+        return np.full(len(X), self.value)
+
+class Degrading:
+    """Perfect for the first ``good_calls`` batches, then always wrong."""
+    def __init__(self, good_calls):
+        self.calls = 0
+        self.good_calls = good_calls
+    
+    def predict(self, X):
+        self.calls += 1
+        truth = (X[:, 0] > 0).astype(int)
+        return truth if self.calls <= self.good_calls else 1 - truth
+
+class Truth:
+    def predict(self, X):
+        return (X[:, 0] > 0).astype(int)
+
+class Slow(Truth):
+    def predict(self, X):
+        time.sleep(0.005)
+        return super().predict(X)
+
+def traffic(n_batches, rows=100, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n_batches):
+        X = rng.normal(size=(rows, 2))
+        yield X, (X[:, 0] > 0).astype(int)
+
+class TestModelDeployment(unittest.TestCase):
+    def serve(self, deployment, n_batches, seed=0):
+        for X, y in traffic(n_batches, seed=seed):
+            deployment.predict(X, y, mirror=True)
+            deployment.wait_for_shadow()
+    
+    def test_better_candidate_is_promoted_then_committed(self):
+        old, new = Constant(0), Truth()
+        deployment = ModelDeployment(old, min_shadow_rows=300, latency_tolerance=100.0)
+        deployment.stage(new)
+        
+        self.serve(deployment, 3)
+        self.assertEqual(deployment.state, STATE_PROBATION)
+        self.assertIs(deployment.live, new)
+        self.assertIs(deployment.shadow, old)
+        
+        self.serve(deployment, 3, seed=1)
+        self.assertEqual(deployment.state, STATE_LIVE)
+        self.assertIsNone(deployment.shadow)
+        self.assertEqual([e["event"] for e in deployment.events], ["staged", "promoted", "committed"])
+    
+    def test_worse_candidate_is_rejected(self):
+        live = Truth()
+        deployment = ModelDeployment(live, min_shadow_rows=300)
+        deployment.stage(Constant(1))
+        
+        self.serve(deployment, 3)
+        
+        self.assertIs(deployment.live, live)
+        self.assertEqual(deployment.state, STATE_LIVE)
+        self.assertEqual(deployment.events[-1]["event"], "rejected")
+    
+    def test_regression_after_swap_rolls_back(self):
+        old, new = Constant(0), Degrading(good_calls=3)
+        deployment = ModelDeployment(old, min_shadow_rows=300, latency_tolerance=100.0)
+        deployment.stage(new)
+        
+        self.serve(deployment, 6)
+        
+        self.assertIs(deployment.live, old)
+        self.assertEqual(deployment.events[-1]["event"], "rolled_back")
+        self.assertEqual(deployment.events[-1]["reason"], "accuracy regression")
+    
+    def test_cannot_stage_during_probation(self):
+        old, new = Constant(0), Truth()
+        deployment = ModelDeployment(old, min_shadow_rows=300, latency_tolerance=100.0)
+        deployment.stage(new, min_shadow_rows=100)
+        self.serve(deployment, 1)
+        
+        self.assertEqual(deployment.state, STATE_PROBATION)
+        self.assertEqual(deployment.rows_to_decide, 100)
+        with self.assertRaises(RuntimeError):
+            deployment.stage(Constant(1))
+        self.serve(deployment, 1, seed=1)
+        self.assertEqual(deployment.events[-1]["event"], "committed")
+        deployment.stage(Constant(1))
+    
+    def test_unlabelled_traffic_never_promotes(self):
+        old, new = Constant(0), Truth()
+        deployment = ModelDeployment(old, min_shadow_rows=300, latency_tolerance=100.0)
+        deployment.stage(new)
+        for X, _ in traffic(5):
+            deployment.predict(X, mirror=True)
+        deployment.wait_for_shadow()
+        
+        self.assertEqual(deployment.state, STATE_SHADOW)
+        self.assertIs(deployment.live, old)
+        self.assertEqual(deployment.rows_to_decide, 300)
+        self.serve(deployment, 3)
+        self.assertEqual(deployment.state, STATE_PROBATION)
+    
+    def test_slower_candidate_is_rejected(self):
+        live = Truth()
+        deployment = ModelDeployment(live, min_shadow_rows=300, latency_tolerance=0.25)
+        deployment.stage(Slow())
+        
+        self.serve(deployment, 3)
+        
+        self.assertIs(deployment.live, live)
+        self.assertEqual(deployment.events[-1]["event"], "rejected")
+    
+    def test_close_stops_the_mirror_thread(self):
+        deployment = ModelDeployment(Truth(), max_pending=1)
+        deployment.stage(Constant(1))
+        self.serve(deployment, 2)
+        deployment.close()
+        self.assertIsNone(deployment._mirror_pool)
+        
+        self.serve(deployment, 2)  # mirroring resumes on a fresh thread
+        self.assertEqual(deployment.report()["shadow"]["rows"], 400)
+        deployment.close()
+    
+    def test_unsampled_batches_are_not_mirrored(self):
+        deployment = ModelDeployment(Truth(), shadow_fraction=0.0)
+        deployment.stage(Constant(1))
+        for X, y in traffic(5):
+            deployment.predict(X, y)
+        deployment.wait_for_shadow()
+        self.assertEqual(deployment.report()["shadow"]["rows"], 0)
+
+class TestFrameworkDeployment(unittest.TestCase):
+    def test_cycle_hot_swaps_selected_candidate(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(4000, 4))
+        y = (X[:, 0] + X[:, 1] * X[:, 2] > 0.3).astype(int)
+        framework = SRDFFramework()
+        framework.load_config({"candidate_evaluation": "holdout", "validation_threshold": 0.6,
+                               "rollback_latency_tolerance": 1e4})  # the live stub is near-free
+        live = Constant(0)
+        
+        result = framework._run_cycle(0, live, X, y)["implementation_result"]
+        
+        self.assertEqual(result["status"], "promoted")
+        self.assertTrue(result["changes_applied"])
+        self.assertIsNot(framework.deployment.live, live)
+        self.assertEqual(len(framework.predict(X[:10])), 10)
+    
+    def test_example_sized_data_reaches_a_decision(self):
+        # The examples and notebooks use 1000 rows: a 250-row replay must
+        # still decide the candidate rather than leave it shadowing
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(1)
+        X = rng.normal(size=(1000, 4))
+        y = (X[:, 0] + X[:, 1] > 0).astype(int)
+        framework = SRDFFramework()
+        framework.load_config({"candidate_evaluation": "holdout", "validation_threshold": 0.6,
+                               "rollback_latency_tolerance": 1e4})  # the live stub is near-free
+        
+        first = framework._run_cycle(0, Constant(0), X, y)["implementation_result"]
+        self.assertEqual(first["status"], "promoted")
+        self.assertEqual(first["deployment"]["state"], STATE_PROBATION)
+        
+        # The next cycle settles that probation before staging anything new
+        second = framework._run_cycle(1, Constant(0), X, y)["implementation_result"]
+        events = [e["event"] for e in framework.deployment.events]
+        self.assertIn(events[events.index("promoted") + 1], ("committed", "rolled_back"))
+        self.assertNotEqual(second["status"], "deferred")
+        framework.stop_evolution()
+        self.assertIsNone(framework.deployment._mirror_pool)
+
+    def test_too_few_rows_to_replay_skips_deployment(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        framework = SRDFFramework()
+        framework.load_config({"candidate_evaluation": "holdout"})
+        solution = {"proposed_solution": "tree", "candidate": {"estimator": "DecisionTreeClassifier"}}
+        X, y = np.zeros((3, 2)), np.array([0, 1, 0])
+        
+        result = framework._implement_solution(solution, Constant(0), X, y)
+        
+        self.assertEqual(result["status"], "skipped")
+        self.assertEqual(framework.deployment.state, STATE_LIVE)
+
+if __name__ == "__main__":
+    unittest.main()
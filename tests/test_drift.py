@@ -0,0 +1,62 @@
+# tests/test_drift.py
+import unittest
+import numpy as np
+from src.drift import DriftDetector
+from src.trawler import Trawler
+
+class ZeroModel:
+    def predict(self, data):
+        return np.zeros(len(data), dtype=int)
+
+class TestDriftDetector(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.reference = self.rng.normal(size=(5000, 3))
+    
+    def test_shift_is_detected_on_one_feature(self):
+        detector = DriftDetector(seed=0).fit_reference(self.reference)
+        current = self.rng.normal(size=(2000, 3))
+        current[:, 1] += 1.5
+        for batch in np.array_split(current, 4):
+            detector.update(batch)
+        
+        self.assertEqual(detector.drifted_features(), [1])
+        self.assertEqual(detector.sample().shape, (256, 3))
+    
+    def test_same_distribution_is_quiet(self):
+        detector = DriftDetector().fit_reference(self.reference)
+        detector.update(self.rng.normal(size=(2000, 3)))
+        
+        self.assertEqual(detector.drifted_features(), [])
+        self.assertLess(detector.report()["max_psi"], 0.05)
+    
+    def test_non_numeric_columns_are_skipped(self):
+        def mixed(values, categories):
+            data = np.empty((len(values), 3), dtype=object)
+            data[:, 0], data[:, 1], data[:, 2] = categories, values[:, 0], values[:, 1]
+            return data
+        
+        categories = self.rng.choice(["a", "b"], size=5000)
+        detector = DriftDetector(seed=0).fit_reference(mixed(self.reference, categories))
+        shifted = self.reference[:2000].copy()
+        shifted[:, 1] += 1.5
+        detector.update(mixed(shifted, categories[:2000]))
+        
+        self.assertEqual(sorted(detector.scores()), [1, 2])
+        self.assertEqual(detector.drifted_features(), [2])
+        
+        inert = DriftDetector().fit_reference(np.array([["a"], ["b"]] * 100, dtype=object))
+        self.assertEqual(inert.report()["drifted_features"], [])
+    
+    def test_trawler_reports_drift_issue(self):
+        trawler = Trawler(profile_batch_sizes=None)
+        labels = np.zeros(5000, dtype=int)
+        trawler.analyze_performance(ZeroModel(), self.reference, labels)
+        
+        result = trawler.analyze_performance(ZeroModel(), self.reference + 2.0, labels)
+        
+        self.assertTrue(any("drift" in issue for issue in result["identified_issues"]))
+        self.assertEqual(trawler.detect_anomalies(), [0, 1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
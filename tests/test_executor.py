@@ -0,0 +1,76 @@
+# tests/test_executor.py
+import time
+import unittest
+import numpy as np
+from src.executor import CandidateExecutor
+from src.generator import Generator
+
+def sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+def fail():
+    raise ValueError("bad candidate")
+
+class TestCandidateExecutor(unittest.TestCase):
+    def test_runs_concurrently_with_timeouts(self):
+        executor = CandidateExecutor(max_workers=3, timeout=1.0)
+        tasks = [
+            (sleep_and_return, (0.5, "a")),
+            (sleep_and_return, (0.5, "b")),
+            (sleep_and_return, (5.0, "slow")),
+            (fail, ())
+        ]
+        
+        start = time.perf_counter()
+        results = executor.run(tasks)
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual([r["status"] for r in results], ["ok", "ok", "timeout", "error"])
+        self.assertEqual(results[1]["result"], "b")
+        self.assertIn("bad candidate", results[3]["error"])
+        self.assertLess(elapsed, 2.5)
+    
+    def test_failed_start_releases_its_slot(self):
+        executor = CandidateExecutor(max_workers=1, timeout=5.0)
+        process = executor.context.Process
+        calls = []
+        
+        def flaky_process(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("too many open files")
+            return process(*args, **kwargs)
+        
+        executor.context.Process = flaky_process
+        self.addCleanup(delattr, executor.context, "Process")
+        results = executor.run([(sleep_and_return, (0, "a")), (sleep_and_return, (0, "b"))])
+        
+        self.assertEqual(sorted(r["status"] for r in results), ["error", "ok"])
+        self.assertIn("could not start worker", next(r["error"] for r in results if r["status"] == "error"))
+        self.assertTrue(executor._slots.acquire(blocking=False))
+    
+    def test_evaluate_attaches_scores(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        data = rng.normal(size=(400, 4))
+        labels = (data[:, 0] + data[:, 1] > 0).astype(int)
+        solutions = Generator().propose_solutions({
+            "identified_issues": ["Low accuracy", "Slow inference speed"],
+            "recommendations": ["Try ensemble methods", "Use quantization"]
+        })
+        
+        CandidateExecutor(max_workers=2, timeout=60).evaluate(solutions, data, labels)
+        
+        for solution in solutions:
+            evaluation = solution["evaluation"]
+            self.assertEqual(evaluation["status"], "ok", evaluation["error"])
+            self.assertGreater(evaluation["result"]["accuracy"], 0.7)
+            self.assertGreater(evaluation["result"]["model_size_bytes"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/test_fleet.py
+import unittest
+import numpy as np
+from src.core import SRDFFramework
+from src.fleet import member_checkpoint_path, regression_severity
+
+class TestModelFleet(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(400, 3))
+        self.y = (self.X[:, 0] > 0).astype(int)
+        self.framework = SRDFFramework()
+        self.framework.load_config({
+            "cycle_interval": 0, "evaluate_candidates": False, "fleet_max_concurrent": 1
+        })
+    
+    def register(self, name, weight=1.0, data=None):
+        try:
+            from sklearn.tree import DecisionTreeClassifier
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        model = DecisionTreeClassifier(max_depth=1).fit(self.X, self.y)
+        return self.framework.register_model(
+            name, model, self.X.copy() if data is None else data, self.y, weight=weight
+        )
+    
+    def test_members_share_identical_data_and_executor(self):
+        a, b = self.register("a"), self.register("b")
+        
+        self.assertIs(a.data, b.data)
+        self.assertIs(a.labels, b.labels)
+        self.assertEqual(self.framework.fleet.unique_datasets, 2)
+        self.assertIs(a.framework.executor, self.framework.executor)
+        self.assertIsNot(a.framework.trawler, b.framework.trawler)
+    
+    def test_members_checkpoint_to_their_own_logs(self):
+        self.assertIsNone(member_checkpoint_path({"checkpoint_path": None}, "a"))
+        self.assertEqual(member_checkpoint_path({"checkpoint_path": "runs/cycles.jsonl"}, "tenant/a"),
+                         "runs/cycles.tenant_a.jsonl")
+        
+        self.framework.config["checkpoint_path"] = "cycles.jsonl"
+        a, b = self.register("a"), self.register("b")
+        self.assertEqual(a.framework.checkpoint.path, "cycles.a.jsonl")
+        self.assertEqual(b.framework.checkpoint.path, "cycles.b.jsonl")
+    
+    def test_unregister_drops_unshared_datasets(self):
+        own = self.X + 1.0
+        self.register("a")
+        self.register("b", data=own)
+        fleet = self.framework.fleet
+        self.assertEqual(fleet.unique_datasets, 3)
+        
+        fleet.unregister("b")
+        self.assertEqual(fleet.unique_datasets, 2)
+        self.assertNotIn(id(own), fleet._pinned)
+        self.assertNotIn(id(own), fleet._datasets)
+        
+        fleet.unregister("a")
+        self.assertEqual((fleet._datasets, fleet._fingerprints, fleet._pinned), ({}, {}, {}))
+    
+    def test_fair_share_runs_every_member(self):
+        for name in ("a", "b", "c"):
+            self.register(name)
+        
+        results = self.framework.start_fleet(max_cycles=6)
+        
+        self.assertEqual(len(results), 6)
+        stats = self.framework.get_status()["fleet"]["members"]
+        self.assertTrue(all(s["cycles"] >= 1 for s in stats.values()))
+        self.assertEqual(sum(s["cycles"] for s in stats.values()), 6)
+        telemetry = self.framework.telemetry
+        self.assertEqual(sum(telemetry.counter_value("cycles", model=name) for name in stats), 6)
+    
+    def test_severity_jumps_the_queue(self):
+        healthy, regressed = self.register("healthy"), self.register("regressed")
+        healthy.service_seconds = regressed.service_seconds = 1.0
+        regressed.severity = regression_severity(
+            {"performance_metrics": {"accuracy": 0.6, "feature_drift": {"drifted_features": [0]}}}, 0.9
+        )
+        
+        self.assertAlmostEqual(regressed.severity, 1 + 0.3 / 0.9)
+        self.assertIs(self.framework.fleet._next_member(now=0.0), regressed)
+        
+        regressed.service_seconds = 100.0
+        self.assertIs(self.framework.fleet._next_member(now=0.0), healthy)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,6 +19,19 @@ class TestGenerator(unittest.TestCase):
         
         self.assertEqual(len(solutions), 2)
         self.assertIn("proposed_solution", solutions[0])
+    
+    def test_speed_solution_uses_measured_latency(self):
+        analysis_results = {
+            "identified_issues": ["Slow inference speed (400.0 ms > 100.0 ms)"],
+            "recommendations": ["Optimize model architecture or use quantization"],
+            "performance_metrics": {"inference_time": 0.4, "latency_threshold": 0.1}
+        }
+        
+        solution = self.generator.propose_solutions(analysis_results)[0]
+        
+        self.assertEqual(solution["proposed_solution"], "Knowledge distillation to smaller model")
+        self.assertEqual(solution["estimated_improvement"], "75%")
+        self.assertEqual(solution["measured_latency"]["inference_time"], 0.4)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+# tests/test_history.py
+import unittest
+import numpy as np
+from src.history import HistoryStore
+from src.generator import Generator
+
+class TestHistoryStore(unittest.TestCase):
+    def test_ring_buffer_keeps_newest_records(self):
+        store = HistoryStore(capacity=3)
+        store.extend(range(5))
+        
+        self.assertEqual(list(store), [2, 3, 4])
+        self.assertEqual(store[-1], 4)
+        self.assertEqual(store[0:2], [2, 3])
+        self.assertEqual(store.total_appended, 5)
+    
+    def test_evicted_records_are_downsampled(self):
+        store = HistoryStore(capacity=2, summarize=lambda r: {"score": r["score"]},
+                             bucket_size=2, max_buckets=1)
+        for score in range(7):
+            store.append({"score": float(score)})
+        
+        aggregates = store.get_aggregates()
+        
+        # Buckets [0, 1] was pushed out by [2, 3]; [4] is still filling
+        self.assertEqual([a["count"] for a in aggregates], [2, 1])
+        self.assertEqual(aggregates[0]["mean"]["score"], 2.5)
+        self.assertEqual(aggregates[1]["max"]["score"], 4.0)
+    
+    def test_summaries_are_kept_as_columns(self):
+        store = HistoryStore(capacity=3, summarize=lambda r: {"score": r.get("score")},
+                             bucket_size=10)
+        store.extend([{"score": 1.0}, {}, {"score": 3.0}, {"score": 4.0}])
+        
+        np.testing.assert_array_equal(store.column("score"), [np.nan, 3.0, 4.0])
+        self.assertEqual(store.get_aggregates()[0]["mean"], {"score": 1.0})
+        
+        unbounded = HistoryStore(capacity=None, summarize=lambda r: {"score": r})
+        unbounded.extend(range(100))
+        np.testing.assert_array_equal(unbounded.column("score"), np.arange(100))
+    
+    def test_clear_resets_the_append_count(self):
+        store = HistoryStore(capacity=2, summarize=lambda r: {"score": r})
+        store.extend(range(5))
+        store.clear()
+        
+        self.assertEqual(store.total_appended, 0)
+        self.assertEqual(store.column("score").size, 0)
+        store.extend(range(3))
+        self.assertEqual(store.get_aggregates()[0]["first_index"], 0)
+    
+    def test_accessor_returns_live_view(self):
+        generator = Generator(history_size=2)
+        view = generator.get_solution_history()
+        analysis = {
+            "identified_issues": ["Low accuracy"] * 3,
+            "recommendations": ["Try ensemble methods"] * 3
+        }
+        
+        solutions = generator.propose_solutions(analysis)
+        
+        self.assertEqual(len(view), 2)
+        self.assertIs(view[-1], solutions[-1])
+        with self.assertRaises(TypeError):
+            view[0] = {}
+
+if __name__ == "__main__":
+    unittest.main()
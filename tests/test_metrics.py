@@ -0,0 +1,39 @@
+# tests/test_metrics.py
+import unittest
+import numpy as np
+from src.metrics import ConfusionAccumulator, evaluate_model
+
+class TestMetrics(unittest.TestCase):
+    def test_confusion_matrix(self):
+        acc = ConfusionAccumulator()
+        acc.update([0, 0, 1, 1], [0, 1, 1, 1])
+        acc.update([2], [2])
+        
+        np.testing.assert_array_equal(acc.matrix, [[1, 1, 0], [0, 2, 0], [0, 0, 1]])
+        metrics = acc.metrics()
+        self.assertAlmostEqual(metrics["accuracy"], 0.8)
+        self.assertAlmostEqual(metrics["per_class"]["0"]["recall"], 0.5)
+        self.assertAlmostEqual(metrics["per_class"]["1"]["precision"], 2 / 3)
+    
+    def test_evaluate_model_in_batches(self):
+        class ThresholdModel:
+            def __init__(self):
+                self.calls = 0
+            
+            def predict(self, data):
+                self.calls += 1
+                return (data[:, 0] > 0.5).astype(int)
+        
+        rng = np.random.default_rng(0)
+        data = rng.random((1000, 2))
+        labels = (data[:, 0] > 0.5).astype(int)
+        model = ThresholdModel()
+        
+        metrics = evaluate_model(model, data, labels, batch_size=128).metrics()
+        
+        self.assertEqual(model.calls, 8)
+        self.assertEqual(metrics["accuracy"], 1.0)
+        self.assertEqual(metrics["n_samples"], 1000)
+
+if __name__ == "__main__":
+    unittest.main()
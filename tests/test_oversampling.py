@@ -0,0 +1,153 @@
+# tests/test_oversampling.py
+import unittest
+import numpy as np
+from src.candidates import holdout_split, prepare_training_data, train_and_score
+from src.executor import CandidateExecutor, shared_arrays
+from src.oversampling import (
+    TABLE_OVERSHOOT, NeighborIndex, SMOTEOversampler, shared_neighbor_table,
+    shared_oversampler, window_neighbors
+)
+from src.shared import SharedDataset
+
+def imbalanced(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 4))
+    y = (rng.random(n_rows) < 0.1).astype(int)
+    X[y == 1] += 3.0
+    return X, y
+
+class TestNeighborIndex(unittest.TestCase):
+    def test_incremental_index_matches_a_single_tree(self):
+        try:
+            from sklearn.neighbors import KDTree
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        rng = np.random.default_rng(0)
+        points = rng.normal(size=(2000, 3))
+        index = NeighborIndex(3)
+        for start in range(0, 2000, 170):
+            index.add(points[start:start + 170])
+
+        self.assertEqual(len(index), 2000)
+        self.assertLessEqual(index.n_trees, 11)  # logarithmic, not one per add
+        queries = rng.normal(size=(100, 3))
+        distances, indices = index.query(queries, 4)
+        expected_distances, expected_indices = KDTree(points).query(queries, 4)
+        np.testing.assert_allclose(distances, expected_distances)
+        np.testing.assert_array_equal(indices, expected_indices)
+
+class TestSMOTEOversampler(unittest.TestCase):
+    def test_balances_classes_with_in_class_interpolations(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(1000)
+        X_res, y_res = SMOTEOversampler(k_neighbors=5, random_state=0).fit_resample(X, y)
+
+        np.testing.assert_array_equal(np.bincount(y_res), [np.sum(y == 0)] * 2)
+        np.testing.assert_array_equal(X_res[:1000], X)
+        synthetic = X_res[1000:]
+        minority = X[y == 1]
+        # Interpolations stay inside the minority class's bounding box
+        self.assertTrue(np.all(synthetic.min(axis=0) >= minority.min(axis=0) - 1e-9))
+        self.assertTrue(np.all(synthetic.max(axis=0) <= minority.max(axis=0) + 1e-9))
+
+    def test_appended_rows_reuse_the_index(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(3000)
+        oversampler = SMOTEOversampler(random_state=1)
+        oversampler.fit_resample(X[:2000], y[:2000])
+        grown = oversampler.fit_resample(X, y)
+        again = oversampler.fit_resample(X, y)
+
+        self.assertEqual(oversampler.rebuilds, 1)
+        fresh = SMOTEOversampler(random_state=1).fit_resample(X, y)
+        for result in (grown, again):
+            np.testing.assert_array_equal(result[0], fresh[0])
+            np.testing.assert_array_equal(result[1], fresh[1])
+
+        oversampler.fit_resample(X[::-1], y[::-1])  # not an extension
+        self.assertEqual(oversampler.rebuilds, 2)
+
+    def test_smote_candidates_share_the_oversampler(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(800, seed=2)
+        spec = {"estimator": "RandomForestClassifier", "resample": "smote", "random_state": 3}
+        X_res, y_res = prepare_training_data(spec, X, y)
+
+        self.assertEqual(np.bincount(y_res)[0], np.bincount(y_res)[1])
+        oversampler = shared_oversampler(X, random_state=3)
+        prepare_training_data(spec, X, y)
+        self.assertEqual(oversampler.rebuilds, 1)
+
+class TestSharedNeighborTable(unittest.TestCase):
+    def test_subset_tables_match_a_fresh_oversampler(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(1200, seed=4)
+        table = shared_neighbor_table(X, y, k_neighbors=5)
+        self.assertEqual(table.shape, (1200, TABLE_OVERSHOOT * 6))
+
+        doubled = np.concatenate([table, table])
+        for lo, hi in [(900, 1200), (0, 300), (400, 700)]:
+            # Training rows of a cross-validation fold: the rows after it, cyclically
+            keep = np.r_[hi:1200, 0:lo]
+            neighbors = window_neighbors(doubled[hi:1200 + lo], hi, len(keep), 1200)
+            result = SMOTEOversampler(random_state=2).fit_resample(X[keep], y[keep], neighbors=neighbors)
+            expected = SMOTEOversampler(random_state=2).fit_resample(X[keep], y[keep])
+            np.testing.assert_allclose(result[0], expected[0])
+            np.testing.assert_array_equal(result[1], expected[1])
+
+    def test_sample_layouts_index_only_the_sample(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(1200, seed=6)
+        order = np.random.default_rng(0).permutation(1200)[:300]
+        solutions = [{"candidate": {"estimator": "LogisticRegression", "resample": "smote"}}]
+        doubled = np.concatenate([order, order])
+        with SharedDataset(shared_arrays(solutions, X, y, order), order=doubled) as shared:
+            laid_out = np.array(shared.open("neighbors"))
+
+        expected = shared_neighbor_table(X[order], y[order], k_neighbors=5, incremental=False)
+        np.testing.assert_array_equal(laid_out, np.concatenate([expected, expected]))
+
+    def test_executor_workers_use_the_parent_table(self):
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = imbalanced(1500, seed=5)
+        spec = {"estimator": "LogisticRegression", "resample": "smote", "random_state": 1}
+        executor = CandidateExecutor(max_workers=2)
+        for n_rows in (1000, 1500):
+            solutions = executor.evaluate([{"candidate": spec}], X[:n_rows], y[:n_rows])
+            evaluation = solutions[0]["evaluation"]
+            self.assertEqual(evaluation["status"], "ok", evaluation["error"])
+
+        # The parent indexed the first rows once and only appended the rest
+        parent = shared_oversampler(X, k_neighbors=TABLE_OVERSHOOT * 6 - 1, random_state=0)
+        self.assertEqual(parent.rebuilds, 1)
+        train_idx, val_idx = holdout_split(1500, 0.25, 0)
+        local = train_and_score(spec, X[train_idx], y[train_idx], X[val_idx], y[val_idx])
+        self.assertAlmostEqual(evaluation["result"]["accuracy"], local["accuracy"])
+
+if __name__ == "__main__":
+    unittest.main()
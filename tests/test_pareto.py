@@ -0,0 +1,68 @@
+# tests/test_pareto.py
+import unittest
+import numpy as np
+from src.arbiter import Arbiter
+from src.pareto import ParetoFront
+
+def measured(name, accuracy, latency, size):
+    return {
+        "proposed_solution": name,
+        "evaluation": {
+            "status": "ok",
+            "result": {"accuracy": accuracy, "latency_p99": latency, "model_size_bytes": size}
+        }
+    }
+
+class TestParetoFront(unittest.TestCase):
+    def test_dominated_points_are_dropped(self):
+        front = ParetoFront()
+        self.assertTrue(front.insert(0.90, 0.010, 1000, "big"))
+        self.assertTrue(front.insert(0.85, 0.002, 200, "small"))
+        self.assertFalse(front.insert(0.84, 0.003, 300, "worse than small"))
+        self.assertTrue(front.insert(0.92, 0.009, 900, "better than big"))
+        
+        self.assertEqual([m["payload"] for m in front.members()], ["better than big", "small"])
+        self.assertEqual(front.query(max_latency=0.005), "small")
+        self.assertEqual(front.query(), "better than big")
+        self.assertIsNone(front.query(max_latency=0.001))
+    
+    def test_arbiter_selects_under_latency_budget(self):
+        arbiter = Arbiter(validation_threshold=0.8, latency_budget=0.005)
+        solutions = [
+            measured("forest", 0.93, 0.020, 5_000_000),
+            measured("tree", 0.86, 0.001, 20_000),
+            measured("stump", 0.70, 0.0005, 1_000)
+        ]
+        
+        result = arbiter.validate_solutions(solutions, {"accuracy": 0.8})
+        
+        self.assertEqual(result["selected_solution"]["proposed_solution"], "tree")
+        self.assertEqual(len(arbiter.pareto_front), 3)
+        self.assertEqual(arbiter.select_from_front(max_latency=0.05)["proposed_solution"], "forest")
+    
+    def test_over_budget_candidates_are_never_selected(self):
+        arbiter = Arbiter(validation_threshold=0.8, latency_budget=0.005)
+        
+        over_budget = arbiter.validate_solutions([measured("forest", 0.93, 0.020, 5_000_000)],
+                                                 {"accuracy": 0.8})
+        invalid = arbiter.validate_solutions([measured("stump", 0.50, 0.0005, 1_000)],
+                                             {"accuracy": 0.8})
+        
+        self.assertIsNone(over_budget["selected_solution"])
+        self.assertFalse(over_budget["selection_fallback"])
+        self.assertEqual(invalid["selected_solution"]["proposed_solution"], "stump")
+        self.assertTrue(invalid["selection_fallback"])
+    
+    def test_front_is_scoped_to_the_dataset(self):
+        arbiter = Arbiter(validation_threshold=0.8)
+        X, y = np.zeros((10, 2)), np.zeros(10, dtype=int)
+        
+        arbiter.validate_solutions([measured("old", 0.95, 0.001, 100)], {"accuracy": 0.8}, X, y)
+        arbiter.validate_solutions([measured("same data", 0.90, 0.0005, 100)], {"accuracy": 0.8}, X, y)
+        self.assertEqual(len(arbiter.pareto_front), 2)
+        
+        arbiter.validate_solutions([measured("new", 0.85, 0.002, 100)], {"accuracy": 0.8}, X + 1, y)
+        self.assertEqual([m["payload"]["proposed_solution"] for m in arbiter.pareto_front.members()], ["new"])
+
+if __name__ == "__main__":
+    unittest.main()
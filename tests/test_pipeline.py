@@ -0,0 +1,119 @@
+# tests/test_pipeline.py
+import asyncio
+import threading
+import time
+import unittest
+import numpy as np
+from src.arbiter import Arbiter
+from src.core import SRDFFramework
+from src.pipeline import CyclePipeline
+
+def sleeper(seconds, log, name):
+    def stage(item):
+        time.sleep(seconds)
+        log.append((name, item))
+    return stage
+
+class TestCyclePipeline(unittest.TestCase):
+    def run_pipeline(self, pipeline, items):
+        async def main():
+            pipeline.start()
+            for item in items:
+                await pipeline.submit(item)
+            await pipeline.drain()
+        asyncio.run(main())
+    
+    def test_stages_overlap_and_preserve_order(self):
+        log, completed = [], []
+        pipeline = CyclePipeline(
+            [(name, sleeper(0.05, log, name)) for name in ("analyze", "validate", "implement")],
+            on_complete=completed.append
+        )
+        
+        started = time.perf_counter()
+        self.run_pipeline(pipeline, range(6))
+        elapsed = time.perf_counter() - started
+        
+        self.assertEqual(completed, list(range(6)))
+        self.assertEqual([item for name, item in log if name == "validate"], list(range(6)))
+        self.assertLess(elapsed, 6 * 3 * 0.05 * 0.7)  # sequential would take 0.9s
+    
+    def test_backpressure_and_bottleneck(self):
+        log = []
+        pipeline = CyclePipeline(
+            [("fast", sleeper(0.0, log, "fast")), ("slow", sleeper(0.05, log, "slow"))],
+            queue_size=1
+        )
+        
+        self.run_pipeline(pipeline, range(5))
+        stats = pipeline.stats()
+        
+        self.assertEqual(stats["bottleneck"], "slow")
+        self.assertEqual(stats["stages"]["slow"]["items"], 5)
+        self.assertGreater(stats["stages"]["slow"]["utilization"], 0.7)
+        self.assertGreater(stats["stages"]["fast"]["blocked_seconds"], 0.05)
+
+class TestPipelinedFramework(unittest.TestCase):
+    def test_pipelined_cycles_complete_in_order(self):
+        try:
+            from sklearn.tree import DecisionTreeClassifier
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 3))
+        y = (X[:, 0] > 0).astype(int)
+        model = DecisionTreeClassifier(max_depth=1).fit(X, y)
+        framework = SRDFFramework()
+        framework.load_config({
+            "max_cycles": 3, "cycle_interval": 0, "pipelined": True, "evaluate_candidates": False
+        })
+        
+        results = framework.start_evolution(model, X, y)
+        
+        self.assertEqual([r["cycle_number"] for r in results], [0, 1, 2])
+        self.assertEqual(framework.cycle_count, 3)
+        stages = framework.get_status()["pipeline"]["stages"]
+        self.assertEqual(list(stages), ["analyze", "propose", "evaluate", "validate", "implement"])
+        self.assertTrue(all(stage["items"] == 3 for stage in stages.values()))
+
+    def test_validation_waits_for_a_surrogate_update(self):
+        # The evaluate stage prescreens cycle N+1 while the validate stage
+        # appends cycle N to the history the surrogate is refitted from
+        arbiter = Arbiter(validation_threshold=0.8, history_size=2)
+        performance = {"accuracy": 0.8, "inference_time": 0.01}
+        
+        def solutions(accuracy):
+            return [{"proposed_solution": "Ensemble methods", "solution_type": "accuracy",
+                     "complexity": "medium",
+                     "evaluation": {"status": "ok", "result": {"accuracy": accuracy}}}]
+        
+        arbiter.validate_solutions(solutions(0.9), performance)
+        updating, events = threading.Event(), []
+        update = arbiter.surrogate.update
+        
+        def slow_update(samples):
+            samples = iter(samples)
+            first = next(samples)
+            updating.set()
+            time.sleep(0.1)
+            events.append("update")
+            return update([first, *samples])
+        
+        def validate():
+            updating.wait(5)
+            arbiter.validate_solutions(solutions(0.5), performance)
+            events.append("validate")
+        
+        arbiter.surrogate.update = slow_update
+        thread = threading.Thread(target=validate)
+        thread.start()
+        arbiter.prescreen([{"proposed_solution": "Ensemble methods", "solution_type": "accuracy",
+                            "complexity": "medium"}], performance)
+        thread.join()
+        
+        self.assertEqual(events, ["update", "validate"])
+        self.assertEqual(arbiter.validation_history.total_appended, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests/test_profiler.py
+import time
+import unittest
+import numpy as np
+from src.profiler import profile_inference, summarize_profile
+from src.trawler import Trawler
+
+class SleepyModel:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.calls = 0
+    
+    def predict(self, data):
+        self.calls += 1
+        time.sleep(self.seconds)
+        return np.zeros(len(data), dtype=int)
+
+class TestProfiler(unittest.TestCase):
+    def test_profile_sweeps_batch_sizes(self):
+        model = SleepyModel(0.001)
+        
+        profile = profile_inference(model, np.zeros((50, 3)), batch_sizes=(1, 10, 100),
+                                    warmup_runs=1, repeats=4)
+        
+        self.assertEqual(sorted(profile), [1, 10])
+        self.assertEqual(model.calls, 10)
+        self.assertGreaterEqual(profile[1]["latency_p99"], 0.001)
+        self.assertGreater(profile[10]["rows_per_second"], profile[1]["rows_per_second"])
+        
+        summary = summarize_profile(profile)
+        self.assertEqual(summary["inference_time"], profile[1]["latency_p99"])
+    
+    def test_speed_issue_follows_measurement(self):
+        data, labels = np.zeros((20, 2)), np.zeros(20, dtype=int)
+        
+        fast = Trawler(profile_repeats=3).analyze_performance(SleepyModel(0), data, labels)
+        slow = Trawler(profile_repeats=3, latency_threshold=0.001).analyze_performance(
+            SleepyModel(0.002), data, labels
+        )
+        
+        self.assertFalse(any("speed" in issue for issue in fast["identified_issues"]))
+        self.assertTrue(any("speed" in issue for issue in slow["identified_issues"]))
+        self.assertIn("latency_profile", slow["performance_metrics"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# tests/test_progressive.py
+import unittest
+from unittest import mock
+import numpy as np
+from src.arbiter import Arbiter
+from src import executor
+from src.executor import CandidateExecutor
+from src.progressive import sample_schedule, stratified_order, wilson_interval
+from src.trawler import Trawler
+
+class ThresholdModel:
+    """Predicts ``X[:, 0] > 0``; labels decide how accurate that is."""
+    def predict(self, X):
+        return (np.asarray(X)[:, 0] > 0).astype(int)
+
+def labelled(n_rows, flip_rate, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, 3))
+    y = (X[:, 0] > 0).astype(int)
+    flip = rng.permutation(n_rows)[:int(n_rows * flip_rate)]  # exactly 1 - flip_rate accurate
+    y[flip] = 1 - y[flip]
+    return X, y
+
+class TestSampling(unittest.TestCase):
+    def test_every_prefix_is_stratified(self):
+        labels = np.repeat([0, 1, 2], [9000, 900, 100])
+        order = stratified_order(labels, random_state=0)
+
+        self.assertEqual(sorted(order.tolist()), list(range(10000)))
+        for size in (100, 1000, 5000):
+            counts = np.bincount(labels[order[:size]], minlength=3)
+            np.testing.assert_allclose(counts / size, [0.9, 0.09, 0.01], atol=1.5 / size + 0.002)
+
+    def test_schedule_and_interval(self):
+        self.assertEqual(sample_schedule(100000, 0.01, growth=4, min_rows=500), [1000, 4000, 16000, 64000, 100000])
+        self.assertEqual(sample_schedule(800, 0.01, min_rows=1000), [800])
+        low, high = wilson_interval(90, 100, 0.95)
+        self.assertAlmostEqual(low, 0.8256, places=3)
+        self.assertAlmostEqual(high, 0.9448, places=3)
+
+class TestProgressiveTrawler(unittest.TestCase):
+    def test_clear_cases_stop_on_a_small_sample(self):
+        trawler = Trawler(sample_fraction=0.01, min_sample_rows=500, profile_batch_sizes=None, detect_drift=False)
+        for flip_rate, flagged in ((0.02, False), (0.3, True)):
+            X, y = labelled(200000, flip_rate)
+            analysis = trawler.analyze_performance(ThresholdModel(), X, y)
+            sample = analysis["performance_metrics"]["sample"]
+
+            self.assertEqual(sample["rows"], 2000)
+            self.assertEqual(analysis["performance_metrics"]["n_samples"], 2000)
+            self.assertEqual("Low accuracy - needs improvement" in analysis["identified_issues"], flagged)
+
+    def test_borderline_accuracy_escalates_to_all_rows(self):
+        trawler = Trawler(sample_fraction=0.01, min_sample_rows=500, profile_batch_sizes=None, detect_drift=False)
+        X, y = labelled(50000, 0.1)
+        metrics = trawler.analyze_performance(ThresholdModel(), X, y)["performance_metrics"]
+
+        self.assertEqual(metrics["sample"]["rows"], 50000)
+        self.assertAlmostEqual(metrics["accuracy"], np.mean(ThresholdModel().predict(X) == y))
+
+class TestProgressiveArbiter(unittest.TestCase):
+    def validate_stump(self, threshold):
+        try:
+            import sklearn.tree  # noqa: F401  (imported once here, inherited by forked workers)
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = labelled(10000, 0.1, seed=1)
+        solution = {"candidate": {"estimator": "DecisionTreeClassifier", "params": {"max_depth": 1}}}
+        arbiter = Arbiter(validation_threshold=threshold,
+                          executor=CandidateExecutor(max_workers=4, timeout=60), cv_folds=4,
+                          progressive_fraction=0.05, progressive_min_rows=800)
+        arbiter.cross_validate([solution], X, y)
+        return solution["cross_validation"]
+
+    def test_clear_candidates_are_decided_on_the_first_sample(self):
+        # A depth-1 stump on the informative feature scores about 0.9
+        for threshold in (0.7, 0.98):
+            summary = self.validate_stump(threshold)
+            self.assertEqual(summary["sample_rows"], 800)
+            self.assertTrue(summary["accuracy"]["ci_low"] >= threshold or summary["accuracy"]["ci_high"] < threshold)
+
+    def test_borderline_candidates_escalate(self):
+        summary = self.validate_stump(0.9)
+        self.assertGreater(summary["sample_rows"], 800)
+
+    def test_smote_samples_index_only_their_rows(self):
+        try:
+            import sklearn.tree  # noqa: F401  (imported once here, inherited by forked workers)
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        X, y = labelled(10000, 0.1, seed=1)
+        solution = {"candidate": {"estimator": "DecisionTreeClassifier", "params": {"max_depth": 1},
+                                  "resample": "smote"}}
+        arbiter = Arbiter(validation_threshold=0.9,
+                          executor=CandidateExecutor(max_workers=4, timeout=60), cv_folds=4,
+                          progressive_fraction=0.05, progressive_min_rows=800)
+        with mock.patch.object(executor, "shared_neighbor_table",
+                               wraps=executor.shared_neighbor_table) as build:
+            arbiter.cross_validate([solution], X, y)
+
+        sizes = [len(call.args[1]) for call in build.call_args_list]
+        self.assertEqual(solution["cross_validation"]["status"], "ok")
+        self.assertGreater(len(sizes), 1)  # the borderline stump escalated
+        self.assertEqual(sizes[0], 800)
+        # Only a final step over every row indexes the whole dataset
+        self.assertNotIn(len(y), sizes[:-1])
+        self.assertEqual(sizes, sorted(sizes))
+
+if __name__ == "__main__":
+    unittest.main()
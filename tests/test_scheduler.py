@@ -0,0 +1,122 @@
+# tests/test_scheduler.py
+import asyncio
+import threading
+import time
+import unittest
+import numpy as np
+from src.core import SRDFFramework
+from src.scheduler import CycleScheduler
+
+class TestCycleScheduler(unittest.TestCase):
+    def test_interval_and_manual_triggers(self):
+        scheduler = CycleScheduler(interval=0.05, debounce=0.0)
+        
+        async def cycle(number, reasons):
+            if number == 0:
+                scheduler.trigger("manual")
+            return reasons
+        
+        results = asyncio.run(scheduler.run(cycle, max_cycles=3))
+        
+        self.assertEqual(results, [["start"], ["manual"], ["interval"]])
+        self.assertEqual(scheduler.trigger_counts["manual"], 1)
+    
+    def test_triggers_within_debounce_are_coalesced(self):
+        scheduler = CycleScheduler(interval=None, debounce=0.1)
+        
+        async def cycle(number, reasons):
+            if number == 0:
+                for reason in ("drift", "metric", "drift"):
+                    scheduler.trigger(reason)
+            return reasons
+        
+        started = time.monotonic()
+        results = asyncio.run(scheduler.run(cycle, max_cycles=2))
+        
+        self.assertEqual(results, [["start"], ["drift", "metric"]])
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+    
+    def test_stop_interrupts_long_wait(self):
+        scheduler = CycleScheduler(interval=3600)
+        
+        async def cycle(number, reasons):
+            return number
+        
+        threading.Timer(0.1, scheduler.stop).start()
+        started = time.monotonic()
+        results = asyncio.run(scheduler.run(cycle, max_cycles=10))
+        
+        self.assertEqual(results, [0])
+        self.assertLess(time.monotonic() - started, 2.0)
+    
+    def test_stop_before_run_is_kept_until_reset(self):
+        scheduler = CycleScheduler(interval=3600)
+        
+        async def cycle(number, reasons):
+            return number
+        
+        scheduler.stop()
+        self.assertEqual(asyncio.run(scheduler.run(cycle, max_cycles=3)), [])
+        self.assertTrue(scheduler.stopped)
+        
+        scheduler.reset()
+        scheduler.interval = 0.0
+        self.assertEqual(asyncio.run(scheduler.run(cycle, max_cycles=3)), [0, 1, 2])
+
+class TestFrameworkScheduling(unittest.TestCase):
+    def test_stop_evolution_does_not_wait_for_interval(self):
+        try:
+            from sklearn.tree import DecisionTreeClassifier
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+        
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 3))
+        y = (X[:, 0] > 0).astype(int)
+        model = DecisionTreeClassifier(max_depth=1).fit(X, y)
+        framework = SRDFFramework()
+        framework.load_config({"max_cycles": 5, "evaluate_candidates": False})
+        
+        def stop_after_first_cycle():
+            while framework.cycle_count == 0:
+                time.sleep(0.01)
+            framework.stop_evolution()
+        
+        threading.Thread(target=stop_after_first_cycle, daemon=True).start()
+        started = time.monotonic()
+        results = framework.start_evolution(model, X, y)
+        
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["triggers"], ["start"])
+        self.assertLess(time.monotonic() - started, 10.0)
+        self.assertFalse(framework.is_running)
+    
+    def test_blocking_entry_points_refuse_a_running_loop(self):
+        framework = SRDFFramework()
+        
+        async def inside_loop():
+            for start in (framework.start_evolution, framework.start_fleet):
+                with self.assertRaisesRegex(RuntimeError, "await framework.run_"):
+                    start()
+        
+        asyncio.run(inside_loop())
+    
+    def test_interrupted_phase_finishes_before_return(self):
+        framework = SRDFFramework()
+        framework.load_config({"max_cycles": 5, "evaluate_candidates": False})
+        phase_done = threading.Event()
+        
+        def slow_analysis(cycle, model, data, labels):
+            time.sleep(0.3)
+            cycle["analysis_results"] = {}
+            phase_done.set()
+        
+        framework._analyze = slow_analysis
+        threading.Timer(0.1, framework.stop_evolution).start()
+        results = framework.start_evolution(None, None, None)
+        
+        self.assertEqual(results, [])
+        self.assertTrue(phase_done.is_set())  # not still running in the background
+
+if __name__ == "__main__":
+    unittest.main()
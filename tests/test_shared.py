@@ -0,0 +1,36 @@
+# tests/test_shared.py
+import os
+import pickle
+import unittest
+import numpy as np
+from src.executor import CandidateExecutor
+from src.shared import SharedDataset
+
+def sum_rows(handle, start, stop):
+    view = handle.open()[start:stop]
+    return float(view.sum()), isinstance(view, np.memmap)
+
+class TestSharedDataset(unittest.TestCase):
+    def test_reordered_copy_and_cleanup(self):
+        X = np.arange(12, dtype=np.float32).reshape(6, 2)
+        order = np.array([5, 4, 3, 2, 1, 0])
+        
+        with SharedDataset({"X": X}, order=order) as shared:
+            handle = shared.handles["X"]
+            np.testing.assert_array_equal(handle.open(), X[::-1])
+            self.assertLess(len(pickle.dumps(handle)), 200)
+            path = handle.path
+        
+        self.assertFalse(os.path.exists(path))
+    
+    def test_workers_read_views(self):
+        X = np.ones((1000, 4))
+        
+        with SharedDataset({"X": X}) as shared:
+            tasks = [(sum_rows, (shared.handles["X"], i * 500, (i + 1) * 500)) for i in range(2)]
+            results = CandidateExecutor(max_workers=2, timeout=30).run(tasks)
+        
+        self.assertEqual([r["result"] for r in results], [(2000.0, True), (2000.0, True)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/test_streaming.py
+import time
+import unittest
+import numpy as np
+from src.streaming import SlidingWindowMetrics
+from src.trawler import Trawler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+class TestSlidingWindowMetrics(unittest.TestCase):
+    def test_sample_window_trims_oldest_rows(self):
+        window = SlidingWindowMetrics(max_samples=5)
+        window.add([0, 0, 0, 0], [1, 1, 1, 1])
+        window.add([1, 1, 1], [1, 1, 1])
+        
+        metrics = window.metrics()
+        
+        self.assertEqual(metrics["window_samples"], 5)
+        self.assertAlmostEqual(metrics["accuracy"], 3 / 5)
+    
+    def test_time_window_expires_batches(self):
+        clock = FakeClock()
+        window = SlidingWindowMetrics(max_seconds=60, clock=clock)
+        window.add([0, 0], [1, 1], latency=0.2)
+        clock.now = 30
+        window.add([1, 1], [1, 1], latency=0.1)
+        clock.now = 75
+        
+        metrics = window.metrics()
+        
+        self.assertEqual(metrics["window_samples"], 2)
+        self.assertEqual(metrics["accuracy"], 1.0)
+        self.assertAlmostEqual(metrics["mean_batch_latency"], 0.1)
+        self.assertAlmostEqual(metrics["mean_row_latency"], 0.05)
+    
+    def test_trimmed_rows_take_their_share_of_latency(self):
+        window = SlidingWindowMetrics(max_samples=6)
+        window.add([0] * 4, [0] * 4, latency=0.4)
+        window.add([1] * 4, [1] * 4, latency=0.2)
+        
+        metrics = window.metrics()
+        
+        self.assertAlmostEqual(metrics["mean_row_latency"], (0.2 + 0.2) / 6)
+
+class TestStreamingTrawler(unittest.TestCase):
+    def test_observe_only_predicts_new_rows(self):
+        class CountingModel:
+            rows = 0
+            
+            def predict(self, data):
+                self.rows += len(data)
+                return np.zeros(len(data), dtype=int)
+        
+        model = CountingModel()
+        trawler = Trawler(window_size=100)
+        trawler.observe(model, np.zeros((80, 2)), np.zeros(80, dtype=int))
+        trawler.observe(model, np.zeros((40, 2)), np.ones(40, dtype=int))
+        
+        result = trawler.analyze_window(model)
+        
+        self.assertEqual(model.rows, 120)
+        self.assertAlmostEqual(result["performance_metrics"]["accuracy"], 0.6)
+        self.assertIn("Low accuracy - needs improvement", result["identified_issues"])
+    
+    def test_window_latency_is_compared_per_row(self):
+        class SlowBatches:
+            def predict(self, data):
+                time.sleep(0.02)
+                return np.zeros(len(data), dtype=int)
+        
+        model = SlowBatches()
+        trawler = Trawler(window_size=1000, latency_threshold=0.01)
+        trawler.observe(model, np.zeros((400, 2)), np.zeros(400, dtype=int))
+        
+        metrics = trawler.analyze_window(model)["performance_metrics"]
+        
+        self.assertGreater(metrics["mean_batch_latency"], 0.01)
+        self.assertLess(metrics["inference_time"], 0.01)
+        self.assertEqual(metrics["inference_time"], metrics["mean_row_latency"])
+
+if __name__ == "__main__":
+    unittest.main()
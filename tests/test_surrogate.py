@@ -0,0 +1,83 @@
+# tests/test_surrogate.py
+import unittest
+import numpy as np
+from src.arbiter import Arbiter
+from src.surrogate import SurrogateModel, measured_score
+
+PERFORMANCE = {"accuracy": 0.8, "precision": 0.8, "recall": 0.7, "f1_score": 0.75, "inference_time": 0.01}
+
+def evaluated(template, solution_type, accuracy):
+    return {
+        "proposed_solution": template,
+        "solution_type": solution_type,
+        "complexity": "medium",
+        "evaluation": {"status": "ok", "result": {"accuracy": accuracy}}
+    }
+
+def proposal(template, solution_type):
+    return {"proposed_solution": template, "solution_type": solution_type, "complexity": "medium"}
+
+class TestSurrogate(unittest.TestCase):
+    def setUp(self):
+        self.history = [evaluated("Ensemble methods", "accuracy", 0.90 + 0.002 * (i % 5)) for i in range(10)]
+        self.history += [evaluated("Feature pruning", "speed", 0.60 + 0.002 * (i % 5)) for i in range(10)]
+    
+    def test_unfitted_until_min_samples(self):
+        surrogate = SurrogateModel(min_samples=10)
+        surrogate.fit([(s, PERFORMANCE, measured_score(s)) for s in self.history[:5]])
+        self.assertFalse(surrogate.is_fitted)
+        self.assertEqual(surrogate.predict([proposal("Ensemble methods", "accuracy")], PERFORMANCE), (None, None))
+    
+    def test_predicts_template_scores(self):
+        surrogate = SurrogateModel().fit([(s, PERFORMANCE, measured_score(s)) for s in self.history])
+        means, stds = surrogate.predict(
+            [proposal("Ensemble methods", "accuracy"), proposal("Feature pruning", "speed")], PERFORMANCE
+        )
+        self.assertAlmostEqual(means[0], 0.904, delta=0.02)
+        self.assertAlmostEqual(means[1], 0.604, delta=0.02)
+        self.assertTrue((stds > 0).all())
+    
+    def test_incremental_updates_match_a_batch_fit(self):
+        observations = [(s, PERFORMANCE, measured_score(s)) for s in self.history]
+        observations.append((evaluated("Quantization", "speed", 0.7), {**PERFORMANCE, "accuracy": 0.7}, 0.7))
+        batch = SurrogateModel().fit(observations)
+        incremental = SurrogateModel().fit(observations[:12])
+        for observation in observations[12:]:
+            incremental.update([observation])
+        
+        candidates = [proposal("Ensemble methods", "accuracy"), proposal("Quantization", "speed")]
+        for expected, actual in zip(batch.predict(candidates, PERFORMANCE), incremental.predict(candidates, PERFORMANCE)):
+            np.testing.assert_allclose(actual, expected)
+        self.assertEqual(incremental.templates, batch.templates)
+    
+    def test_arbiter_folds_only_new_rounds(self):
+        arbiter = Arbiter(history_size=2)
+        for solution in self.history:
+            arbiter.validate_solutions([solution], PERFORMANCE)
+            arbiter.prescreen([proposal("Ensemble methods", "accuracy")], PERFORMANCE)
+        
+        # Rounds evicted from the two-round history still count
+        self.assertEqual(arbiter.surrogate.n_samples, 20)
+        arbiter.validation_history.clear()
+        arbiter.validate_solutions(self.history[:1], PERFORMANCE)
+        arbiter.prescreen([proposal("Ensemble methods", "accuracy")], PERFORMANCE)
+        self.assertEqual(arbiter.surrogate.n_samples, 1)
+    
+    def test_arbiter_prescreen_skips_predicted_failures(self):
+        arbiter = Arbiter(validation_threshold=0.8)
+        candidates = [proposal("Ensemble methods", "accuracy"), proposal("Feature pruning", "speed")]
+        self.assertEqual(len(arbiter.prescreen(candidates, PERFORMANCE)), 2)
+        
+        arbiter.validate_solutions(self.history, PERFORMANCE)
+        kept = arbiter.prescreen(candidates, PERFORMANCE)
+        
+        self.assertEqual([s["proposed_solution"] for s in kept], ["Ensemble methods"])
+        self.assertEqual(candidates[1]["evaluation"]["status"], "skipped")
+        self.assertIn("predicted_score", candidates[1]["surrogate"])
+        
+        impact = arbiter.validate_solutions(candidates, PERFORMANCE)["validated_solutions"][0]["expected_impact"]
+        self.assertEqual(impact["source"], "surrogate")
+        self.assertAlmostEqual(impact["accuracy_improvement"], 0.104, delta=0.02)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# tests/test_telemetry.py
+import os
+import tempfile
+import threading
+import time
+import unittest
+import urllib.request
+import numpy as np
+from src.core import SRDFFramework
+from src.executor import CandidateExecutor
+from src.telemetry import Telemetry
+
+def nap(seconds=0.0):
+    time.sleep(seconds)
+    return seconds
+
+class TestTelemetry(unittest.TestCase):
+    def test_spans_nest_per_thread(self):
+        telemetry = Telemetry()
+        with telemetry.span("evaluate"):
+            with telemetry.span("fold", fold=1):
+                time.sleep(0.01)
+            executor = CandidateExecutor(max_workers=2, telemetry=telemetry)
+            executor.run([(nap, ()), (nap, ())])
+
+        stats = telemetry.span_stats()
+        self.assertEqual(stats["evaluate"]["count"], 1)
+        self.assertEqual(stats["evaluate/fold"]["count"], 1)
+        self.assertEqual(stats["evaluate/candidate"]["count"], 2)
+        self.assertGreaterEqual(stats["evaluate"]["seconds"], stats["evaluate/fold"]["seconds"])
+        self.assertEqual(telemetry.counter_value("candidate_tasks", status="ok"), 2)
+
+    def test_exposition_formats(self):
+        telemetry = Telemetry(buckets=(0.1, 1.0))
+        telemetry.record_span("cycle", 0.5)
+        telemetry.count("candidates_rejected", 2, reason='say "no"')
+        telemetry.gauge("queue_depth", 3)
+
+        text = telemetry.render("prometheus")
+        self.assertIn("# TYPE srdf_span_duration_seconds histogram", text)
+        self.assertIn('srdf_span_duration_seconds_bucket{span="cycle",le="0.1"} 0', text)
+        self.assertIn('srdf_span_duration_seconds_bucket{span="cycle",le="+Inf"} 1', text)
+        self.assertIn("# TYPE srdf_candidates_rejected_total counter", text)
+        self.assertIn('srdf_candidates_rejected_total{reason="say \\"no\\""} 2', text)
+        self.assertIn("srdf_queue_depth 3", text)
+        self.assertFalse(text.rstrip().endswith("# EOF"))
+
+        text = telemetry.render("openmetrics")
+        self.assertIn("# TYPE srdf_candidates_rejected counter", text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_http_endpoint_and_file(self):
+        telemetry = Telemetry()
+        telemetry.count("cycles")
+        telemetry.serve(port=0)
+        try:
+            url = f"http://127.0.0.1:{telemetry.server_port}/metrics"
+            with urllib.request.urlopen(url) as response:
+                self.assertIn("text/plain", response.headers["Content-Type"])
+                self.assertIn("srdf_cycles_total 1", response.read().decode())
+            request = urllib.request.Request(url, headers={"Accept": "application/openmetrics-text"})
+            with urllib.request.urlopen(request) as response:
+                self.assertTrue(response.read().decode().endswith("# EOF\n"))
+        finally:
+            telemetry.close()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "srdf.prom")
+            telemetry.write(path)
+            with open(path) as f:
+                self.assertIn("srdf_process_peak_rss_bytes", f.read())
+
+    def test_labelled_block_tags_this_thread_only(self):
+        telemetry = Telemetry()
+        with telemetry.labelled(model="a"):
+            with telemetry.span("analyze"):
+                telemetry.count("cycles")
+            other = threading.Thread(target=telemetry.count, args=("cycles",))
+            other.start()
+            other.join()
+        telemetry.count("cycles")
+
+        self.assertEqual(telemetry.counter_value("cycles", model="a"), 1)
+        self.assertEqual(telemetry.counter_value("cycles"), 2)
+        self.assertIn('srdf_span_duration_seconds_count{model="a",span="analyze"} 1', telemetry.render())
+        self.assertIn("srdf_process_peak_rss_bytes ", telemetry.render())
+
+    def test_overlapping_memory_spans_record_no_peak(self):
+        telemetry = Telemetry(trace_memory=True)
+        self.addCleanup(telemetry.close)
+
+        def inner():
+            with telemetry.span("validate", memory=True):
+                bytearray(1 << 20)
+
+        with telemetry.span("analyze", memory=True):
+            other = threading.Thread(target=inner)
+            other.start()
+            other.join()
+        self.assertNotIn("srdf_span_peak_traced_bytes", telemetry.render())
+
+        inner()
+        self.assertIn('srdf_span_peak_traced_bytes{span="validate"}', telemetry.render())
+        self.assertNotIn('srdf_span_peak_traced_bytes{span="analyze"}', telemetry.render())
+
+    def test_disabled_mode_records_nothing(self):
+        telemetry = Telemetry(enabled=False)
+        with telemetry.span("analyze", memory=True):
+            telemetry.count("cycles")
+        telemetry.record_span("cycle", 1.0)
+
+        self.assertEqual(telemetry.span_stats(), {})
+        self.assertEqual(telemetry.counter_value("cycles"), 0)
+        self.assertIs(telemetry.span("a"), telemetry.span("b"))  # shared no-op
+
+class TestCycleTelemetry(unittest.TestCase):
+    def test_cycle_records_phases_and_counters(self):
+        try:
+            from sklearn.tree import DecisionTreeClassifier
+        except ImportError:
+            self.skipTest("scikit-learn not installed")
+
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(400, 3))
+        y = (X[:, 0] > 0).astype(int)
+        y[:60] = 1 - y[:60]
+        model = DecisionTreeClassifier(max_depth=1).fit(X, y)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config = {
+                **SRDFFramework._default_config(),
+                "candidate_workers": 2, "cv_folds": 3, "deploy_solutions": False,
+                "telemetry_trace_memory": True, "metrics_path": os.path.join(tmp, "srdf.prom")
+            }
+            framework = SRDFFramework(config)
+            self.addCleanup(framework.telemetry.close)
+            cycle = framework._run_cycle(0, model, X, y)
+            with open(config["metrics_path"]) as f:
+                exported = f.read()
+
+        phases = ["analyze", "propose", "evaluate", "validate", "implement"]
+        self.assertEqual(list(cycle["phase_seconds"]), phases)
+        stats = framework.telemetry.span_stats()
+        for phase in phases:
+            self.assertEqual(stats[phase]["count"], 1)
+        self.assertEqual(stats["cycle"]["count"], 1)
+        self.assertIn("validate/candidate", stats)
+        self.assertIn('srdf_span_peak_traced_bytes{span="evaluate"}', exported)
+        self.assertIn("srdf_cycles_total 1", exported)
+        evaluated = framework.telemetry.counter_value("candidates_evaluated")
+        self.assertEqual(evaluated, sum(1 for s in cycle["proposed_solutions"] if s.get("cross_validation")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,18 @@ class TestTrawler(unittest.TestCase):
         self.assertIn("performance_metrics", result)
         self.assertIn("identified_issues", result)
         self.assertIn("recommendations", result)
+        self.assertEqual(result["performance_metrics"]["accuracy"], 0.5)
+        self.assertEqual(result["performance_metrics"]["recall"], 0.5)
+    
+    def test_empty_input_is_not_predicted(self):
+        class RejectingModel:
+            def predict(self, data):
+                raise AssertionError("predict called on empty input")
+        
+        for trawler in (self.trawler, Trawler(sample_fraction=0.1)):
+            metrics = trawler.analyze_performance(RejectingModel(), [], [])["performance_metrics"]
+            self.assertEqual(metrics["n_samples"], 0)
+            self.assertEqual(metrics["accuracy"], 0.0)
     
     def test_analysis_history(self):
         self.assertEqual(len(self.trawler.get_analysis_history()), 0)